@@ -0,0 +1,405 @@
+import argparse
+import csv
+import re
+import sqlite3
+import threading
+import time
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from clien_post import DISPLAY_TIME_FORMAT, TIMESTAMP_FORMAT, Post, parse_post_id
+from clien_tokens import analyze_token, calculate_title_frequencies
+
+# data/ 폴더에 저장되는 게시물 아카이브 파일명
+POST_ARCHIVE_DB_NAME = "posts.sqlite3"
+UPSERT_BATCH_SIZE = 500
+# 기존 결과 CSV 파일명 예: clien_yesterday_posts_251027.csv, clien_today_posts_251027.csv
+POSTS_CSV_PATTERN = re.compile(r"clien_(?:today|yesterday)_posts_(\d{6})\.csv$")
+# posted_at에 담긴 시각의 정밀도: 시각 없음(자정으로 기록), 분 단위(CSV의 HH:MM), 초 단위(목록 페이지)
+POSTED_AT_DAY, POSTED_AT_MINUTE, POSTED_AT_SECOND = 0, 1, 2
+
+
+def _row_to_post(row: tuple) -> Post:
+    post_id, posted_at, recommendations, views, author, title, url = row
+    return Post(
+        post_id,
+        datetime.strptime(posted_at, TIMESTAMP_FORMAT),
+        recommendations,
+        views,
+        author,
+        title,
+        url,
+    )
+
+
+class PostArchive:
+    """
+    SQLite archive of list-page posts keyed by post ID, shared by all scrapers.
+    """
+
+    def __init__(self, db_path: Path) -> None:
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.db_path), timeout=30, check_same_thread=False)
+        with self._conn:
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS posts (
+                    post_id INTEGER PRIMARY KEY,
+                    posted_at TEXT NOT NULL,
+                    recommendations INTEGER NOT NULL,
+                    views INTEGER NOT NULL,
+                    author TEXT NOT NULL,
+                    title TEXT NOT NULL,
+                    url TEXT NOT NULL,
+                    updated_at REAL NOT NULL,
+                    posted_at_precision INTEGER NOT NULL DEFAULT 2
+                )
+                """
+            )
+            # 기간/작성자/추천수 기준 조회용 인덱스
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_posts_posted_at ON posts (posted_at)")
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_posts_author ON posts (author)")
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_posts_recommendations ON posts (recommendations)"
+            )
+            # 제목 토큰 -> 게시물 ID 역색인
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS title_tokens (
+                    token TEXT NOT NULL,
+                    post_id INTEGER NOT NULL,
+                    PRIMARY KEY (token, post_id)
+                ) WITHOUT ROWID
+                """
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_title_tokens_post_id ON title_tokens (post_id)"
+            )
+            # 날짜별 토큰 게시물 수/색인된 게시물 수 집계(기간별 추세 계산용)
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS title_token_days (
+                    day TEXT NOT NULL,
+                    token TEXT NOT NULL,
+                    posts INTEGER NOT NULL,
+                    PRIMARY KEY (day, token)
+                ) WITHOUT ROWID
+                """
+            )
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS title_index_days (day TEXT PRIMARY KEY, posts INTEGER NOT NULL)"
+            )
+            # 집계 테이블이 생기기 전에 만든 색인이 있으면 한 번 채움
+            if self._conn.execute("SELECT 1 FROM title_token_days LIMIT 1").fetchone() is None:
+                days = [
+                    row[0]
+                    for row in self._conn.execute(
+                        "SELECT DISTINCT substr(posted_at, 1, 10) FROM posts "
+                        "WHERE post_id IN (SELECT post_id FROM title_tokens)"
+                    )
+                ]
+                self._refresh_token_days(days)
+
+    def upsert(self, posts: Iterable[Post], precision: int = POSTED_AT_SECOND) -> int:
+        """
+        Insert or update posts in one transaction; returns the number written.
+
+        Posts without an ID are skipped. Recommendation/view counts only grow,
+        so re-importing an older snapshot never lowers them. precision says
+        how much of posted_at is real (POSTED_AT_DAY for a missing time
+        recorded as midnight, POSTED_AT_MINUTE for a CSV's HH:MM); an existing
+        posted_at is only replaced by a more precise one, so a CSV import
+        never overwrites a scraped timestamp and a later scrape or CSV fills
+        in a time that was missing.
+        """
+        now = time.time()
+        rows = [
+            (
+                post.post_id,
+                post.posted_at.strftime(TIMESTAMP_FORMAT),
+                post.recommendations,
+                post.views,
+                post.author,
+                post.title,
+                post.url,
+                now,
+                precision,
+            )
+            for post in posts
+            if post.post_id is not None
+        ]
+        if not rows:
+            return 0
+
+        with self._lock, self._conn:
+            self._conn.executemany(
+                """
+                INSERT INTO posts
+                    (post_id, posted_at, recommendations, views, author, title, url, updated_at,
+                     posted_at_precision)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(post_id) DO UPDATE SET
+                    posted_at = CASE
+                        WHEN excluded.posted_at_precision > posted_at_precision THEN excluded.posted_at
+                        ELSE posted_at
+                    END,
+                    posted_at_precision = MAX(posted_at_precision, excluded.posted_at_precision),
+                    recommendations = MAX(recommendations, excluded.recommendations),
+                    views = MAX(views, excluded.views),
+                    author = excluded.author,
+                    title = excluded.title,
+                    url = excluded.url,
+                    updated_at = excluded.updated_at
+                """,
+                rows,
+            )
+        return len(rows)
+
+    def record(self, posts: Iterable[Post], batch_size: int = UPSERT_BATCH_SIZE) -> Iterator[Post]:
+        """
+        Upsert posts in batches as they pass through, then yield them on.
+        """
+        batch: List[Post] = []
+        for post in posts:
+            batch.append(post)
+            if len(batch) >= batch_size:
+                self.upsert(batch)
+                batch = []
+            yield post
+        self.upsert(batch)
+
+    def posts_between(self, start: datetime, end: datetime) -> Iterator[Post]:
+        """
+        Yield archived posts with start <= posted_at < end, newest first.
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT post_id, posted_at, recommendations, views, author, title, url "
+                "FROM posts WHERE posted_at >= ? AND posted_at < ? ORDER BY posted_at DESC, post_id DESC",
+                (start.strftime(TIMESTAMP_FORMAT), end.strftime(TIMESTAMP_FORMAT)),
+            ).fetchall()
+
+        for row in rows:
+            yield _row_to_post(row)
+
+    def index_titles(self, title_index: Dict[str, Set[int]]) -> None:
+        """
+        Persist a token -> post IDs index built by calculate_title_frequencies.
+
+        The indexed posts' previous tokens are replaced, so edited titles do
+        not leave stale entries.
+        """
+        post_ids = sorted({post_id for ids in title_index.values() for post_id in ids})
+        rows = [(token, post_id) for token, ids in title_index.items() for post_id in ids]
+        days: Set[str] = set()
+        with self._lock, self._conn:
+            # SQLite 바인딩 변수 개수 제한을 고려해 나눠서 삭제
+            for start in range(0, len(post_ids), 500):
+                chunk = post_ids[start:start + 500]
+                placeholders = ", ".join("?" for _ in chunk)
+                days.update(
+                    row[0]
+                    for row in self._conn.execute(
+                        f"SELECT DISTINCT substr(posted_at, 1, 10) FROM posts WHERE post_id IN ({placeholders})",
+                        chunk,
+                    )
+                )
+                self._conn.execute(
+                    f"DELETE FROM title_tokens WHERE post_id IN ({placeholders})", chunk
+                )
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO title_tokens (token, post_id) VALUES (?, ?)", rows
+            )
+            self._refresh_token_days(sorted(days))
+
+    def _refresh_token_days(self, days: Iterable[str]) -> None:
+        # 색인이 바뀐 날짜(YYYY-MM-DD)의 집계만 다시 계산; 호출하는 쪽의 트랜잭션 안에서 실행
+        for day in days:
+            start = f"{day} 00:00:00"
+            end = (date.fromisoformat(day) + timedelta(days=1)).strftime(TIMESTAMP_FORMAT)
+            self._conn.execute("DELETE FROM title_token_days WHERE day = ?", (day,))
+            self._conn.execute(
+                "INSERT INTO title_token_days (day, token, posts) "
+                "SELECT ?, t.token, COUNT(*) FROM posts p JOIN title_tokens t ON t.post_id = p.post_id "
+                "WHERE p.posted_at >= ? AND p.posted_at < ? GROUP BY t.token",
+                (day, start, end),
+            )
+            self._conn.execute(
+                "INSERT OR REPLACE INTO title_index_days (day, posts) "
+                "SELECT ?, COUNT(DISTINCT t.post_id) FROM posts p JOIN title_tokens t ON t.post_id = p.post_id "
+                "WHERE p.posted_at >= ? AND p.posted_at < ?",
+                (day, start, end),
+            )
+
+    def posts_with_token(
+        self, token: str, start: Optional[datetime] = None, end: Optional[datetime] = None
+    ) -> Iterator[Post]:
+        """
+        Yield archived posts whose title contains token (optionally start <= posted_at < end), newest first.
+        """
+        start_text = start.strftime(TIMESTAMP_FORMAT) if start else ""
+        end_text = end.strftime(TIMESTAMP_FORMAT) if end else "9999"
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT p.post_id, p.posted_at, p.recommendations, p.views, p.author, p.title, p.url "
+                "FROM title_tokens t JOIN posts p ON p.post_id = t.post_id "
+                "WHERE t.token = ? AND p.posted_at >= ? AND p.posted_at < ? "
+                "ORDER BY p.posted_at DESC, p.post_id DESC",
+                (token.lower(), start_text, end_text),
+            ).fetchall()
+
+        for row in rows:
+            yield _row_to_post(row)
+
+    def token_day_counts(
+        self,
+        start_date: date,
+        end_date: date,
+        active_on: Optional[date] = None,
+        min_posts: int = 1,
+    ) -> List[Tuple[str, str, int]]:
+        """
+        Return (token, YYYY-MM-DD, posts containing the token) from start_date through end_date.
+
+        With active_on, only tokens found in at least min_posts posts on that
+        day are returned (e.g. candidates for that day's rising keywords).
+        """
+        query = "SELECT token, day, posts FROM title_token_days WHERE day >= ? AND day <= ?"
+        params: List[object] = [start_date.isoformat(), end_date.isoformat()]
+        if active_on is not None:
+            query += " AND token IN (SELECT token FROM title_token_days WHERE day = ? AND posts >= ?)"
+            params += [active_on.isoformat(), min_posts]
+        with self._lock:
+            return self._conn.execute(query, params).fetchall()
+
+    def day_post_counts(self, start_date: date, end_date: date) -> Dict[str, int]:
+        """
+        Return the number of indexed posts per YYYY-MM-DD from start_date through end_date.
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT day, posts FROM title_index_days WHERE day >= ? AND day <= ?",
+                (start_date.isoformat(), end_date.isoformat()),
+            ).fetchall()
+        return dict(rows)
+
+    def count(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM posts").fetchone()[0]
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+def read_posts_csv(csv_path: Path, post_date: date) -> Iterator[Post]:
+    """
+    Read a saved posts CSV (Rec, Views, Author, Time, Title, URL) as Post records.
+
+    The CSV only keeps HH:MM, so posted_at is built from post_date and that time.
+    """
+    with Path(csv_path).open("r", encoding="utf-8-sig", newline="") as csv_file:
+        for row in csv.DictReader(csv_file):
+            try:
+                posted_time = datetime.strptime(row["Time"], DISPLAY_TIME_FORMAT).time()
+            except ValueError:
+                # 예전 CSV의 Time 열이 HH:MM 형식이 아닌 경우 자정으로 기록
+                posted_time = datetime.min.time()
+            yield Post(
+                post_id=parse_post_id(row["URL"]),
+                posted_at=datetime.combine(post_date, posted_time),
+                recommendations=int(row["Rec"] or 0),
+                views=int(row["Views"] or 0),
+                author=row["Author"],
+                title=row["Title"],
+                url=row["URL"],
+            )
+
+
+def import_posts_csv_files(
+    archive: PostArchive,
+    csv_paths: Iterable[Path],
+    build_title_index: Optional[Callable[[List[Post]], Dict[str, Set[int]]]] = None,
+) -> int:
+    """
+    Import existing data/clien_*_posts_{YYMMDD}.csv files into the archive.
+
+    Files whose name does not carry a date are skipped. With
+    build_title_index, each file's titles are also added to the token index.
+    Returns the number of posts written.
+    """
+    imported = 0
+    for csv_path in sorted(Path(path) for path in csv_paths):
+        match = POSTS_CSV_PATTERN.search(csv_path.name)
+        if not match:
+            print(f"Skipping {csv_path}: no date in the file name.")
+            continue
+
+        post_date = datetime.strptime(match.group(1), "%y%m%d").date()
+        posts = list(read_posts_csv(csv_path, post_date))
+        # 시각을 읽지 못해 자정으로 기록한 게시물은 실제 시각이 들어오면 바뀌도록 따로 저장
+        timed = [post for post in posts if post.posted_at.time() != datetime.min.time()]
+        untimed = [post for post in posts if post.posted_at.time() == datetime.min.time()]
+        count = archive.upsert(timed, POSTED_AT_MINUTE) + archive.upsert(untimed, POSTED_AT_DAY)
+        if build_title_index is not None:
+            archive.index_titles(build_title_index(posts))
+        print(f"Imported {count} posts from {csv_path}.")
+        imported += count
+    return imported
+
+
+def _build_title_index(posts: List[Post]) -> Dict[str, Set[int]]:
+    title_index: Dict[str, Set[int]] = {}
+    calculate_title_frequencies(posts, title_index=title_index)
+    return title_index
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="기존 게시물 CSV 파일을 SQLite 아카이브로 가져오거나 제목 키워드로 게시물을 검색합니다."
+    )
+    parser.add_argument(
+        "csv_files",
+        nargs="*",
+        type=Path,
+        help="가져올 CSV 파일. 생략하면 data/ 폴더의 clien_*_posts_*.csv 파일 전체",
+    )
+    parser.add_argument(
+        "--db",
+        type=Path,
+        help=f"아카이브 파일 경로. 기본값: data/{POST_ARCHIVE_DB_NAME}",
+        default=Path(__file__).parent / "data" / POST_ARCHIVE_DB_NAME,
+    )
+    parser.add_argument(
+        "--search",
+        type=str,
+        help="제목에 이 키워드(토큰)가 들어간 게시물을 아카이브에서 찾습니다.",
+    )
+    parser.add_argument(
+        "--days",
+        type=int,
+        help="--search 시 최근 며칠 동안의 게시물만 찾을지. 기본값: 7",
+        default=7,
+    )
+    args = parser.parse_args()
+
+    archive = PostArchive(args.db)
+    try:
+        if args.search:
+            since = datetime.combine(date.today() - timedelta(days=args.days - 1), datetime.min.time())
+            found = 0
+            # 색인과 같은 방식으로 정규화("이재명이" -> "이재명")
+            for post in archive.posts_with_token(analyze_token(args.search), start=since):
+                found += 1
+                print(f"{post.timestamp} / Rec {post.recommendations} / Views {post.views} / {post.title} / {post.url}")
+            print(f"Found {found} posts containing '{args.search}' since {since.strftime('%Y-%m-%d')}.")
+        else:
+            csv_files = args.csv_files or sorted((Path(__file__).parent / "data").glob("clien_*_posts_*.csv"))
+            total = import_posts_csv_files(archive, csv_files, build_title_index=_build_title_index)
+            print(f"Imported {total} posts in total ({archive.count()} posts in {args.db}).")
+    finally:
+        archive.close()
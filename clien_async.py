@@ -0,0 +1,161 @@
+import asyncio
+import queue
+import threading
+from datetime import date
+from typing import AsyncIterator, Callable, Dict, Iterator, List, Optional, TypeVar
+
+from clien_post import Post
+from clien_stream import fetch_list_page
+
+T = TypeVar("T")
+
+# 목록 페이지 동시 요청 상한
+LIST_PAGE_CONCURRENCY = 4
+# 이벤트 루프 스레드가 게시물을 다 넘겼음을 알리는 표시
+_DONE = object()
+
+
+async def _run_bounded(semaphore: asyncio.Semaphore, func: Callable[..., T], *args) -> T:
+    # 블로킹 HTTP 호출은 스레드에서 실행하고, 세마포어로 동시 실행 수를 제한
+    async with semaphore:
+        return await asyncio.to_thread(func, *args)
+
+
+async def iter_posts_for_date_async(
+    target_date: date,
+    start_page: int = 0,
+    concurrency: int = LIST_PAGE_CONCURRENCY,
+    window: Optional[int] = None,
+    cache_ttl: Optional[float] = None,
+    semaphore: Optional[asyncio.Semaphore] = None,
+) -> AsyncIterator[Post]:
+    """
+    Yield posts for target_date in board order while list pages are fetched as concurrent tasks.
+
+    Up to `window` pages ahead run at once (bounded by the semaphore); once a
+    page shows posts older than target_date, tasks for later pages are
+    cancelled and no new ones are created. Each page's posts are yielded as
+    soon as the page and the ones before it have arrived, and closing the
+    iterator early cancels the remaining page tasks.
+    """
+    semaphore = semaphore or asyncio.Semaphore(max(1, concurrency))
+    window = window or max(1, concurrency)
+    tasks: Dict[int, asyncio.Task] = {}
+    # 대상일보다 오래된 게시물(또는 빈/실패 페이지)이 처음 확인된 페이지 번호
+    stop_page: List[Optional[int]] = [None]
+
+    def on_page_done(page: int, task: asyncio.Task) -> None:
+        if task.cancelled() or task.exception() is not None:
+            return
+        rows = task.result()
+        if rows and all(post_datetime.date() >= target_date for post_datetime, _ in rows):
+            return
+        if stop_page[0] is None or page < stop_page[0]:
+            stop_page[0] = page
+            # 날짜 경계가 확인되면 그 뒤 페이지 작업은 즉시 취소
+            for later_page, later_task in tasks.items():
+                if later_page > page:
+                    later_task.cancel()
+
+    def spawn(page: int) -> None:
+        task = asyncio.ensure_future(
+            _run_bounded(semaphore, fetch_list_page, page, cache_ttl)
+        )
+        task.add_done_callback(lambda t, page=page: on_page_done(page, t))
+        tasks[page] = task
+
+    page_num = start_page
+    next_page = start_page
+    try:
+        while True:
+            while next_page < page_num + window and (stop_page[0] is None or next_page <= stop_page[0]):
+                spawn(next_page)
+                next_page += 1
+
+            rows = await tasks.pop(page_num)
+            if not rows:
+                break
+
+            reached_older = False
+            for post_datetime, post in rows:
+                post_date = post_datetime.date()
+                if post_date < target_date:
+                    reached_older = True
+                    break
+                if post_date == target_date:
+                    yield post
+
+            if reached_older:
+                print(f"Found posts older than {target_date.strftime('%Y-%m-%d')} on page {page_num}. Stopping.")
+                break
+
+            page_num += 1
+    finally:
+        for task in tasks.values():
+            task.cancel()
+        await asyncio.gather(*tasks.values(), return_exceptions=True)
+
+
+async def scrape_posts_for_date_async(target_date: date, **kwargs) -> List[Post]:
+    """
+    Collect iter_posts_for_date_async into a list.
+    """
+    return [post async for post in iter_posts_for_date_async(target_date, **kwargs)]
+
+
+def iter_posts_for_date(target_date: date, **kwargs) -> Iterator[Post]:
+    """
+    Synchronous, streaming wrapper around iter_posts_for_date_async.
+
+    The event loop runs on a background thread and hands each post over as
+    soon as it is yielded, so callers can write posts out while later pages
+    are still being fetched. Closing the iterator early cancels the scan.
+    """
+    results: "queue.Queue[object]" = queue.Queue()
+    errors: List[BaseException] = []
+    loop = asyncio.new_event_loop()
+
+    async def produce() -> None:
+        async for post in iter_posts_for_date_async(target_date, **kwargs):
+            results.put(post)
+
+    task = loop.create_task(produce())
+
+    def run() -> None:
+        try:
+            loop.run_until_complete(task)
+        except BaseException as exc:
+            errors.append(exc)
+        finally:
+            # 취소된 뒤에도 아직 실행 중인 페이지 요청 스레드가 끝날 때까지 기다린 뒤 루프를 닫음
+            loop.run_until_complete(loop.shutdown_asyncgens())
+            loop.run_until_complete(loop.shutdown_default_executor())
+            loop.close()
+            results.put(_DONE)
+
+    thread = threading.Thread(target=run, daemon=True)
+    thread.start()
+    try:
+        while True:
+            item = results.get()
+            if item is _DONE:
+                break
+            yield item
+        if errors:
+            raise errors[0]
+    finally:
+        # 호출한 쪽이 중간에 그만 읽으면 남은 페이지 작업을 취소
+        if not task.done():
+            try:
+                loop.call_soon_threadsafe(task.cancel)
+            except RuntimeError:
+                # 그사이 루프가 이미 닫힌 경우
+                pass
+        thread.join()
+
+
+def scrape_posts_for_date(target_date: date, **kwargs) -> List[Post]:
+    """
+    Synchronous wrapper around scrape_posts_for_date_async.
+    """
+    return list(iter_posts_for_date(target_date, **kwargs))
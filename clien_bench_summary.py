@@ -0,0 +1,120 @@
+import argparse
+import tempfile
+import threading
+import time
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import List, Tuple
+
+from clien_issue import ISSUE_FETCH_WORKERS, save_issue_posts
+from clien_http import configure_http_client
+from clien_post import Post
+from clien_summary import (
+    SUMMARY_CHUNK_TOKENS,
+    PipelinedSummarizer,
+    StubSummaryModel,
+    map_reduce_summarize,
+)
+
+BENCH_KEYWORD = "벤치마크"
+
+
+def _start_post_server(fetch_delay: float, body_chars: int) -> ThreadingHTTPServer:
+    """
+    Serve /post/N pages whose body is body_chars of text, after fetch_delay seconds.
+    """
+    sentence = "클리앙 게시물 본문을 흉내 낸 문장입니다. "
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:
+            time.sleep(fetch_delay)
+            text = (f"{self.path} " + sentence * (body_chars // len(sentence) + 1))[:body_chars]
+            data = f"<html><body><p>{text}</p></body></html>".encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html; charset=utf-8")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def log_message(self, format: str, *args) -> None:
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def _single_run(
+    posts: List[Post], output_path: Path, model: StubSummaryModel, max_tokens: int
+) -> Tuple[float, str]:
+    # 기존 방식: 본문을 모두 받아 파일로 저장한 뒤 파일을 다시 읽어 요약
+    started = time.perf_counter()
+    save_issue_posts(BENCH_KEYWORD, posts, output_path, workers=ISSUE_FETCH_WORKERS)
+    summary = map_reduce_summarize(output_path.read_text(encoding="utf-8"), model, max_tokens)
+    return time.perf_counter() - started, summary
+
+
+def _pipelined_run(
+    posts: List[Post], output_path: Path, model: StubSummaryModel, max_tokens: int
+) -> Tuple[float, str]:
+    started = time.perf_counter()
+    summarizer = PipelinedSummarizer(model, f"Top keyword: {BENCH_KEYWORD}", max_tokens=max_tokens)
+    save_issue_posts(
+        BENCH_KEYWORD, posts, output_path, workers=ISSUE_FETCH_WORKERS, on_entry=summarizer.add
+    )
+    summary, error = summarizer.close()
+    if error:
+        raise SystemExit(error)
+    return time.perf_counter() - started, summary or ""
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="로컬 게시물 서버와 가짜 요약 모델로 이슈 요약(single vs pipelined) 소요 시간을 비교합니다."
+    )
+    parser.add_argument("--posts", type=int, help="이슈 게시물 수. 기본값: 40", default=40)
+    parser.add_argument("--body-chars", type=int, help="게시물 본문 길이(글자). 기본값: 2000", default=2000)
+    parser.add_argument("--fetch-delay", type=float, help="본문 요청 응답 지연(초). 기본값: 0.3", default=0.3)
+    parser.add_argument(
+        "--max-rps",
+        type=float,
+        help="초당 최대 요청 수(스크래퍼 기본값과 같게 유지). 기본값: 5",
+        default=5.0,
+    )
+    parser.add_argument("--model-delay", type=float, help="요약 호출마다 걸리는 기본 시간(초). 기본값: 2", default=2.0)
+    parser.add_argument(
+        "--model-delay-per-kchar",
+        type=float,
+        help="입력 1000자당 추가로 걸리는 시간(초). 기본값: 0.05",
+        default=0.05,
+    )
+    parser.add_argument(
+        "--max-tokens",
+        type=int,
+        help=f"요약 호출 한 번의 프롬프트 상한(추정 토큰). 기본값: {SUMMARY_CHUNK_TOKENS}",
+        default=SUMMARY_CHUNK_TOKENS,
+    )
+    args = parser.parse_args()
+
+    server = _start_post_server(args.fetch_delay, args.body_chars)
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    configure_http_client(max_connections_per_host=ISSUE_FETCH_WORKERS, max_requests_per_second=args.max_rps)
+    posts = [
+        Post(index, datetime.now(), 0, 0, "bench", f"{BENCH_KEYWORD} {index}", f"{base_url}/post/{index}")
+        for index in range(1, args.posts + 1)
+    ]
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        output_path = Path(temp_dir) / "issue.txt"
+        single_model = StubSummaryModel(args.model_delay, args.model_delay_per_kchar)
+        single_time, _ = _single_run(posts, output_path, single_model, args.max_tokens)
+        pipelined_model = StubSummaryModel(args.model_delay, args.model_delay_per_kchar)
+        pipelined_time, summary = _pipelined_run(posts, output_path, pipelined_model, args.max_tokens)
+    server.shutdown()
+
+    print(f"{args.posts} posts x {args.body_chars} chars, fetch {args.fetch_delay}s, max {args.max_rps} req/s")
+    print(f"single (fetch, then summarize): {single_time:.2f} s, {len(single_model.calls)} model calls")
+    print(f"pipelined (summarize while fetching): {pipelined_time:.2f} s, {len(pipelined_model.calls)} model calls")
+    print(f"speedup: {single_time / pipelined_time:.2f}x")
+    print(f"final summary: {summary[:120]}")
@@ -0,0 +1,110 @@
+import argparse
+import re
+import time
+from collections import Counter
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, List, Tuple
+
+from clien_archive import POSTS_CSV_PATTERN, read_posts_csv
+from clien_post import Post
+from clien_tokens import STOP_WORDS, calculate_title_frequencies, normalize_token, set_title_analyzer, tokenize_posts
+
+
+def _legacy_tokenize_title(title: str) -> List[str]:
+    # 변경 전 방식: 호출할 때마다 re.findall로 정규식을 해석
+    tokens = re.findall(r"[\uAC00-\uD7A3A-Za-z0-9]+", title)
+    return [token.lower() for token in tokens if token]
+
+
+def _legacy_report(posts: List[Post]) -> Tuple[list, list, List[Post]]:
+    """
+    Frequencies, then a second tokenization pass for top-keyword matching.
+    """
+    word_counter: Counter = Counter()
+    bigram_counter: Counter = Counter()
+    for post in posts:
+        filtered_tokens = [token for token in _legacy_tokenize_title(post.title) if token not in STOP_WORDS]
+        if not filtered_tokens:
+            continue
+        word_counter.update(filtered_tokens)
+        if len(filtered_tokens) > 1:
+            bigram_counter.update(" ".join(pair) for pair in zip(filtered_tokens, filtered_tokens[1:]))
+    word_freq, bigram_freq = word_counter.most_common(20), bigram_counter.most_common(20)
+
+    matching_posts: List[Post] = []
+    if word_freq:
+        top_keyword = word_freq[0][0]
+        matching_posts = [post for post in posts if top_keyword in _legacy_tokenize_title(post.title)]
+    return word_freq, bigram_freq, matching_posts
+
+
+def _single_pass_report(posts: List[Post]) -> Tuple[list, list, List[Post]]:
+    """
+    Tokenize once per post; counts and matching read the cached tokens.
+    """
+    posts = list(tokenize_posts(posts))
+    word_freq, bigram_freq = calculate_title_frequencies(posts)
+
+    matching_posts: List[Post] = []
+    if word_freq:
+        top_keyword = word_freq[0][0]
+        matching_posts = [post for post in posts if top_keyword in post.tokens]
+    return word_freq, bigram_freq, matching_posts
+
+
+def _best_time(report: Callable[[List[Post]], tuple], days: List[List[Post]], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for posts in days:
+            report(posts)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="저장된 게시물 CSV로 제목 토큰화(기존 방식 vs 한 번만 토큰화) 성능을 비교합니다."
+    )
+    parser.add_argument(
+        "csv_files",
+        nargs="*",
+        type=Path,
+        help="사용할 CSV 파일. 생략하면 data/ 폴더의 clien_*_posts_*.csv 파일 전체",
+    )
+    parser.add_argument("--repeat", type=int, help="반복 측정 횟수(최솟값 사용). 기본값: 20", default=20)
+    args = parser.parse_args()
+
+    csv_files = args.csv_files or sorted((Path(__file__).parent / "data").glob("clien_*_posts_*.csv"))
+    days: List[List[Post]] = []
+    for csv_path in csv_files:
+        match = POSTS_CSV_PATTERN.search(csv_path.name)
+        if match:
+            post_date = datetime.strptime(match.group(1), "%y%m%d").date()
+            days.append(list(read_posts_csv(csv_path, post_date)))
+
+    if not days:
+        raise SystemExit("측정할 게시물 CSV 파일이 없습니다.")
+
+    # 두 방식의 결과가 같은지 먼저 확인(기존 방식과 같은 simple 분석기 기준)
+    set_title_analyzer("simple")
+    for posts in days:
+        legacy = _legacy_report(posts)
+        single = _single_pass_report(posts)
+        if legacy[:2] != single[:2] or [post.url for post in legacy[2]] != [post.url for post in single[2]]:
+            raise SystemExit("두 방식의 결과가 다릅니다.")
+
+    post_total = sum(len(posts) for posts in days)
+    legacy_time = _best_time(_legacy_report, days, args.repeat)
+    single_time = _best_time(_single_pass_report, days, args.repeat)
+    print(f"{len(days)} files, {post_total} posts, best of {args.repeat}")
+    print(f"legacy (tokenize per use): {legacy_time * 1000:.2f} ms")
+    print(f"single pass (cached tokens): {single_time * 1000:.2f} ms")
+    print(f"speedup: {legacy_time / single_time:.2f}x")
+
+    # 조사/어미 정규화(korean 분석기)의 추가 비용
+    set_title_analyzer("korean")
+    normalize_token.cache_clear()
+    korean_time = _best_time(_single_pass_report, days, args.repeat)
+    print(f"single pass, korean analyzer: {korean_time * 1000:.2f} ms ({normalize_token.cache_info()})")
@@ -0,0 +1,164 @@
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Optional
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+# 응답 캐시 기본값: 전체 크기 상한과 기본 유효 시간
+DEFAULT_CACHE_MAX_BYTES = 200 * 1024 * 1024
+DEFAULT_CACHE_TTL = 60 * 60 # seconds
+
+
+@dataclass
+class CachedResponse:
+    url: str
+    status_code: int
+    headers: Dict[str, str]
+    encoding: Optional[str]
+    content: bytes
+    stored_at: float
+
+    def is_fresh(self, ttl: float) -> bool:
+        return time.time() - self.stored_at < ttl
+
+    def validators(self) -> Dict[str, str]:
+        """
+        Build conditional request headers from the stored ETag/Last-Modified.
+        """
+        headers = CaseInsensitiveDict(self.headers)
+        conditional = {}
+        if headers.get("ETag"):
+            conditional["If-None-Match"] = headers["ETag"]
+        if headers.get("Last-Modified"):
+            conditional["If-Modified-Since"] = headers["Last-Modified"]
+        return conditional
+
+    def to_response(self) -> requests.Response:
+        response = requests.Response()
+        response.status_code = self.status_code
+        response.headers = CaseInsensitiveDict(self.headers)
+        response.encoding = self.encoding
+        response.url = self.url
+        response._content = self.content
+        return response
+
+
+class ResponseCache:
+    """
+    On-disk cache of GET responses keyed by URL plus params, with TTLs and LRU eviction.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Path,
+        max_bytes: int = DEFAULT_CACHE_MAX_BYTES,
+        default_ttl: float = DEFAULT_CACHE_TTL,
+    ) -> None:
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self.default_ttl = default_ttl
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            str(self.cache_dir / "responses.sqlite3"), timeout=30, check_same_thread=False
+        )
+        with self._conn:
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS responses (
+                    key TEXT PRIMARY KEY,
+                    url TEXT NOT NULL,
+                    status_code INTEGER NOT NULL,
+                    headers TEXT NOT NULL,
+                    encoding TEXT,
+                    content BLOB NOT NULL,
+                    size INTEGER NOT NULL,
+                    stored_at REAL NOT NULL,
+                    accessed_at REAL NOT NULL
+                )
+                """
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_responses_accessed_at ON responses (accessed_at)"
+            )
+
+    @staticmethod
+    def make_key(url: str, params: Optional[dict] = None) -> str:
+        # requests와 동일한 방식으로 쿼리 문자열을 붙여 같은 요청이 같은 키를 갖도록 함
+        prepared = requests.Request("GET", url, params=params).prepare()
+        return hashlib.sha256(prepared.url.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT url, status_code, headers, encoding, content, stored_at "
+                "FROM responses WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                return None
+            with self._conn:
+                self._conn.execute(
+                    "UPDATE responses SET accessed_at = ? WHERE key = ?", (time.time(), key)
+                )
+
+        url, status_code, headers, encoding, content, stored_at = row
+        return CachedResponse(url, status_code, json.loads(headers), encoding, content, stored_at)
+
+    def put(self, key: str, response: requests.Response) -> None:
+        content = response.content
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses "
+                "(key, url, status_code, headers, encoding, content, size, stored_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    key,
+                    response.url,
+                    response.status_code,
+                    json.dumps(dict(response.headers)),
+                    response.encoding,
+                    content,
+                    len(content),
+                    now,
+                    now,
+                ),
+            )
+            self._evict()
+
+    def refresh(self, key: str) -> None:
+        """
+        Mark an entry as revalidated (e.g. after a 304 Not Modified).
+        """
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "UPDATE responses SET stored_at = ?, accessed_at = ? WHERE key = ?",
+                (now, now, key),
+            )
+
+    def _evict(self) -> None:
+        # 전체 크기가 상한을 넘으면 가장 오래 사용되지 않은 항목부터 삭제
+        total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+
+        for key, size in self._conn.execute(
+            "SELECT key, size FROM responses ORDER BY accessed_at"
+        ).fetchall():
+            self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+            total -= size
+            if total <= self.max_bytes:
+                break
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
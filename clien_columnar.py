@@ -0,0 +1,156 @@
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+try:
+    import pyarrow as pa
+except ImportError:
+    pa = None
+
+from clien_post import Post
+
+# Arrow IPC 파일은 압축 없이 저장해 메모리 매핑으로 복사 없이 읽을 수 있게 함
+POSTS_DATASET = "posts"
+TITLE_FREQUENCIES_DATASET = "title_frequencies"
+ARROW_BATCH_SIZE = 1024
+
+if pa is not None:
+    POSTS_SCHEMA = pa.schema(
+        [
+            ("post_id", pa.int64()),
+            ("posted_at", pa.timestamp("s")),
+            ("recommendations", pa.int32()),
+            ("views", pa.int32()),
+            ("author", pa.string()),
+            ("title", pa.string()),
+            ("url", pa.string()),
+        ]
+    )
+    TITLE_FREQUENCIES_SCHEMA = pa.schema(
+        [
+            ("type", pa.dictionary(pa.int8(), pa.string())),
+            ("token", pa.string()),
+            ("count", pa.int32()),
+        ]
+    )
+
+
+def columnar_available() -> bool:
+    return pa is not None
+
+
+def _partition_path(root: Path, dataset: str, partition_date: date) -> Path:
+    # 날짜별 하이브 파티션 경로: {root}/{dataset}/date=YYYY-MM-DD/{dataset}.arrow
+    return Path(root) / dataset / f"date={partition_date.isoformat()}" / f"{dataset}.arrow"
+
+
+def _posts_batch(posts: List[Post]) -> "pa.RecordBatch":
+    return pa.record_batch(
+        [
+            pa.array([post.post_id for post in posts], pa.int64()),
+            pa.array([post.posted_at for post in posts], pa.timestamp("s")),
+            pa.array([post.recommendations for post in posts], pa.int32()),
+            pa.array([post.views for post in posts], pa.int32()),
+            pa.array([post.author for post in posts], pa.string()),
+            pa.array([post.title for post in posts], pa.string()),
+            pa.array([post.url for post in posts], pa.string()),
+        ],
+        schema=POSTS_SCHEMA,
+    )
+
+
+def write_posts_arrow(
+    posts: Iterable[Post],
+    root: Path,
+    partition_date: date,
+    batch_size: int = ARROW_BATCH_SIZE,
+) -> Iterator[Post]:
+    """
+    Write posts to the date's Arrow IPC partition in record batches as they
+    pass through, then yield them on.
+    """
+    if pa is None:
+        raise RuntimeError("pyarrow 라이브러리가 설치되어 있지 않습니다.")
+
+    path = _partition_path(root, POSTS_DATASET, partition_date)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    with pa.OSFile(str(path), "wb") as sink, pa.ipc.new_file(sink, POSTS_SCHEMA) as writer:
+        batch: List[Post] = []
+        for post in posts:
+            batch.append(post)
+            if len(batch) >= batch_size:
+                writer.write_batch(_posts_batch(batch))
+                batch = []
+            yield post
+        if batch:
+            writer.write_batch(_posts_batch(batch))
+
+
+def save_title_frequencies_arrow(
+    word_freq: List[Tuple[str, int]],
+    bigram_freq: List[Tuple[str, int]],
+    root: Path,
+    partition_date: date,
+) -> Path:
+    """
+    Save word and bigram frequencies to the date's Arrow IPC partition.
+    """
+    if pa is None:
+        raise RuntimeError("pyarrow 라이브러리가 설치되어 있지 않습니다.")
+
+    path = _partition_path(root, TITLE_FREQUENCIES_DATASET, partition_date)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    rows = [("word", token, count) for token, count in word_freq]
+    rows += [("bigram", token, count) for token, count in bigram_freq]
+    table = pa.table(
+        [
+            pa.array([row[0] for row in rows], pa.string()).dictionary_encode().cast(
+                TITLE_FREQUENCIES_SCHEMA.field("type").type
+            ),
+            pa.array([row[1] for row in rows], pa.string()),
+            pa.array([row[2] for row in rows], pa.int32()),
+        ],
+        schema=TITLE_FREQUENCIES_SCHEMA,
+    )
+    with pa.OSFile(str(path), "wb") as sink, pa.ipc.new_file(sink, TITLE_FREQUENCIES_SCHEMA) as writer:
+        writer.write_table(table)
+    return path
+
+
+def _read_partitions(
+    root: Path, dataset: str, start_date: date, end_date: date
+) -> Optional["pa.Table"]:
+    if pa is None:
+        raise RuntimeError("pyarrow 라이브러리가 설치되어 있지 않습니다.")
+
+    tables = []
+    for offset in range((end_date - start_date).days + 1):
+        partition_date = start_date + timedelta(days=offset)
+        path = _partition_path(root, dataset, partition_date)
+        if not path.exists():
+            continue
+        # 메모리 매핑으로 열어 버퍼를 복사하지 않고 테이블을 구성
+        table = pa.ipc.open_file(pa.memory_map(str(path), "r")).read_all()
+        tables.append(
+            table.append_column("date", pa.array([partition_date] * table.num_rows, pa.date32()))
+        )
+
+    if not tables:
+        return None
+    return pa.concat_tables(tables)
+
+
+def read_posts_arrow(root: Path, start_date: date, end_date: date) -> Optional["pa.Table"]:
+    """
+    Load posts from start_date through end_date as one Arrow table (None if no partition exists).
+    """
+    return _read_partitions(root, POSTS_DATASET, start_date, end_date)
+
+
+def read_title_frequencies_arrow(root: Path, start_date: date, end_date: date) -> Optional["pa.Table"]:
+    """
+    Load title frequencies from start_date through end_date as one Arrow table.
+    """
+    return _read_partitions(root, TITLE_FREQUENCIES_DATASET, start_date, end_date)
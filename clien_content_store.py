@@ -0,0 +1,66 @@
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Iterable, Optional
+
+
+class PostContentStore:
+    """
+    Persistent store of fetched post bodies keyed by post ID (SQLite).
+    """
+
+    def __init__(self, db_path: Path) -> None:
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.db_path), timeout=30, check_same_thread=False)
+        with self._conn:
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS post_contents (
+                    post_id INTEGER PRIMARY KEY,
+                    url TEXT NOT NULL,
+                    content TEXT NOT NULL,
+                    fetched_at REAL NOT NULL
+                )
+                """
+            )
+
+    def get(self, post_id: int) -> Optional[str]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT content FROM post_contents WHERE post_id = ?", (post_id,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def get_many(self, post_ids: Iterable[int]) -> Dict[int, str]:
+        """
+        Return stored contents for the given IDs; missing IDs are left out.
+        """
+        unique_ids = list(dict.fromkeys(post_ids))
+        contents: Dict[int, str] = {}
+        # SQLite 바인딩 변수 개수 제한을 고려해 나눠서 조회
+        for start in range(0, len(unique_ids), 500):
+            chunk = unique_ids[start:start + 500]
+            placeholders = ", ".join("?" for _ in chunk)
+            with self._lock:
+                rows = self._conn.execute(
+                    f"SELECT post_id, content FROM post_contents WHERE post_id IN ({placeholders})",
+                    chunk,
+                ).fetchall()
+            contents.update(rows)
+        return contents
+
+    def put(self, post_id: int, url: str, content: str) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO post_contents (post_id, url, content, fetched_at) "
+                "VALUES (?, ?, ?, ?)",
+                (post_id, url, content, time.time()),
+            )
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
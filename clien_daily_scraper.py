@@ -1,37 +1,63 @@
 import csv
-import re
 import sys
 import argparse
+import multiprocessing
+import threading
 
 import os
-from collections import Counter
+from itertools import chain, groupby
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from pathlib import Path
-from urllib.parse import urljoin
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
 
 try:
     from wordcloud import WordCloud
 except ImportError:
     WordCloud = None
-try:
-    import google.generativeai as genai
-except ImportError:
-    genai = None
 
 from dotenv import load_dotenv
 
-import requests
-from bs4 import BeautifulSoup
 from datetime import datetime, timedelta
 
-# 클리앙 요청 시 사용할 공통 HTTP 헤더(봇 차단 방지를 위해 브라우저 UA 지정)
-DEFAULT_HEADERS: Dict[str, str] = {
-    "User-Agent": (
-        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
-        "(KHTML, like Gecko) Chrome/58.0.3029.110 Safari/537.3"
-    )
-}
-REQUEST_TIMEOUT = 10 # seconds
+from clien_archive import POST_ARCHIVE_DB_NAME, PostArchive, read_posts_csv
+from clien_async import iter_posts_for_date
+from clien_cache import ResponseCache
+from clien_columnar import columnar_available, save_title_frequencies_arrow, write_posts_arrow
+from clien_content_store import PostContentStore
+from clien_http import (
+    MAX_REQUESTS_PER_SECOND,
+    configure_http_client,
+    set_response_cache,
+)
+from clien_issue import ISSUE_FETCH_WORKERS, POST_CONTENT_DB_NAME, save_issue_posts
+from clien_post import Post
+from clien_stream import LIST_PAGE_CACHE_TTL, fetch_list_page, unique_posts
+from clien_tokens import TITLE_ANALYZERS, calculate_title_frequencies, set_title_analyzer, tokenize_posts
+from clien_telegram import TELEGRAM_OUTBOX_DB_NAME, TelegramDelivery, TelegramOutbox
+from clien_summary_cache import SUMMARY_CACHE_DB_NAME, SummaryCache
+from clien_summary import (
+    SUMMARY_BACKENDS,
+    SUMMARY_MODES,
+    pipelined_summarizer,
+    set_summary_backend,
+    set_summary_cache,
+    set_summary_mode,
+    summarize_issue_text,
+)
+from clien_trends import pick_issue_keyword
+from clien_parser import PARSER_BACKENDS, set_parser_backend
+
+# 목록 페이지 동시 요청 설정(서버 부담을 고려해 작은 값 유지)
+LIST_FETCH_WORKERS = 4
+LIST_PREFETCH_WINDOW = 4
+DEFAULT_CACHE_DIR = Path(__file__).parent / ".cache" / "http"
+DEFAULT_OUTPUT_DIR = Path(__file__).parent / "data"
+# --arrow 지정 시 날짜별 Arrow IPC 파일(posts, title_frequencies)을 저장할 위치
+DEFAULT_ARROW_DIR = DEFAULT_OUTPUT_DIR / "arrow"
+# 여러 날짜 수집 시 날짜별 분석/전송을 나눠 처리할 프로세스 수
+REPORT_PROCESSES = 4
+# 게시물 CSV 열 순서
+CSV_FIELDNAMES = ["Rec", "Views", "Author", "Time", "Title", "URL"]
 
 # Load environment variables from .env file first
 load_dotenv()
@@ -42,340 +68,419 @@ TELEGRAM_BOT_TOKEN = os.getenv("TELEGRAM_BOT_TOKEN", "YOUR_TELEGRAM_BOT_TOKEN_HE
 TELEGRAM_CHAT_ID = os.getenv("TELEGRAM_CHAT_ID", "YOUR_TELEGRAM_CHAT_ID_HERE")
 GEMINI_API_KEY = os.getenv("GEMINI_API_KEY", "YOUR_GEMINI_API_KEY_HERE")
 
-# 키워드 빈도 분석에서 제외할 불용어 목록
-STOP_WORDS = {"속보", "단독", "합니다", "더", "첫", "수","제","오늘","있다","너무","정말","속보","하는","왜"}
-
-GEMINI_SUMMARY_PROMPT = (
-    "다음은 커뮤니티의 주요 이슈 게시물들을 모아놓은 텍스트입니다. "
-    "전체 내용을 핵심만 간추려 3~5 문장의 완성된 문단으로 요약해주세요.\n\n"
-    "---[원문]---\n"
-)
-
 
-def scrape_clien_posts_for_date(target_date: datetime.date):
+def _collect_target_date_posts(
+    rows: List[Tuple[datetime, Post]],
+    target_date: datetime.date,
+    target_date_posts: List[Post],
+    newest_date: Optional[datetime.date] = None,
+) -> Tuple[bool, bool]:
     """
-    Scrape posts for a specific date from Clien's 'Today' board.
+    Append posts of target_date (through newest_date, if given) from one page in board order.
+
+    Returns (found_target_date_post_on_page, reached_older_posts).
     """
-    base_url = "https://www.clien.net/service/board/park"
-    page_num = 0
-    target_date_posts = []
-    
-    def normalize_count(value: str) -> int:
-        digits = "".join(ch for ch in value if ch.isdigit())
-        return int(digits) if digits else 0
+    found_target_date_post_on_page = False
+    newest_date = newest_date or target_date
 
-    # 오늘 작성된 게시물이 없을 때까지 페이징하며 수집
-    while True:
-        params = {"od": "T31", "category": "0", "po": page_num}
-
-        try:
-            response = requests.get(
-                base_url,
-                params=params,
-                headers=DEFAULT_HEADERS,
-                timeout=REQUEST_TIMEOUT,
-            )
-            response.raise_for_status()
-        except requests.exceptions.RequestException as e:
-            print(f"Request failed while fetching page {page_num}: {e}")
-            break
+    for post_datetime, post in rows:
+        post_date = post_datetime.date()
 
-        # 목록 페이지에서 공지 제외 게시글 블록 추출
-        soup = BeautifulSoup(response.text, "html.parser")
-        post_list = soup.select("div.list_content > div.symph_row:not(.list_notice)")
+        if post_date < target_date:
+            return found_target_date_post_on_page, True
+        elif post_date > newest_date:
+            continue
 
-        if not post_list:
-            print("No posts were returned for the current page. Stopping.")
-            break
+        found_target_date_post_on_page = True
+        target_date_posts.append(post)
 
-        found_target_date_post_on_page = False
+    return found_target_date_post_on_page, False
 
-        for post in post_list:
-            timestamp_span = post.select_one("div.list_time span.timestamp")
-            if not timestamp_span:
-                continue
 
-            timestamp_text = timestamp_span.get_text(strip=True)
-            try:
-                post_datetime = datetime.strptime(timestamp_text, "%Y-%m-%d %H:%M:%S")
-            except ValueError:
-                # Unexpected timestamp format; skip this post.
-                continue
+def _has_older_posts(rows: Optional[List[Tuple[datetime, Post]]], target_date: datetime.date) -> bool:
+    # 요청 실패/빈 페이지도 이후 페이지를 더 요청할 필요가 없으므로 중단 신호로 취급
+    if not rows:
+        return True
+    return any(post_datetime.date() < target_date for post_datetime, _ in rows)
 
-            post_date = post_datetime.date()
 
-            if post_date < target_date:
-                print(f"Found posts older than {target_date.strftime('%Y-%m-%d')} on page {page_num}. Stopping.")
-                return target_date_posts
-            elif post_date != target_date:
-                continue
-            
-            found_target_date_post_on_page = True
-
-            title_span = post.select_one("span.subject_fixed")
-            like_span = post.select_one("div.list_symph span")
-            author_span = post.select_one("div.list_author span.nickname span")
-            hit_span = post.select_one("div.list_hit span.hit")
-            time_span = post.select_one("div.list_time span.time")
-            link_tag = post.select_one("a.list_subject") or post.select_one("div.list_title a")
-
-            title = title_span.get_text(strip=True) if title_span else ""
-            recommendations = normalize_count(like_span.get_text(strip=True) if like_span else "0")
-            author = author_span.get_text(strip=True) if author_span else ""
-            views = normalize_count(hit_span.get_text(strip=True) if hit_span else "0")
-            display_time = (
-                time_span.contents[0].strip()
-                if time_span and time_span.contents
-                else post_datetime.strftime("%H:%M")
-            )
-            url = urljoin(base_url, link_tag["href"]) if link_tag and link_tag.has_attr("href") else ""
-
-            target_date_posts.append(
-                {
-                    "title": title,
-                    "recommendations": recommendations,
-                    "author": author,
-                    "views": views,
-                    "timestamp": post_datetime.strftime("%Y-%m-%d %H:%M:%S"),
-                    "display_time": display_time,
-                    "url": url,
-                }
-            )
+def _page_reaches_date(
+    page_num: int,
+    target_date: datetime.date,
+    page_cache: Dict[int, Optional[List[Tuple[datetime, Post]]]],
+    strictly_older: bool,
+) -> Optional[bool]:
+    """
+    Check whether a list page holds posts on/before target_date (or strictly
+    before it). Pages past the end of the board count as reached; None means
+    the request failed.
+    """
+    if page_num not in page_cache:
+        page_cache[page_num] = fetch_list_page(page_num)
+    rows = page_cache[page_num]
 
-        # 현재 페이지에서 어제 게시물을 하나라도 찾았고, 다음 페이지로 넘어가도 어제 게시물이 없을 수 있으므로
-        # 무조건 중단하지 않고 계속 페이징합니다. 중단은 post_date < target_date 조건에서 처리됩니다.
-        if not found_target_date_post_on_page and page_num > 0: # 첫 페이지 이후에 대상일 게시물이 없으면 계속 탐색
-            print(f"No posts from {target_date.strftime('%Y-%m-%d')} found on page {page_num}. Continuing to next page.")
+    if rows is None:
+        return None
+    if not rows:
+        return True
 
-        print(f"Completed scraping page {page_num}.")
-        page_num += 1
-    return target_date_posts
+    # 목록은 최신순이므로 페이지의 마지막(가장 오래된) 게시물만 확인
+    oldest_date = min(post_datetime for post_datetime, _ in rows).date()
+    return oldest_date < target_date if strictly_older else oldest_date <= target_date
 
 
-def tokenize_title(title: str) -> List[str]:
+def _gallop_first_page(
+    start_page: int,
+    target_date: datetime.date,
+    page_cache: Dict[int, Optional[List[Tuple[datetime, Post]]]],
+    strictly_older: bool,
+) -> Optional[int]:
     """
-    Extract alphanumeric and Hangul tokens from a title and normalize them.
+    Find the first page at or after start_page that reaches target_date using
+    galloping (1, 2, 4, ...) probes followed by a binary search.
     """
-    # 한글/영문/숫자 토큰만 추출해 소문자로 정규화
-    tokens = re.findall(r"[\uAC00-\uD7A3A-Za-z0-9]+", title)
-    return [token.lower() for token in tokens if token]
-
+    reached = _page_reaches_date(start_page, target_date, page_cache, strictly_older)
+    if reached is None:
+        return None
+    if reached:
+        return start_page
 
-def calculate_title_frequencies(posts, top_n: int = 20) -> Tuple[List[Tuple[str, int]], List[Tuple[str, int]]]:
-    """
-    Calculate most common words and bigrams within post titles.
+    # 조건을 만족하지 않는 마지막 페이지(low)와 만족하는 페이지(high) 사이를 좁혀 나감
+    low, step = start_page, 1
+    while True:
+        high = start_page + step
+        reached = _page_reaches_date(high, target_date, page_cache, strictly_older)
+        if reached is None:
+            return None
+        if reached:
+            break
+        low = high
+        step *= 2
+
+    while high - low > 1:
+        middle = (low + high) // 2
+        reached = _page_reaches_date(middle, target_date, page_cache, strictly_older)
+        if reached is None:
+            return None
+        if reached:
+            high = middle
+        else:
+            low = middle
+
+    return high
+
+
+def locate_target_date_pages(
+    target_date: datetime.date,
+    page_cache: Optional[Dict[int, Optional[List[Tuple[datetime, Post]]]]] = None,
+) -> Optional[Tuple[int, int]]:
     """
-    # 단어/바이그램 빈도 수집
-    word_counter: Counter = Counter()
-    bigram_counter: Counter = Counter()
+    Locate the `po` range holding target_date posts from span.timestamp values.
 
-    for post in posts:
-        tokens = tokenize_title(post["title"])
-        # 불용어를 제외한 최종 토큰 목록
-        filtered_tokens = [token for token in tokens if token not in STOP_WORDS]
+    Returns (first_page, last_page) where first_page is the first page with a
+    post on or before target_date and last_page is the first page with a post
+    older than it. Returns None if a probe request fails.
+    """
+    if page_cache is None:
+        page_cache = {}
 
-        if not filtered_tokens:
-            continue
+    first_page = _gallop_first_page(0, target_date, page_cache, strictly_older=False)
+    if first_page is None:
+        return None
 
-        word_counter.update(filtered_tokens)
-        if len(filtered_tokens) > 1:
-            bigrams = (" ".join(pair) for pair in zip(filtered_tokens, filtered_tokens[1:]))
-            bigram_counter.update(bigrams)
+    last_page = _gallop_first_page(first_page, target_date, page_cache, strictly_older=True)
+    if last_page is None:
+        return None
 
-    return word_counter.most_common(top_n), bigram_counter.most_common(top_n)
+    print(
+        f"Located posts from {target_date.strftime('%Y-%m-%d')} on pages {first_page}-{last_page} "
+        f"after {len(page_cache)} probe requests."
+    )
+    return first_page, last_page
 
 
-def save_posts_to_csv(posts, csv_path: Path) -> None:
+def iter_clien_posts_for_date(
+    target_date: datetime.date,
+    workers: int = LIST_FETCH_WORKERS,
+    window: Optional[int] = None,
+    locate: bool = True,
+    engine: str = "threads",
+) -> Iterator[Post]:
     """
-    Save collected posts to a CSV file with the requested column order.
+    Yield posts for a specific date from Clien's 'Today' board as list pages arrive.
+
+    With locate, the page range is first found by a galloping/binary search
+    over the list pages so newer pages are skipped; the located pages are
+    then fetched again (the board may have shifted since the probes) and the
+    scan continues past the range until an older post shows up. The linear
+    scan below is used as a fallback. With workers > 1, up to `window` pages ahead are
+    fetched speculatively by a bounded thread pool; no new page is requested
+    past the first page that contains posts older than target_date, and posts
+    are still yielded in board order. engine="async" runs the page scan as
+    asyncio tasks (clien_async) starting from the located first page, and
+    its posts are yielded as they arrive too.
     """
-    fieldnames = ["Rec", "Views", "Author", "Time", "Title", "URL"]
-
-    rows = [
-        {
-            "Rec": post["recommendations"],
-            "Views": post["views"],
-            "Author": post["author"],
-            "Time": post["display_time"],
-            "Title": post["title"],
-            "URL": post["url"],
-        }
-        for post in posts
-    ]
+    # 페이지를 받는 사이 새 글이 올라와 같은 게시물이 다음 페이지에 다시 나올 수 있으므로 ID로 중복 제거
+    return unique_posts(_iter_posts_for_date(target_date, workers, window, locate, engine))
+
+
+def _iter_posts_for_date(
+    target_date: datetime.date,
+    workers: int,
+    window: Optional[int],
+    locate: bool,
+    engine: str,
+) -> Iterator[Post]:
+    if engine == "async":
+        first_page, window = 0, window or LIST_PREFETCH_WINDOW
+        if locate:
+            located = locate_target_date_pages(target_date)
+            if located is not None:
+                first_page = located[0]
+                window = max(window, located[1] - located[0] + 1)
+        yield from iter_posts_for_date(
+            target_date,
+            start_page=first_page,
+            concurrency=workers,
+            window=window,
+            cache_ttl=LIST_PAGE_CACHE_TTL,
+        )
+        return
+
+    if locate:
+        located = locate_target_date_pages(target_date)
+        if located is not None:
+            first_page, last_page = located
+            # 탐색에 쓴 페이지는 그사이 새 글이 올라와 밀렸을 수 있으므로 다시 받음
+            # 찾은 범위는 한꺼번에 미리 요청하고, 범위 뒤로 밀린 게시물은 오래된 게시물이 나올 때까지 이어서 확인
+            yield from _iter_pages_concurrently(
+                target_date,
+                max(1, workers),
+                max(window or LIST_PREFETCH_WINDOW, last_page - first_page + 1),
+                start_page=first_page,
+            )
+            return
+        print("Failed to locate the page range. Falling back to a linear scan.")
 
-    with csv_path.open("w", encoding="utf-8-sig", newline="") as csv_file:
-        writer = csv.DictWriter(csv_file, fieldnames=fieldnames)
-        writer.writeheader()
-        writer.writerows(rows)
+    if workers <= 1:
+        yield from _iter_pages_serially(target_date)
+    else:
+        yield from _iter_pages_concurrently(target_date, workers, window or LIST_PREFETCH_WINDOW)
 
 
-def save_title_frequencies_to_csv(word_freq, bigram_freq, csv_path: Path) -> None:
+def scrape_clien_posts_for_date(
+    target_date: datetime.date,
+    workers: int = LIST_FETCH_WORKERS,
+    window: Optional[int] = None,
+    locate: bool = True,
+    engine: str = "threads",
+) -> List[Post]:
     """
-    Save word and bigram frequency results to a CSV file.
+    Scrape posts for a specific date from Clien's 'Today' board into a list.
     """
-    with csv_path.open("w", encoding="utf-8-sig", newline="") as csv_file:
-        writer = csv.writer(csv_file)
-        writer.writerow(["Type", "Token", "Count"])
+    return list(iter_clien_posts_for_date(target_date, workers, window, locate, engine))
 
-        for token, count in word_freq:
-            writer.writerow(["word", token, count])
 
-        for token, count in bigram_freq:
-            writer.writerow(["bigram", token, count])
+def _iter_pages_serially(target_date: datetime.date) -> Iterator[Post]:
+    page_num = 0
 
+    # 대상일보다 오래된 게시물이 나올 때까지 페이징하며 수집
+    while True:
+        rows = fetch_list_page(page_num)
+        if rows is None:
+            break
 
-def fetch_post_content(url: str) -> Optional[str]:
-    """
-    Retrieve the main textual content from an individual post page.
-    """
-    if not url:
-        return None
+        if not rows:
+            print("No posts were returned for the current page. Stopping.")
+            break
 
-    try:
-        response = requests.get(url, headers=DEFAULT_HEADERS, timeout=REQUEST_TIMEOUT)
-        response.raise_for_status()
-    except requests.exceptions.RequestException:
-        return None
+        page_posts: List[Post] = []
+        found_target_date_post_on_page, reached_older = _collect_target_date_posts(
+            rows, target_date, page_posts
+        )
+        yield from page_posts
+        if reached_older:
+            print(f"Found posts older than {target_date.strftime('%Y-%m-%d')} on page {page_num}. Stopping.")
+            return
 
-    soup = BeautifulSoup(response.text, "html.parser")
-    # 페이지 구조 변동을 고려해 자주 쓰이는 컨테이너 셀렉터 후보 등록
-    content_selectors = [
-        "div.post_content",
-        "div.post_article",
-        "div.post_body",
-        "div.post_view",
-        "div.view_content",
-        "article.post_article",
-        "div.content_view",
-    ]
-
-    for selector in content_selectors:
-        content = soup.select_one(selector)
-        if content:
-            text = content.get_text("\n", strip=True)
-            if text:
-                return text
-
-    fallback = soup.select_one("body")
-    if fallback:
-        text = fallback.get_text("\n", strip=True)
-        if text:
-            return text
-
-    return None
-
-
-def save_issue_posts(
-    top_keyword: str,
-    posts: List[dict],
-    output_path: Path,
-) -> bool:
-    """
-    Save full contents of posts that contain the top keyword into a text file.
-    """
-    relevant_entries = []
+        # 현재 페이지에서 어제 게시물을 하나라도 찾았고, 다음 페이지로 넘어가도 어제 게시물이 없을 수 있으므로
+        # 무조건 중단하지 않고 계속 페이징합니다. 중단은 post_date < target_date 조건에서 처리됩니다.
+        if not found_target_date_post_on_page and page_num > 0: # 첫 페이지 이후에 대상일 게시물이 없으면 계속 탐색
+            print(f"No posts from {target_date.strftime('%Y-%m-%d')} found on page {page_num}. Continuing to next page.")
 
-    for index, post in enumerate(posts, 1):
-        url = post.get("url")
-        if not url:
-            continue
+        print(f"Completed scraping page {page_num}.")
+        page_num += 1
 
-        content = fetch_post_content(url)
-        if not content:
-            continue
 
-        meta_line = (
-            f"Rec {post['recommendations']} / Views {post['views']} / "
-            f"Author {post['author']} / Time {post['display_time']}"
-        )
-        entry = "\n".join(
-            [
-                f"[Post {index}]",
-                f"Title: {post['title']}",
-                f"URL: {url}",
-                meta_line,
-                "",
-                content,
-            ]
-        )
-        relevant_entries.append(entry)
+def _iter_pages_concurrently(
+    target_date: datetime.date,
+    workers: int,
+    window: int,
+    start_page: int = 0,
+    newest_date: Optional[datetime.date] = None,
+) -> Iterator[Post]:
+    futures: Dict[int, Future] = {}
+    # 대상일보다 오래된 게시물(또는 빈 페이지)이 처음 확인된 페이지 번호
+    stop_page: List[Optional[int]] = [None]
+    stop_lock = threading.Lock()
+
+    def on_page_done(page: int, future: Future) -> None:
+        if future.cancelled() or not _has_older_posts(future.result(), target_date):
+            return
+        with stop_lock:
+            if stop_page[0] is None or page < stop_page[0]:
+                stop_page[0] = page
+
+    def submit(page: int) -> None:
+        future = executor.submit(fetch_list_page, page)
+        future.add_done_callback(lambda f, page=page: on_page_done(page, f))
+        futures[page] = future
+
+    executor = ThreadPoolExecutor(max_workers=workers)
+    try:
+        page_num = start_page
+        next_page = start_page
+        while True:
+            # 중단 페이지가 확인되기 전까지 window 만큼 앞선 페이지를 미리 요청
+            while next_page < page_num + window:
+                with stop_lock:
+                    if stop_page[0] is not None and next_page > stop_page[0]:
+                        break
+                submit(next_page)
+                next_page += 1
+
+            rows = futures.pop(page_num).result()
+            if rows is None:
+                break
+
+            if not rows:
+                print("No posts were returned for the current page. Stopping.")
+                break
+
+            page_posts: List[Post] = []
+            found_target_date_post_on_page, reached_older = _collect_target_date_posts(
+                rows, target_date, page_posts, newest_date
+            )
+            # 페이지 단위로 바로 내보내 소비 측(CSV 기록, 빈도 집계)이 수집과 함께 진행되도록 함
+            yield from page_posts
+            if reached_older:
+                print(f"Found posts older than {target_date.strftime('%Y-%m-%d')} on page {page_num}. Stopping.")
+                break
 
-    if not relevant_entries:
-        return False
+            if not found_target_date_post_on_page and page_num > 0:
+                print(f"No posts from {target_date.strftime('%Y-%m-%d')} found on page {page_num}. Continuing to next page.")
 
-    header = f"Top keyword: {top_keyword}"
-    body = ("\n\n" + ("-" * 80) + "\n\n").join(relevant_entries)
-    output_path.write_text(f"{header}\n\n{body}", encoding="utf-8")
-    return True
+            print(f"Completed scraping page {page_num}.")
+            page_num += 1
+    finally:
+        # 아직 시작되지 않은 추측성 요청은 취소
+        executor.shutdown(wait=True, cancel_futures=True)
 
 
-def send_file_via_telegram(
-    file_path: Path,
-    token: str,
-    chat_id: str,
-    caption: Optional[str] = None,
-) -> Tuple[bool, Optional[str]]:
+def _post_date(post: Post) -> datetime.date:
+    return post.posted_at.date()
+
+
+def iter_clien_posts_for_range(
+    start_date: datetime.date,
+    end_date: datetime.date,
+    workers: int = LIST_FETCH_WORKERS,
+    window: Optional[int] = None,
+    locate: bool = True,
+) -> Iterator[Post]:
+    """
+    Yield posts from end_date back to start_date in one pass over the list pages.
+
+    Posts come in board order (newest first), so each day's posts are contiguous.
     """
-    Send a local file to Telegram using the bot API.
+    first_page = 0
+    if locate:
+        # 가장 최근 날짜(end_date)가 시작되는 페이지부터 한 번만 훑음
+        first_page = _gallop_first_page(0, end_date, {}, strictly_older=False) or 0
+
+    yield from unique_posts(
+        _iter_pages_concurrently(
+            start_date,
+            max(1, workers),
+            window or LIST_PREFETCH_WINDOW,
+            start_page=first_page,
+            newest_date=end_date,
+        )
+    )
+
+
+def scrape_clien_posts_for_range(
+    start_date: datetime.date,
+    end_date: datetime.date,
+    workers: int = LIST_FETCH_WORKERS,
+    window: Optional[int] = None,
+    locate: bool = True,
+) -> Dict[datetime.date, List[Post]]:
     """
-    if not file_path.exists():
-        return False, f"파일이 존재하지 않습니다: {file_path}"
+    Scrape posts from start_date through end_date in one pass over the list pages.
 
-    if not token:
-        return False, "텔레그램 봇 토큰이 설정되지 않았습니다."
+    Returns posts bucketed per day (board order within each day); days
+    without posts map to empty lists.
+    """
+    buckets: Dict[datetime.date, List[Post]] = {
+        start_date + timedelta(days=offset): []
+        for offset in range((end_date - start_date).days + 1)
+    }
+    for post in iter_clien_posts_for_range(start_date, end_date, workers, window, locate):
+        buckets[_post_date(post)].append(post)
+    return buckets
+
+
+def _post_to_csv_row(post: Post) -> dict:
+    # 문자열 변환은 출력 시점에만 수행
+    return {
+        "Rec": post.recommendations,
+        "Views": post.views,
+        "Author": post.author,
+        "Time": post.display_time,
+        "Title": post.title,
+        "URL": post.url,
+    }
+
+
+def write_posts_to_csv(posts: Iterable[Post], csv_path: Path) -> Iterator[Post]:
+    """
+    Write each post to a CSV file as it passes through, then yield it on.
 
-    if not chat_id:
-        return False, "텔레그램 chat_id가 설정되지 않았습니다."
+    Lets one pass over a post stream feed the CSV and other consumers
+    (e.g. calculate_title_frequencies) while pages are still arriving.
+    """
+    # 줄 단위 버퍼링: 수집이 끝나기 전에도 기록된 행이 바로 파일에 반영됨
+    with csv_path.open("w", encoding="utf-8-sig", newline="", buffering=1) as csv_file:
+        writer = csv.DictWriter(csv_file, fieldnames=CSV_FIELDNAMES)
+        writer.writeheader()
+        for post in posts:
+            writer.writerow(_post_to_csv_row(post))
+            yield post
 
-    url = f"https://api.telegram.org/bot{token}/sendDocument"
 
-    try:
-        # Telegram sendDocument API 호출
-        with file_path.open("rb") as file_obj:
-            response = requests.post(
-                url,
-                data={"chat_id": chat_id, "caption": caption or ""},
-                files={"document": file_obj},
-                timeout=REQUEST_TIMEOUT,
-            )
-        if response.ok:
-            return True, None
-        return False, f"텔레그램 전송 실패 ({response.status_code}): {response.text}"
-    except requests.exceptions.RequestException as exc:
-        return False, f"텔레그램 요청 중 오류가 발생했습니다: {exc}"
-
-
-def send_photo_via_telegram(
-    file_path: Path,
-    token: str,
-    chat_id: str,
-    caption: Optional[str] = None,
-) -> Tuple[bool, Optional[str]]:
+def save_posts_to_csv(posts: Iterable[Post], csv_path: Path) -> int:
     """
-    Send a local image file to Telegram using the bot API's sendPhoto.
+    Save collected posts to a CSV file with the requested column order.
+
+    Returns the number of posts written.
     """
-    if not file_path.exists():
-        return False, f"파일이 존재하지 않습니다: {file_path}"
+    return sum(1 for _ in write_posts_to_csv(posts, csv_path))
 
-    if not token or "YOUR_TELEGRAM_BOT_TOKEN" in token:
-        return False, "텔레그램 봇 토큰이 설정되지 않았습니다."
 
-    if not chat_id or "YOUR_TELEGRAM_CHAT_ID" in chat_id:
-        return False, "텔레그램 chat_id가 설정되지 않았습니다."
+def save_title_frequencies_to_csv(word_freq, bigram_freq, csv_path: Path) -> None:
+    """
+    Save word and bigram frequency results to a CSV file.
+    """
+    with csv_path.open("w", encoding="utf-8-sig", newline="") as csv_file:
+        writer = csv.writer(csv_file)
+        writer.writerow(["Type", "Token", "Count"])
 
-    url = f"https://api.telegram.org/bot{token}/sendPhoto"
+        for token, count in word_freq:
+            writer.writerow(["word", token, count])
 
-    try:
-        with file_path.open("rb") as file_obj:
-            response = requests.post(
-                url,
-                data={"chat_id": chat_id, "caption": caption or ""},
-                files={"photo": file_obj},
-                timeout=REQUEST_TIMEOUT,
-            )
-        return response.ok, response.text if not response.ok else None
-    except requests.exceptions.RequestException as exc:
-        return False, f"텔레그램 사진 전송 중 오류가 발생했습니다: {exc}"
+        for token, count in bigram_freq:
+            writer.writerow(["bigram", token, count])
 
 
 def generate_word_cloud(
@@ -412,31 +517,324 @@ def generate_word_cloud(
         return False, f"워드 클라우드 생성 중 오류가 발생했습니다: {exc}"
 
 
-def summarize_text_with_gemini(
-    text_to_summarize: str, api_key: str
-) -> Tuple[Optional[str], Optional[str]]:
+def safe_console_text(text: str) -> str:
+    encoding = sys.stdout.encoding or "utf-8"
+    return text.encode(encoding, errors="replace").decode(encoding, errors="replace")
+
+
+def _echo_posts(posts: Iterable[Post], post_count: List[int]) -> Iterator[Post]:
+    # 게시물을 흘려보내면서 콘솔에 출력하고 개수를 센다
+    for i, post in enumerate(posts, 1):
+        line = (
+            f"{i}. Rec {post.recommendations} / Views {post.views} / "
+            f"Author {post.author} / Time {post.display_time} / Title {post.title}"
+        )
+        print(safe_console_text(line))
+        post_count[0] = i
+        yield post
+
+
+def daily_posts_csv_path(target_date: datetime.date, output_dir: Path = DEFAULT_OUTPUT_DIR) -> Path:
+    return output_dir / f"clien_yesterday_posts_{target_date.strftime('%y%m%d')}.csv"
+
+
+def publish_daily_report(
+    target_date: datetime.date,
+    posts: Iterable[Post],
+    output_dir: Path = DEFAULT_OUTPUT_DIR,
+    issue_workers: int = ISSUE_FETCH_WORKERS,
+    archive: Optional[PostArchive] = None,
+    arrow_dir: Optional[Path] = None,
+) -> int:
     """
-    Summarize the given text using the Gemini API.
+    Save one day's CSV/frequency/word cloud/issue/summary outputs and send them to Telegram.
+
+    posts may be a live iterator (e.g. iter_clien_posts_for_date): rows are
+    written to the CSV (and upserted into the archive / written to the
+    arrow_dir Arrow partition, if given) and title frequencies counted while
+    pages are still arriving. Returns the number of posts; nothing is
+    written when there are none.
     """
-    if genai is None:
-        return None, "google-generativeai 라이브러리가 설치되지 않았습니다."
+    posts = iter(posts)
+    first_post = next(posts, None)
+    if first_post is None:
+        return 0
+
+    print(safe_console_text(f"\n--- Posts from {target_date.strftime('%Y-%m-%d')} ---"))
+
+    # ./data 디렉토리 생성
+    output_dir.mkdir(exist_ok=True)
+
+    output_path = daily_posts_csv_path(target_date, output_dir)
+    post_count = [0]
+    # 제목 토큰화는 게시물당 한 번만 수행하고 결과를 레코드에 기록
+    posts = tokenize_posts(_echo_posts(chain([first_post], posts), post_count))
+    if archive is not None:
+        posts = archive.record(posts)
+    if arrow_dir is not None:
+        posts = write_posts_arrow(posts, arrow_dir, target_date)
+    title_index: Dict[str, Set[int]] = {}
+    # 콘솔 출력, 아카이브 저장, CSV 기록, 제목 빈도 집계/역색인 구성을 게시물 스트림 한 번으로 처리
+    word_freq, bigram_freq = calculate_title_frequencies(
+        write_posts_to_csv(posts, output_path), title_index=title_index
+    )
+    print(safe_console_text(f"\nCollected {post_count[0]} posts from {target_date.strftime('%Y-%m-%d')} in total."))
+    print(safe_console_text(f"\nSaved CSV to {output_path}"))
+
+    issue_keyword = None
+    if archive is not None:
+        archive.index_titles(title_index)
+        if word_freq:
+            issue_keyword = pick_issue_keyword(word_freq, archive, target_date)
+
+    publish_title_outputs(
+        target_date,
+        word_freq,
+        bigram_freq,
+        title_index,
+        output_path,
+        output_dir,
+        issue_workers,
+        arrow_dir,
+        issue_keyword,
+    )
+    return post_count[0]
 
-    if not api_key or api_key == "YOUR_GEMINI_API_KEY":
-        return None, "Gemini API 키가 설정되지 않았습니다."
 
-    try:
-        genai.configure(api_key=api_key)
-        # model = genai.GenerativeModel("gemini-1.5-flash-latest")
-        # 'gemini-1.5-flash-latest' 대신 'gemini-1.5-flash' 사용
-        model = genai.GenerativeModel('gemini-2.5-flash')
+def publish_daily_report_from_csv(
+    target_date: datetime.date,
+    output_dir: Path = DEFAULT_OUTPUT_DIR,
+    issue_workers: int = ISSUE_FETCH_WORKERS,
+    arrow_dir: Optional[Path] = None,
+    archive_path: Optional[Path] = None,
+) -> int:
+    """
+    Build one day's report from its already saved posts CSV, reading it row by row.
+
+    With archive_path, the day's title index is stored in that archive and
+    the issue keyword is chosen against the archived history.
+    """
+    csv_path = daily_posts_csv_path(target_date, output_dir)
+    print(safe_console_text(f"\n--- Posts from {target_date.strftime('%Y-%m-%d')} ---"))
+    post_count = [0]
+    title_index: Dict[str, Set[int]] = {}
+    word_freq, bigram_freq = calculate_title_frequencies(
+        tokenize_posts(_echo_posts(read_posts_csv(csv_path, target_date), post_count)),
+        title_index=title_index,
+    )
+    print(safe_console_text(f"\nCollected {post_count[0]} posts from {target_date.strftime('%Y-%m-%d')} in total."))
+
+    issue_keyword = None
+    if archive_path is not None:
+        archive = PostArchive(archive_path)
+        archive.index_titles(title_index)
+        if word_freq:
+            issue_keyword = pick_issue_keyword(word_freq, archive, target_date)
+        archive.close()
+
+    publish_title_outputs(
+        target_date,
+        word_freq,
+        bigram_freq,
+        title_index,
+        csv_path,
+        output_dir,
+        issue_workers,
+        arrow_dir,
+        issue_keyword,
+    )
+    return post_count[0]
+
+
+def publish_title_outputs(
+    target_date: datetime.date,
+    word_freq: List[Tuple[str, int]],
+    bigram_freq: List[Tuple[str, int]],
+    title_index: Dict[str, Set[int]],
+    posts_csv_path: Path,
+    output_dir: Path,
+    issue_workers: int = ISSUE_FETCH_WORKERS,
+    arrow_dir: Optional[Path] = None,
+    issue_keyword: Optional[str] = None,
+    posts: Optional[List[Post]] = None,
+    report_name: str = "",
+) -> None:
+    """
+    Save the frequency/word cloud/issue/summary outputs of one day's posts and send them to Telegram.
+
+    Shared by the daily, today and yesterday scrapers. Posts matching the
+    issue keyword are found through title_index and taken from posts when
+    given, otherwise read back from posts_csv_path. report_name ("today",
+    "yesterday" or "" for a given date) picks the output file names and
+    captions, e.g. TODAY_ISSUE_{YYMMDD}.txt and clien_today_wordcloud_{YYMMDD}.png.
+    """
+    # 파일명 뒤에 날짜(YYMMDD)를 붙여 관리
+    date_suffix = target_date.strftime("%y%m%d")
+    issue_prefix = report_name.upper() if report_name else "CLIEAN"
+    file_prefix = f"clien_{report_name}_" if report_name else "clien_"
+    # 캡션/전송 메시지에 쓰는 이름 예: today(251027), TODAY / 251027
+    report_label = f"{report_name}({date_suffix})" if report_name else date_suffix
+    report_title = report_name.upper() or date_suffix
+    # 이전 실행(오늘/어제/특정 날짜)에서 받은 게시물 본문 저장소
+    content_store = PostContentStore(output_dir / POST_CONTENT_DB_NAME)
+    # 이전 실행의 요약(게시물별 요약 포함)을 재사용해 바뀌지 않은 게시물은 다시 요약하지 않음
+    summary_cache = SummaryCache(output_dir / SUMMARY_CACHE_DB_NAME)
+    set_summary_cache(summary_cache)
+    # 결과 파일은 만들어지는 대로 텔레그램 업로드를 예약하고 함수 끝에서 한꺼번에 완료를 기다림
+    # 일시적인 오류로 전송에 실패한 파일은 대기열에 남겨 재시도(이전 실행에서 남은 항목 포함)
+    outbox = TelegramOutbox(output_dir / TELEGRAM_OUTBOX_DB_NAME)
+    delivery = TelegramDelivery(TELEGRAM_BOT_TOKEN, TELEGRAM_CHAT_ID, outbox=outbox)
+
+    if word_freq:
+        print(safe_console_text("\n--- Top words in titles ---"))
+        for token, count in word_freq:
+            print(safe_console_text(f"{token}: {count}"))
+
+        # 평소보다 급증한 키워드(issue_keyword)를 우선하고, 없으면 최다 빈도 키워드 사용
+        top_keyword = issue_keyword or word_freq[0][0]
+        # 역색인으로 키워드가 들어간 게시물 ID를 찾고, 게시물 목록이 메모리에 없으면 CSV에서 다시 읽음
+        matching_ids = title_index.get(top_keyword, set())
+        matching_posts = [
+            post
+            for post in (posts if posts is not None else read_posts_csv(posts_csv_path, target_date))
+            if post.post_id in matching_ids
+        ]
+        issue_file_path = output_dir / f"{issue_prefix}_ISSUE_{date_suffix}.txt"
+        if matching_posts:
+            # pipelined 요약 방식이면 본문을 받는 동안 요약을 함께 진행
+            summarizer = pipelined_summarizer(GEMINI_API_KEY, f"Top keyword: {top_keyword}")
+            # 필터링된 게시물 본문 저장 후 텔레그램 공유
+            if save_issue_posts(
+                top_keyword,
+                matching_posts,
+                issue_file_path,
+                workers=issue_workers,
+                content_store=content_store,
+                on_entry=summarizer.add if summarizer is not None else None,
+            ):
+                print(
+                    safe_console_text(
+                        f"\nSaved top keyword ('{top_keyword}') posts to {issue_file_path}"
+                    )
+                )
+                delivery.send_document(
+                    issue_file_path,
+                    caption=f"Top keyword posts: {top_keyword}",
+                    success_message=f"Sent {report_title} issue text file to Telegram successfully.",
+                )
+
+                # Gemini 요약 및 전송 로직 추가
+                if summarizer is not None:
+                    summary, gemini_error = summarizer.close()
+                else:
+                    full_issue_content = issue_file_path.read_text(encoding="utf-8")
+                    summary, gemini_error = summarize_issue_text(full_issue_content, GEMINI_API_KEY)
+
+                print(
+                    safe_console_text(
+                        f"\nSummary cache: {summary_cache.hits} hits / {summary_cache.misses} misses"
+                    )
+                )
 
-        prompt = f"{GEMINI_SUMMARY_PROMPT}{text_to_summarize}"
+                if summary:
+                    summary_file_path = output_dir / f"{issue_prefix}_SUMMARY_{date_suffix}.txt"
+                    summary_file_path.write_text(summary, encoding="utf-8")
+                    print(safe_console_text(f"\nSaved Gemini summary to {summary_file_path}"))
 
-        response = model.generate_content(prompt)
-        return response.text, None
+                    # 요약 파일을 텔레그램으로 전송
+                    delivery.send_document(
+                        summary_file_path,
+                        caption=f"Gemini Summary for {report_name or date_suffix}'s top keyword: {top_keyword}",
+                        success_message=f"Sent {report_title} summary text file to Telegram successfully.",
+                    )
 
-    except Exception as e:
-        return None, f"Gemini API 호출 중 오류가 발생했습니다: {e}"
+                elif gemini_error:
+                    print(safe_console_text(f"\nGemini summarization failed: {gemini_error}"))
+
+            else:
+                print(
+                    safe_console_text(
+                        "\nTop keyword와 매칭되는 게시물에서 본문을 가져오지 못했습니다."
+                    )
+                )
+        else:
+            print(
+                safe_console_text(
+                    "\nTop keyword와 일치하는 게시물이 목록에서 발견되지 않았습니다."
+                )
+            )
+
+    if bigram_freq:
+        print(safe_console_text("\n--- Top bigrams in titles ---"))
+        for token, count in bigram_freq:
+            print(safe_console_text(f"{token}: {count}"))
+
+    freq_output_path = output_dir / f"{file_prefix}title_frequencies_{date_suffix}.csv"
+    save_title_frequencies_to_csv(word_freq, bigram_freq, freq_output_path)
+    print(safe_console_text(f"\nSaved title frequencies to {freq_output_path}"))
+    if arrow_dir is not None:
+        arrow_freq_path = save_title_frequencies_arrow(word_freq, bigram_freq, arrow_dir, target_date)
+        print(safe_console_text(f"Saved title frequencies to {arrow_freq_path}"))
+    # 제목 빈도 CSV를 텔레그램으로 전송
+    delivery.send_document(
+        freq_output_path,
+        caption=f"Clien {report_label} title word frequencies",
+        success_message="Sent title frequencies CSV to Telegram successfully.",
+    )
+
+    # 워드 클라우드 이미지를 생성하고 저장
+    word_cloud_path = output_dir / f"{file_prefix}wordcloud_{date_suffix}.png"
+    default_font_path = Path("C:/Windows/Fonts/malgun.ttf")
+    font_path = default_font_path if default_font_path.exists() else None
+
+    success, error_message = generate_word_cloud(word_freq, word_cloud_path, font_path=font_path)
+    if success:
+        print(safe_console_text(f"\nSaved word cloud image to {word_cloud_path}"))
+        if font_path is None:
+            print(
+                safe_console_text(
+                    "한글 폰트를 찾지 못해 기본 폰트로 생성했습니다. 글자가 깨지면 `generate_word_cloud` 호출 시 `font_path`를 지정해주세요."
+                )
+            )
+        # 생성된 워드 클라우드 이미지를 텔레그램으로 전송
+        delivery.send_photo(
+            word_cloud_path,
+            caption=f"Clien {report_label} top keywords word cloud",
+            success_message="Sent word cloud image to Telegram successfully.",
+        )
+    elif error_message:
+        print(safe_console_text(f"\n{error_message}"))
+
+    # 문서는 sendMediaGroup 한 번으로 묶어 보내고, 사진 업로드와 함께 완료를 기다림
+    # (실패한 파일은 대기열에서 최대 OUTBOX_INLINE_WAIT초 동안 재시도하고, 남으면 다음 실행에서 전송)
+    for _, message in delivery.close():
+        if message:
+            print(safe_console_text(f"\n{message}"))
+    outbox.close()
+    set_summary_cache(None)
+    summary_cache.close()
+
+
+def _init_report_worker(
+    max_connections_per_host: int,
+    max_requests_per_second: Optional[float],
+    cache_dir: Optional[Path],
+    parser_backend: str,
+    title_analyzer: str,
+    summary_mode: str,
+    summary_backend: str,
+) -> None:
+    # 프로세스 풀 작업자는 부모의 세션/캐시/파서 설정을 물려받지 않으므로 다시 구성
+    configure_http_client(
+        max_connections_per_host=max_connections_per_host,
+        max_requests_per_second=max_requests_per_second,
+    )
+    if cache_dir is not None:
+        set_response_cache(ResponseCache(cache_dir))
+    set_parser_backend(parser_backend)
+    set_title_analyzer(title_analyzer)
+    set_summary_mode(summary_mode)
+    set_summary_backend(summary_backend)
 
 
 if __name__ == "__main__":
@@ -447,171 +845,216 @@ if __name__ == "__main__":
         help="스크래핑할 날짜 (YYYY-MM-DD 형식). 기본값: 어제",
         default=(datetime.now() - timedelta(days=1)).strftime("%Y-%m-%d")
     )
+    parser.add_argument(
+        "--start",
+        type=str,
+        help="여러 날짜를 한 번에 수집할 때의 시작 날짜 (YYYY-MM-DD 형식). 지정하면 --date 대신 사용",
+    )
+    parser.add_argument(
+        "--end",
+        type=str,
+        help="여러 날짜를 한 번에 수집할 때의 종료 날짜 (YYYY-MM-DD 형식). 기본값: 어제",
+    )
+    parser.add_argument(
+        "--processes",
+        type=int,
+        help=f"날짜별 분석/전송을 병렬 처리할 프로세스 수. 기본값: {REPORT_PROCESSES}",
+        default=REPORT_PROCESSES,
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        help=f"목록 페이지/이슈 본문 동시 요청 수 (1이면 순차 수집). 기본값: {LIST_FETCH_WORKERS}",
+        default=LIST_FETCH_WORKERS,
+    )
+    parser.add_argument(
+        "--max-rps",
+        type=float,
+        help=f"호스트별 초당 최대 요청 수 (0이면 제한 없음). 기본값: {MAX_REQUESTS_PER_SECOND}",
+        default=MAX_REQUESTS_PER_SECOND,
+    )
+    parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        help=f"HTTP 응답 캐시 디렉토리. 기본값: {DEFAULT_CACHE_DIR}",
+        default=DEFAULT_CACHE_DIR,
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="HTTP 응답 캐시를 사용하지 않고 모든 페이지를 새로 요청합니다.",
+    )
+    parser.add_argument(
+        "--engine",
+        choices=["threads", "async"],
+        help="목록 페이지 수집 방식 (threads: 스레드 풀, async: asyncio 작업). 기본값: threads",
+        default="threads",
+    )
+    parser.add_argument(
+        "--parser",
+        choices=PARSER_BACKENDS,
+        help="HTML 파서 (auto: lxml이 설치되어 있으면 lxml 사용). 기본값: auto",
+        default="auto",
+    )
+    parser.add_argument(
+        "--analyzer",
+        choices=TITLE_ANALYZERS,
+        help="제목 키워드 분석 방식 (korean: 조사/어미를 떼어 같은 단어로 집계, simple: 한글/영문/숫자 단위 그대로). 기본값: korean",
+        default="korean",
+    )
+    parser.add_argument(
+        "--summary-mode",
+        choices=SUMMARY_MODES,
+        help="이슈 게시물 요약 방식 (single: 본문을 모두 받은 뒤 요약, pipelined: 본문을 받는 동안 묶음별로 요약한 뒤 합침). 기본값: single",
+        default="single",
+    )
+    parser.add_argument(
+        "--summary-backend",
+        choices=SUMMARY_BACKENDS,
+        help="요약 모델 (fake: API 키 없이 동작하는 로컬 가짜 모델, 테스트용). 기본값: gemini",
+        default="gemini",
+    )
+    parser.add_argument(
+        "--arrow",
+        action="store_true",
+        help=f"게시물/제목 빈도를 날짜별 Arrow IPC 파일로도 저장합니다(pyarrow 필요). 저장 위치: {DEFAULT_ARROW_DIR}",
+    )
+    parser.add_argument(
+        "--no-locate",
+        action="store_true",
+        help="이진 탐색으로 대상 날짜의 페이지 범위를 찾지 않고 첫 페이지부터 순서대로 수집합니다.",
+    )
     args = parser.parse_args()
 
     try:
         target_date = datetime.strptime(args.date, "%Y-%m-%d").date()
+        if args.start:
+            start_date = datetime.strptime(args.start, "%Y-%m-%d").date()
+            end_date = (
+                datetime.strptime(args.end, "%Y-%m-%d").date()
+                if args.end
+                else (datetime.now() - timedelta(days=1)).date()
+            )
     except ValueError:
         print("오류: 날짜 형식이 잘못되었습니다. YYYY-MM-DD 형식으로 입력해주세요.")
         sys.exit(1)
 
-    def safe_console_text(text: str) -> str:
-        encoding = sys.stdout.encoding or "utf-8"
-        return text.encode(encoding, errors="replace").decode(encoding, errors="replace")
+    if args.end and not args.start:
+        print("오류: --end는 --start와 함께 지정해야 합니다.")
+        sys.exit(1)
+    if args.start and start_date > end_date:
+        print("오류: --start 날짜가 --end 날짜보다 늦습니다.")
+        sys.exit(1)
 
-    print(safe_console_text(f"Starting Clien board scraper for {target_date.strftime('%Y-%m-%d')}."))
+    try:
+        set_parser_backend(args.parser)
+        set_title_analyzer(args.analyzer)
+        set_summary_mode(args.summary_mode)
+        set_summary_backend(args.summary_backend)
+    except ValueError as exc:
+        print(f"오류: {exc}")
+        sys.exit(1)
 
-    # 1) 오늘 게시글 크롤링 후 2) 통계/파일 생성 3) 텔레그램 전송
-    posts = scrape_clien_posts_for_date(target_date)
+    if args.arrow and not columnar_available():
+        print("오류: --arrow를 사용하려면 pyarrow 라이브러리가 필요합니다.")
+        sys.exit(1)
+    arrow_dir = DEFAULT_ARROW_DIR if args.arrow else None
 
-    if posts:
-        print(safe_console_text(f"\n--- Posts from {target_date.strftime('%Y-%m-%d')} ---"))
-        for i, post in enumerate(posts, 1):
-            line = (
-                f"{i}. Rec {post['recommendations']} / Views {post['views']} / "
-                f"Author {post['author']} / Time {post['display_time']} / Title {post['title']}"
+    # 동시 요청 수에 맞춰 공유 세션의 keep-alive 연결 풀 크기 설정
+    configure_http_client(
+        max_connections_per_host=args.workers, max_requests_per_second=args.max_rps
+    )
+    # 재실행 시 목록/본문을 다시 받지 않도록 디스크 응답 캐시 사용
+    if not args.no_cache:
+        set_response_cache(ResponseCache(args.cache_dir))
+    # 수집한 게시물은 날짜와 관계없이 data/posts.sqlite3 아카이브에도 저장
+    archive = PostArchive(DEFAULT_OUTPUT_DIR / POST_ARCHIVE_DB_NAME)
+
+    if args.start:
+        print(
+            safe_console_text(
+                f"Starting Clien board scraper for {start_date.strftime('%Y-%m-%d')} "
+                f"~ {end_date.strftime('%Y-%m-%d')}."
             )
-            print(safe_console_text(line))
-        print(safe_console_text(f"\nCollected {len(posts)} posts from {target_date.strftime('%Y-%m-%d')} in total."))
-
-        # 파일명 뒤에 날짜(YYMMDD)를 붙여 관리
-        date_suffix = target_date.strftime("%y%m%d")
-        
-        # ./data 디렉토리 생성
-        output_dir = Path(__file__).parent / "data"
-        output_dir.mkdir(exist_ok=True)
-
-        output_path = output_dir / f"clien_yesterday_posts_{date_suffix}.csv"
-        save_posts_to_csv(posts, output_path)
-        print(safe_console_text(f"\nSaved CSV to {output_path}"))
-
-        word_freq, bigram_freq = calculate_title_frequencies(posts)
-
-        if word_freq:
-            print(safe_console_text("\n--- Top words in titles ---"))
-            for token, count in word_freq:
-                print(safe_console_text(f"{token}: {count}"))
-
-            top_keyword = word_freq[0][0]
-            # 제목 토큰에 최다 빈도 키워드가 포함된 게시물만 필터링
-            matching_posts = [
-                post for post in posts if top_keyword in tokenize_title(post["title"])
-            ]
-            issue_file_path = output_dir / f"CLIEAN_ISSUE_{date_suffix}.txt"
-            if matching_posts:
-                # 필터링된 게시물 본문 저장 후 텔레그램 공유
-                if save_issue_posts(top_keyword, matching_posts, issue_file_path):
-                    print(
-                        safe_console_text(
-                            f"\nSaved top keyword ('{top_keyword}') posts to {issue_file_path}"
-                        )
-                    )
-                    sent, send_error = send_file_via_telegram(
-                        issue_file_path,
-                        TELEGRAM_BOT_TOKEN,
-                        TELEGRAM_CHAT_ID,
-                        caption=f"Top keyword posts: {top_keyword}",
-                    )
-                    if sent:
-                        print(
-                            safe_console_text(
-                                f"\nSent {date_suffix} issue text file to Telegram successfully."
-                            )
-                        )
-                    elif send_error:
-                        print(safe_console_text(f"\n{send_error}"))
-
-                    # Gemini 요약 및 전송 로직 추가
-                    full_issue_content = issue_file_path.read_text(encoding="utf-8")
-                    summary, gemini_error = summarize_text_with_gemini(full_issue_content, GEMINI_API_KEY)
-
-                    if summary:
-                        summary_file_path = output_dir / f"CLIEAN_SUMMARY_{date_suffix}.txt"
-                        summary_file_path.write_text(summary, encoding="utf-8")
-                        print(safe_console_text(f"\nSaved Gemini summary to {summary_file_path}"))
-
-                        # 요약 파일을 텔레그램으로 전송
-                        sent_summary, summary_error = send_file_via_telegram(
-                            summary_file_path,
-                            TELEGRAM_BOT_TOKEN,
-                            TELEGRAM_CHAT_ID,
-                            caption=f"Gemini Summary for {date_suffix}'s top keyword: {top_keyword}",
-                        )
-                        if sent_summary:
-                            print(
-                                safe_console_text(
-                                    f"\nSent {date_suffix} summary text file to Telegram successfully."
-                                )
-                            )
-                        elif summary_error:
-                            print(safe_console_text(f"\n{summary_error}"))
-
-                    elif gemini_error:
-                        print(safe_console_text(f"\nGemini summarization failed: {gemini_error}"))
-
-                else:
-                    print(
-                        safe_console_text(
-                            "\nTop keyword와 매칭되는 게시물에서 본문을 가져오지 못했습니다."
-                        )
-                    )
-            else:
-                print(
-                    safe_console_text(
-                        "\nTop keyword와 일치하는 게시물이 목록에서 발견되지 않았습니다."
-                    )
-                )
+        )
 
-        if bigram_freq:
-            print(safe_console_text("\n--- Top bigrams in titles ---"))
-            for token, count in bigram_freq:
-                print(safe_console_text(f"{token}: {count}"))
-
-        freq_output_path = output_dir / f"clien_title_frequencies_{date_suffix}.csv"
-        save_title_frequencies_to_csv(word_freq, bigram_freq, freq_output_path)
-        print(safe_console_text(f"\nSaved title frequencies to {freq_output_path}"))
-        # 제목 빈도 CSV를 텔레그램으로 전송
-        sent_freq, freq_error = send_file_via_telegram(
-            freq_output_path,
-            TELEGRAM_BOT_TOKEN,
-            TELEGRAM_CHAT_ID,
-            caption=f"Clien {date_suffix} title word frequencies",
+        # 1) 목록 페이지를 한 번만 훑으며 날짜별 CSV를 바로 기록하고
+        # 2) CSV가 완성된 날짜부터 프로세스 풀에서 분석/전송을 병렬 처리
+        range_days = (end_date - start_date).days + 1
+        processes = max(1, min(args.processes, range_days))
+        # 프로세스마다 요청 속도 제한이 따로 적용되고 목록 수집도 분석과 동시에 진행되므로
+        # 전체 상한을 (분석 프로세스 수 + 수집 프로세스)로 나눔
+        per_process_rps = args.max_rps / (processes + 1) if args.max_rps else args.max_rps
+        configure_http_client(
+            max_connections_per_host=args.workers, max_requests_per_second=per_process_rps
         )
-        if sent_freq:
-            print(safe_console_text("\nSent title frequencies CSV to Telegram successfully."))
-        elif freq_error:
-            print(safe_console_text(f"\n{freq_error}"))
-
-        # 워드 클라우드 이미지를 생성하고 저장
-        word_cloud_path = output_dir / f"clien_wordcloud_{date_suffix}.png"
-        default_font_path = Path("C:/Windows/Fonts/malgun.ttf")
-        font_path = default_font_path if default_font_path.exists() else None
-
-        success, error_message = generate_word_cloud(word_freq, word_cloud_path, font_path=font_path)
-        if success:
-            print(safe_console_text(f"\nSaved word cloud image to {word_cloud_path}"))
-            if font_path is None:
-                print(
-                    safe_console_text(
-                        "한글 폰트를 찾지 못해 기본 폰트로 생성했습니다. 글자가 깨지면 `generate_word_cloud` 호출 시 `font_path`를 지정해주세요."
-                    )
-                )
-            # 생성된 워드 클라우드 이미지를 텔레그램으로 전송
-            sent_wc, wc_error = send_photo_via_telegram(
-                word_cloud_path,
-                TELEGRAM_BOT_TOKEN,
-                TELEGRAM_CHAT_ID,
-                caption=f"Clien {date_suffix} top keywords word cloud",
-            )
-            if sent_wc:
-                print(
-                    safe_console_text(
-                        "\nSent word cloud image to Telegram successfully."
+        DEFAULT_OUTPUT_DIR.mkdir(exist_ok=True)
+        collected_days = set()
+        # 작업자는 목록 수집 스레드가 요청 중일 때 시작되므로 fork 대신 spawn으로 만들어
+        # 부모 스레드가 잡고 있던 세션/연결 풀 잠금이나 SQLite 핸들을 물려받지 않게 함
+        with ProcessPoolExecutor(
+            max_workers=processes,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_report_worker,
+            initargs=(
+                args.workers,
+                per_process_rps,
+                None if args.no_cache else args.cache_dir,
+                args.parser,
+                args.analyzer,
+                args.summary_mode,
+                args.summary_backend,
+            ),
+        ) as executor:
+            futures = {}
+            # 게시물은 최신순으로 오므로 같은 날짜의 게시물은 연속해서 나옴
+            for day, day_posts in groupby(
+                iter_clien_posts_for_range(
+                    start_date, end_date, workers=args.workers, locate=not args.no_locate
+                ),
+                key=_post_date,
+            ):
+                csv_path = daily_posts_csv_path(day)
+                day_posts = archive.record(day_posts)
+                if arrow_dir is not None:
+                    day_posts = write_posts_arrow(day_posts, arrow_dir, day)
+                count = save_posts_to_csv(day_posts, csv_path)
+                print(safe_console_text(f"\nSaved {count} posts from {day.strftime('%Y-%m-%d')} to {csv_path}"))
+                collected_days.add(day)
+                futures[
+                    executor.submit(
+                        publish_daily_report_from_csv,
+                        day,
+                        DEFAULT_OUTPUT_DIR,
+                        args.workers,
+                        arrow_dir,
+                        DEFAULT_OUTPUT_DIR / POST_ARCHIVE_DB_NAME,
                     )
-                )
-            elif wc_error:
-                print(safe_console_text(f"\n{wc_error}"))
-        elif error_message:
-            print(safe_console_text(f"\n{error_message}"))
+                ] = day
+
+            for offset in range(range_days):
+                day = start_date + timedelta(days=offset)
+                if day not in collected_days:
+                    print(safe_console_text(f"\nNo posts from {day.strftime('%Y-%m-%d')} were collected."))
+
+            for future in as_completed(futures):
+                day = futures[future]
+                try:
+                    future.result()
+                except Exception as exc:
+                    print(safe_console_text(f"\nFailed to build the {day.strftime('%Y-%m-%d')} report: {exc}"))
     else:
-        print(safe_console_text(f"\nNo posts from {target_date.strftime('%Y-%m-%d')} were collected."))
+        print(safe_console_text(f"Starting Clien board scraper for {target_date.strftime('%Y-%m-%d')}."))
+
+        # 1) 오늘 게시글 크롤링 후 2) 통계/파일 생성 3) 텔레그램 전송
+        # 수집되는 대로 CSV 기록과 제목 빈도 집계가 함께 진행됨
+        posts = iter_clien_posts_for_date(
+            target_date, workers=args.workers, locate=not args.no_locate, engine=args.engine
+        )
+
+        if not publish_daily_report(
+            target_date, posts, issue_workers=args.workers, archive=archive, arrow_dir=arrow_dir
+        ):
+            print(safe_console_text(f"\nNo posts from {target_date.strftime('%Y-%m-%d')} were collected."))
+
+    archive.close()
@@ -0,0 +1,141 @@
+import argparse
+import json
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import List, NamedTuple, Optional
+
+# 요청 경로 예: /bot<token>/sendDocument
+_METHOD_PATH = re.compile(r"^/bot[^/]+/(\w+)$")
+_SUPPORTED_METHODS = {"sendMessage", "sendDocument", "sendPhoto", "sendMediaGroup"}
+
+
+class FakeTelegramRequest(NamedTuple):
+    method: str
+    files: int
+    size: int
+    received_at: float
+
+
+class FakeTelegramServer:
+    """
+    Local stand-in for the Telegram Bot API, for trying out deliveries.
+
+    Point TELEGRAM_API_BASE at base_url. Every request is answered with
+    {"ok": true} after delay seconds (to mimic upload latency) and recorded
+    in requests; fail_methods are answered with HTTP 400 instead, and the
+    first throttle requests get a 429 with parameters.retry_after.
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        delay: float = 0.0,
+        fail_methods: Optional[List[str]] = None,
+        throttle: int = 0,
+        retry_after: int = 1,
+    ) -> None:
+        self.delay = delay
+        self.fail_methods = set(fail_methods or [])
+        self.throttle = throttle
+        self.retry_after = retry_after
+        self.requests: List[FakeTelegramRequest] = []
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer((host, port), self._handler_class())
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def _handler_class(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self) -> None:
+                body = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+                match = _METHOD_PATH.match(self.path)
+                method = match.group(1) if match else ""
+                with server._lock:
+                    server.requests.append(
+                        FakeTelegramRequest(method, body.count(b"filename="), len(body), time.time())
+                    )
+                    throttled = server.throttle > 0
+                    if throttled:
+                        server.throttle -= 1
+                if server.delay:
+                    time.sleep(server.delay)
+
+                if throttled:
+                    status, payload = 429, {
+                        "ok": False,
+                        "error_code": 429,
+                        "description": f"Too Many Requests: retry after {server.retry_after}",
+                        "parameters": {"retry_after": server.retry_after},
+                    }
+                elif method not in _SUPPORTED_METHODS or method in server.fail_methods:
+                    status, payload = 400, {"ok": False, "description": f"Bad Request: {method}"}
+                else:
+                    status, payload = 200, {"ok": True, "result": {}}
+                data = json.dumps(payload).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, format: str, *args) -> None:
+                # 요청마다 표준 오류로 로그를 남기지 않음
+                pass
+
+        return Handler
+
+    def start(self) -> "FakeTelegramServer":
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def serve_forever(self) -> None:
+        try:
+            self._server.serve_forever()
+        finally:
+            self._server.server_close()
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="텔레그램 Bot API를 흉내 내는 로컬 서버를 실행합니다(TELEGRAM_API_BASE로 지정)."
+    )
+    parser.add_argument("--port", type=int, help="포트. 기본값: 8081", default=8081)
+    parser.add_argument("--delay", type=float, help="요청마다 응답 전에 기다릴 시간(초). 기본값: 0", default=0.0)
+    parser.add_argument(
+        "--fail",
+        nargs="*",
+        default=[],
+        help="HTTP 400으로 응답할 메서드 (예: sendMediaGroup)",
+    )
+    parser.add_argument("--throttle", type=int, help="처음 N개 요청에 429로 응답합니다. 기본값: 0", default=0)
+    parser.add_argument("--retry-after", type=int, help="429 응답의 retry_after(초). 기본값: 1", default=1)
+    args = parser.parse_args()
+
+    fake = FakeTelegramServer(
+        port=args.port,
+        delay=args.delay,
+        fail_methods=args.fail,
+        throttle=args.throttle,
+        retry_after=args.retry_after,
+    )
+    print(f"Fake Telegram API listening on {fake.base_url} (set TELEGRAM_API_BASE={fake.base_url}).")
+    try:
+        fake.serve_forever()
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,168 @@
+import threading
+import time
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from clien_cache import ResponseCache
+
+# 클리앙 요청 시 사용할 공통 HTTP 헤더(봇 차단 방지를 위해 브라우저 UA 지정)
+DEFAULT_HEADERS: Dict[str, str] = {
+    "User-Agent": (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+        "(KHTML, like Gecko) Chrome/58.0.3029.110 Safari/537.3"
+    )
+}
+REQUEST_TIMEOUT = 10 # seconds
+
+# 연결 풀 기본값: 호스트별 keep-alive 연결 수와 동시 요청 수 상한
+POOL_CONNECTIONS = 4
+MAX_CONNECTIONS_PER_HOST = 4
+# 호스트별 초당 최대 요청 수(서버 부담을 줄이기 위한 요청 간격 제한, None이면 제한 없음)
+MAX_REQUESTS_PER_SECOND: Optional[float] = 5.0
+
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+_host_limit = MAX_CONNECTIONS_PER_HOST
+_host_semaphores: Dict[str, threading.BoundedSemaphore] = {}
+_rate_limit = MAX_REQUESTS_PER_SECOND
+_host_next_slot: Dict[str, float] = {}
+_response_cache: Optional[ResponseCache] = None
+
+
+def configure_http_client(
+    max_connections_per_host: int = MAX_CONNECTIONS_PER_HOST,
+    pool_connections: int = POOL_CONNECTIONS,
+    headers: Optional[Dict[str, str]] = None,
+    max_requests_per_second: Optional[float] = MAX_REQUESTS_PER_SECOND,
+) -> requests.Session:
+    """
+    (Re)create the shared session with a keep-alive pool sized for the given concurrency.
+    """
+    global _session, _host_limit, _rate_limit
+
+    max_connections_per_host = max(1, max_connections_per_host)
+    session = requests.Session()
+    session.headers.update(headers or DEFAULT_HEADERS)
+    # pool_block=True: 호스트별 연결 수를 넘는 요청은 새 연결을 만들지 않고 대기
+    adapter = HTTPAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=max_connections_per_host,
+        pool_block=True,
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+
+    with _session_lock:
+        previous = _session
+        _session = session
+        _host_limit = max_connections_per_host
+        _host_semaphores.clear()
+        _rate_limit = max_requests_per_second
+        _host_next_slot.clear()
+
+    if previous is not None:
+        previous.close()
+    return session
+
+
+def get_session() -> requests.Session:
+    """
+    Return the shared session, creating it with the default pool settings on first use.
+    """
+    with _session_lock:
+        session = _session
+    return session if session is not None else configure_http_client()
+
+
+def close_http_client() -> None:
+    """
+    Close the shared session and its pooled connections.
+    """
+    global _session
+
+    with _session_lock:
+        session, _session = _session, None
+        _host_semaphores.clear()
+    if session is not None:
+        session.close()
+
+
+def set_response_cache(cache: Optional[ResponseCache]) -> None:
+    """
+    Enable (or disable with None) the on-disk cache used by http_get.
+    """
+    global _response_cache
+
+    with _session_lock:
+        _response_cache = cache
+
+
+def _host_semaphore(host: str) -> threading.BoundedSemaphore:
+    with _session_lock:
+        semaphore = _host_semaphores.get(host)
+        if semaphore is None:
+            semaphore = threading.BoundedSemaphore(_host_limit)
+            _host_semaphores[host] = semaphore
+    return semaphore
+
+
+def _wait_for_rate_slot(host: str) -> None:
+    with _session_lock:
+        if not _rate_limit or _rate_limit <= 0:
+            return
+        # 호스트별로 다음 요청 가능 시각을 예약해 요청 간격을 1/rate 이상으로 유지
+        now = time.monotonic()
+        slot = max(now, _host_next_slot.get(host, now))
+        _host_next_slot[host] = slot + 1.0 / _rate_limit
+
+    delay = slot - now
+    if delay > 0:
+        time.sleep(delay)
+
+
+def http_request(method: str, url: str, **kwargs) -> requests.Response:
+    """
+    Send a request through the shared session with the common timeout and per-host limits.
+    """
+    kwargs.setdefault("timeout", REQUEST_TIMEOUT)
+    session = get_session()
+    host = urlsplit(url).netloc
+    with _host_semaphore(host):
+        _wait_for_rate_slot(host)
+        return session.request(method, url, **kwargs)
+
+
+def http_get(url: str, cache_ttl: Optional[float] = None, **kwargs) -> requests.Response:
+    """
+    Send a GET request, answering from the response cache while the entry is
+    fresh and revalidating stale entries with a conditional request.
+    cache_ttl=0 bypasses the cache for this call.
+    """
+    cache = _response_cache
+    if cache is None or cache_ttl == 0:
+        return http_request("GET", url, **kwargs)
+
+    key = cache.make_key(url, kwargs.get("params"))
+    cached = cache.get(key)
+    if cached is not None:
+        if cached.is_fresh(cache.default_ttl if cache_ttl is None else cache_ttl):
+            return cached.to_response()
+        # 유효 시간이 지난 항목은 ETag/Last-Modified로 변경 여부만 확인
+        headers = dict(kwargs.get("headers") or {})
+        headers.update(cached.validators())
+        kwargs["headers"] = headers
+
+    response = http_request("GET", url, **kwargs)
+    if cached is not None and response.status_code == 304:
+        cache.refresh(key)
+        return cached.to_response()
+    if response.status_code == 200:
+        cache.put(key, response)
+    return response
+
+
+def http_post(url: str, **kwargs) -> requests.Response:
+    return http_request("POST", url, **kwargs)
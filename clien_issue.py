@@ -0,0 +1,114 @@
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, List, Optional, Tuple
+
+import requests
+
+from clien_content_store import PostContentStore
+from clien_http import http_get
+from clien_parser import extract_post_content
+from clien_post import Post
+from clien_summary import ISSUE_ENTRY_SEPARATOR
+
+# 이슈 게시물 본문 동시 요청 수
+ISSUE_FETCH_WORKERS = 4
+# data/ 폴더에 저장되는 게시물 본문 저장소 파일명
+POST_CONTENT_DB_NAME = "post_contents.sqlite3"
+# 응답 캐시를 켠 경우 본문 페이지의 유효 시간(본문은 거의 바뀌지 않으므로 길게 유지)
+POST_PAGE_CACHE_TTL = 24 * 60 * 60 # seconds
+
+
+def fetch_post_content(url: str, cache_ttl: Optional[float] = POST_PAGE_CACHE_TTL) -> Optional[str]:
+    """
+    Retrieve the main textual content from an individual post page.
+    """
+    if not url:
+        return None
+
+    try:
+        response = http_get(url, cache_ttl=cache_ttl)
+        response.raise_for_status()
+    except requests.exceptions.RequestException:
+        return None
+
+    return extract_post_content(response.text)
+
+
+def format_issue_entry(index: int, post: Post, content: str) -> str:
+    """
+    Format one post of an issue file as a [Post N] entry.
+    """
+    meta_line = (
+        f"Rec {post.recommendations} / Views {post.views} / "
+        f"Author {post.author} / Time {post.display_time}"
+    )
+    return "\n".join(
+        [
+            f"[Post {index}]",
+            f"Title: {post.title}",
+            f"URL: {post.url}",
+            meta_line,
+            "",
+            content,
+        ]
+    )
+
+
+def save_issue_posts(
+    top_keyword: str,
+    posts: List[Post],
+    output_path: Path,
+    workers: int = ISSUE_FETCH_WORKERS,
+    content_store: Optional[PostContentStore] = None,
+    on_entry: Optional[Callable[[str], None]] = None,
+) -> bool:
+    """
+    Save full contents of posts that contain the top keyword into a text file.
+
+    Post bodies are fetched by up to `workers` threads (subject to the shared
+    client's per-host rate cap) while entries keep their original [Post N] order.
+    With a content_store, stored bodies are reused and only misses are fetched.
+    on_entry receives each entry as soon as it is ready (e.g. a
+    PipelinedSummarizer), while later bodies are still being fetched.
+    """
+    relevant_entries = []
+    indexed_posts = [(index, post) for index, post in enumerate(posts, 1) if post.url]
+
+    # 저장소에 이미 있는 본문은 다시 요청하지 않음
+    stored_contents = (
+        content_store.get_many(
+            post.post_id for _, post in indexed_posts if post.post_id is not None
+        )
+        if content_store is not None
+        else {}
+    )
+
+    def load_content(item: Tuple[int, Post]) -> Optional[str]:
+        post = item[1]
+        if post.post_id in stored_contents:
+            return stored_contents[post.post_id]
+
+        content = fetch_post_content(post.url)
+        if content and content_store is not None and post.post_id is not None:
+            content_store.put(post.post_id, post.url, content)
+        return content
+
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+        # executor.map은 입력 순서대로 결과를 돌려주므로 게시물 순서가 유지됨
+        contents = executor.map(load_content, indexed_posts)
+        for (index, post), content in zip(indexed_posts, contents):
+            if not content:
+                continue
+
+            entry = format_issue_entry(index, post, content)
+            relevant_entries.append(entry)
+            if on_entry is not None:
+                on_entry(entry)
+
+    if not relevant_entries:
+        return False
+
+    header = f"Top keyword: {top_keyword}"
+    body = ISSUE_ENTRY_SEPARATOR.join(relevant_entries)
+    output_path.write_text(f"{header}\n\n{body}", encoding="utf-8")
+    return True
@@ -0,0 +1,331 @@
+from datetime import datetime
+from typing import Callable, List, Optional, Tuple
+from urllib.parse import urljoin
+
+import soupsieve
+from bs4 import BeautifulSoup, SoupStrainer
+
+try:
+    import lxml.html
+    from lxml import etree
+except ImportError:
+    lxml = None
+
+from clien_post import TIMESTAMP_FORMAT, Post, parse_post_id
+
+LIST_BASE_URL = "https://www.clien.net/service/board/park"
+
+# 페이지 구조 변동을 고려해 자주 쓰이는 본문 컨테이너 셀렉터 후보
+CONTENT_SELECTORS = [
+    "div.post_content",
+    "div.post_article",
+    "div.post_body",
+    "div.post_view",
+    "div.view_content",
+    "article.post_article",
+    "div.content_view",
+]
+
+# 파서 백엔드: "auto"는 lxml이 설치되어 있으면 lxml, 아니면 html.parser 사용
+PARSER_BACKENDS = ("auto", "lxml", "html.parser")
+_backend = "auto"
+
+
+def set_parser_backend(name: str) -> None:
+    """
+    Select the HTML parser backend ("auto", "lxml" or "html.parser").
+    """
+    global _backend
+
+    if name not in PARSER_BACKENDS:
+        raise ValueError(f"Unknown parser backend: {name}")
+    if name == "lxml" and lxml is None:
+        raise ValueError("lxml 라이브러리가 설치되어 있지 않습니다.")
+    _backend = name
+
+
+def get_parser_backend() -> str:
+    """
+    Return the backend actually used for parsing.
+    """
+    if _backend == "auto":
+        return "lxml" if lxml is not None else "html.parser"
+    return _backend
+
+
+def normalize_count(value: str) -> int:
+    digits = "".join(ch for ch in value if ch.isdigit())
+    return int(digits) if digits else 0
+
+
+def _build_post(
+    post_datetime: datetime,
+    title: str,
+    like_text: str,
+    author: str,
+    hit_text: str,
+    href: Optional[str],
+    base_url: str,
+) -> Post:
+    url = urljoin(base_url, href) if href else ""
+    return Post(
+        post_id=parse_post_id(url),
+        posted_at=post_datetime,
+        recommendations=normalize_count(like_text),
+        views=normalize_count(hit_text),
+        author=author,
+        title=title,
+        url=url,
+    )
+
+
+def _parse_timestamp(timestamp_text: str) -> Optional[datetime]:
+    try:
+        return datetime.strptime(timestamp_text, TIMESTAMP_FORMAT)
+    except ValueError:
+        # Unexpected timestamp format; skip this post.
+        return None
+
+
+# --- html.parser 백엔드 (순수 파이썬 대체 경로) ---------------------------------
+# 게시물 행마다 CSS를 다시 해석하지 않도록 셀렉터를 미리 컴파일
+_SOUP_ROWS = soupsieve.compile("div.list_content > div.symph_row:not(.list_notice)")
+_SOUP_TIMESTAMP = soupsieve.compile("div.list_time span.timestamp")
+_SOUP_TITLE = soupsieve.compile("span.subject_fixed")
+_SOUP_LIKE = soupsieve.compile("div.list_symph span")
+_SOUP_AUTHOR = soupsieve.compile("div.list_author span.nickname span")
+_SOUP_HIT = soupsieve.compile("div.list_hit span.hit")
+_SOUP_LINK = soupsieve.compile("a.list_subject")
+_SOUP_TITLE_LINK = soupsieve.compile("div.list_title a")
+_SOUP_CONTENT = [soupsieve.compile(selector) for selector in CONTENT_SELECTORS]
+
+
+def _class_filter(*names: str) -> Callable[[Optional[str]], bool]:
+    # 파싱 단계(SoupStrainer)에서는 class 값이 공백으로 나뉘기 전이므로 직접 분리해 비교
+    wanted = set(names)
+    return lambda value: bool(value) and not wanted.isdisjoint(value.split())
+
+
+# 목록 컨테이너와 본문 후보 컨테이너만 트리로 만들기 위한 필터
+_LIST_STRAINER = SoupStrainer("div", class_=_class_filter("list_content"))
+_CONTENT_STRAINER = SoupStrainer(
+    list(dict.fromkeys(selector.partition(".")[0] for selector in CONTENT_SELECTORS)),
+    class_=_class_filter(*(selector.partition(".")[2] for selector in CONTENT_SELECTORS)),
+)
+
+
+def _soup_text(tag) -> str:
+    return tag.get_text(strip=True) if tag is not None else ""
+
+
+def _parse_list_page_soup(html: str, base_url: str) -> List[Tuple[datetime, Post]]:
+    # 목록 컨테이너(div.list_content)만 트리로 만든 뒤 공지 제외 게시글 블록 추출
+    soup = BeautifulSoup(html, "html.parser", parse_only=_LIST_STRAINER)
+
+    rows = []
+    for post in _SOUP_ROWS.select(soup):
+        timestamp_span = _SOUP_TIMESTAMP.select_one(post)
+        if not timestamp_span:
+            continue
+        post_datetime = _parse_timestamp(timestamp_span.get_text(strip=True))
+        if post_datetime is None:
+            continue
+
+        link_tag = _SOUP_LINK.select_one(post) or _SOUP_TITLE_LINK.select_one(post)
+
+        rows.append(
+            (
+                post_datetime,
+                _build_post(
+                    post_datetime,
+                    title=_soup_text(_SOUP_TITLE.select_one(post)),
+                    like_text=_soup_text(_SOUP_LIKE.select_one(post)) or "0",
+                    author=_soup_text(_SOUP_AUTHOR.select_one(post)),
+                    hit_text=_soup_text(_SOUP_HIT.select_one(post)) or "0",
+                    href=link_tag.get("href") if link_tag else None,
+                    base_url=base_url,
+                ),
+            )
+        )
+
+    return rows
+
+
+def _extract_post_content_soup(html: str) -> Optional[str]:
+    # 한 번의 파싱으로 모든 본문 후보 컨테이너만 모은 뒤 우선순위대로 확인
+    candidates = BeautifulSoup(html, "html.parser", parse_only=_CONTENT_STRAINER)
+
+    for selector in _SOUP_CONTENT:
+        content = selector.select_one(candidates)
+        if content:
+            text = content.get_text("\n", strip=True)
+            if text:
+                return text
+
+    # 후보가 없을 때만 전체 문서를 파싱해 body 텍스트 사용
+    fallback = BeautifulSoup(html, "html.parser").select_one("body")
+    if fallback:
+        text = fallback.get_text("\n", strip=True)
+        if text:
+            return text
+
+    return None
+
+
+# --- lxml 백엔드 (빠른 경로) ------------------------------------------------------
+def _has_class(name: str) -> str:
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+def _css_to_xpath(selector: str) -> str:
+    # CONTENT_SELECTORS처럼 "tag.class" 형태의 단순 셀렉터만 변환
+    tag, _, class_name = selector.partition(".")
+    return f"descendant-or-self::{tag}[{_has_class(class_name)}]"
+
+
+if lxml is not None:
+    _LXML_ROWS = etree.XPath(
+        f"./div[{_has_class('symph_row')} and not({_has_class('list_notice')})]"
+    )
+    _LXML_TIMESTAMP = etree.XPath(
+        f".//div[{_has_class('list_time')}]//span[{_has_class('timestamp')}]"
+    )
+    _LXML_TITLE = etree.XPath(f".//span[{_has_class('subject_fixed')}]")
+    _LXML_LIKE = etree.XPath(f".//div[{_has_class('list_symph')}]//span")
+    _LXML_AUTHOR = etree.XPath(
+        f".//div[{_has_class('list_author')}]//span[{_has_class('nickname')}]//span"
+    )
+    _LXML_HIT = etree.XPath(f".//div[{_has_class('list_hit')}]//span[{_has_class('hit')}]")
+    _LXML_LINK = etree.XPath(f".//a[{_has_class('list_subject')}]/@href")
+    _LXML_TITLE_LINK = etree.XPath(f".//div[{_has_class('list_title')}]//a/@href")
+    # script/style 안의 문자열은 BeautifulSoup get_text와 마찬가지로 제외
+    _LXML_TEXT = etree.XPath(".//text()[not(ancestor::script or ancestor::style or ancestor::template)]")
+    _LXML_CONTENT = [etree.XPath(_css_to_xpath(selector)) for selector in CONTENT_SELECTORS]
+    _LXML_BODY = etree.XPath("//body")
+
+# 스트리밍 파싱 시 한 번에 넣는 문자열 크기
+PULL_CHUNK_SIZE = 16 * 1024
+_CONTENT_MATCHERS = [selector.partition(".")[::2] for selector in CONTENT_SELECTORS]
+_CONTENT_TAGS = list(dict.fromkeys(tag for tag, _ in _CONTENT_MATCHERS))
+
+
+def _element_has_class(element, name: str) -> bool:
+    return name in (element.get("class") or "").split()
+
+
+def _lxml_closed_elements(html: str, tags: List[str]):
+    """
+    Feed the document to an lxml pull parser in chunks and yield each closed element of the given tags.
+
+    Callers stop iterating as soon as they have what they need, so the rest of
+    the page (e.g. long comment sections) is never parsed.
+    """
+    if not html.strip():
+        return
+    parser = etree.HTMLPullParser(events=("end",), tag=tags)
+    for start in range(0, len(html), PULL_CHUNK_SIZE):
+        parser.feed(html[start:start + PULL_CHUNK_SIZE])
+        for _, element in parser.read_events():
+            yield element
+    parser.close()
+    for _, element in parser.read_events():
+        yield element
+
+
+def _lxml_list_container(html: str):
+    # div.list_content가 닫히는 즉시 파싱 중단
+    for element in _lxml_closed_elements(html, ["div"]):
+        if _element_has_class(element, "list_content"):
+            return element
+    return None
+
+
+def _lxml_first(query: Callable, node):
+    matches = query(node)
+    return matches[0] if matches else None
+
+
+def _lxml_text(node, separator: str = "") -> str:
+    if node is None:
+        return ""
+    return separator.join(piece.strip() for piece in _LXML_TEXT(node) if piece.strip())
+
+
+def _parse_list_page_lxml(html: str, base_url: str) -> List[Tuple[datetime, Post]]:
+    container = _lxml_list_container(html)
+    if container is None:
+        return []
+
+    rows = []
+    for post in _LXML_ROWS(container):
+        timestamp_span = _lxml_first(_LXML_TIMESTAMP, post)
+        if timestamp_span is None:
+            continue
+        post_datetime = _parse_timestamp(_lxml_text(timestamp_span))
+        if post_datetime is None:
+            continue
+
+        href = _lxml_first(_LXML_LINK, post) or _lxml_first(_LXML_TITLE_LINK, post)
+
+        rows.append(
+            (
+                post_datetime,
+                _build_post(
+                    post_datetime,
+                    title=_lxml_text(_lxml_first(_LXML_TITLE, post)),
+                    like_text=_lxml_text(_lxml_first(_LXML_LIKE, post)) or "0",
+                    author=_lxml_text(_lxml_first(_LXML_AUTHOR, post)),
+                    hit_text=_lxml_text(_lxml_first(_LXML_HIT, post)) or "0",
+                    href=str(href) if href else None,
+                    base_url=base_url,
+                ),
+            )
+        )
+
+    return rows
+
+
+def _extract_post_content_lxml(html: str) -> Optional[str]:
+    # 한 번의 스트리밍 파싱으로 셀렉터별 첫 후보를 모으고, 최우선 후보를 찾으면 바로 중단
+    candidates: List[Optional[object]] = [None] * len(_CONTENT_MATCHERS)
+    for element in _lxml_closed_elements(html, _CONTENT_TAGS):
+        for index, (tag, class_name) in enumerate(_CONTENT_MATCHERS):
+            if candidates[index] is None and element.tag == tag and _element_has_class(element, class_name):
+                candidates[index] = element
+        if candidates[0] is not None and _lxml_text(candidates[0]):
+            break
+
+    for content in candidates:
+        if content is not None:
+            text = _lxml_text(content, "\n")
+            if text:
+                return text
+
+    # 후보가 없을 때만 전체 문서를 파싱해 body 텍스트 사용
+    if not html.strip():
+        return None
+    fallback = _lxml_first(_LXML_BODY, lxml.html.fromstring(html))
+    if fallback is not None:
+        text = _lxml_text(fallback, "\n")
+        if text:
+            return text
+
+    return None
+
+
+def parse_list_page(html: str, base_url: str = LIST_BASE_URL) -> List[Tuple[datetime, Post]]:
+    """
+    Parse a board list page into (post datetime, Post) pairs in board order.
+    """
+    if get_parser_backend() == "lxml":
+        return _parse_list_page_lxml(html, base_url)
+    return _parse_list_page_soup(html, base_url)
+
+
+def extract_post_content(html: str) -> Optional[str]:
+    """
+    Extract the main textual content from an individual post page.
+    """
+    if get_parser_backend() == "lxml":
+        return _extract_post_content_lxml(html)
+    return _extract_post_content_soup(html)
@@ -0,0 +1,71 @@
+import re
+from datetime import datetime
+from typing import NamedTuple, Optional, Tuple
+
+# 게시물 URL 예: https://www.clien.net/service/board/park/19085009?od=T31&po=1
+POST_ID_PATTERN = re.compile(r"/board/[^/?#]+/(\d+)")
+TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+DISPLAY_TIME_FORMAT = "%H:%M"
+
+
+def parse_post_id(url: str) -> Optional[int]:
+    """
+    Extract the numeric post ID from a Clien post URL.
+    """
+    match = POST_ID_PATTERN.search(url or "")
+    return int(match.group(1)) if match else None
+
+
+class Post(NamedTuple):
+    """
+    One list-page post with native field types; strings are formatted only for output.
+    """
+
+    post_id: Optional[int]
+    posted_at: datetime
+    recommendations: int
+    views: int
+    author: str
+    title: str
+    url: str
+    # 불용어를 제외한 제목 토큰(clien_tokens.tokenize_posts가 한 번만 계산해 기록)
+    tokens: Optional[Tuple[str, ...]] = None
+
+    @property
+    def timestamp(self) -> str:
+        return self.posted_at.strftime(TIMESTAMP_FORMAT)
+
+    @property
+    def display_time(self) -> str:
+        return self.posted_at.strftime(DISPLAY_TIME_FORMAT)
+
+    def with_tokens(self, tokens: Tuple[str, ...]) -> "Post":
+        # tokens는 마지막 필드이므로 _replace보다 빠른 튜플 연결로 교체
+        return self._make(self[:-1] + (tokens,))
+
+    def to_dict(self) -> dict:
+        """
+        Convert to a JSON-serializable dict (e.g. for the incremental state file).
+        """
+        return {
+            "post_id": self.post_id,
+            "timestamp": self.timestamp,
+            "recommendations": self.recommendations,
+            "views": self.views,
+            "author": self.author,
+            "title": self.title,
+            "url": self.url,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Post":
+        url = data.get("url", "")
+        return cls(
+            post_id=data.get("post_id") or parse_post_id(url),
+            posted_at=datetime.strptime(data["timestamp"], TIMESTAMP_FORMAT),
+            recommendations=int(data.get("recommendations", 0)),
+            views=int(data.get("views", 0)),
+            author=data.get("author", ""),
+            title=data.get("title", ""),
+            url=url,
+        )
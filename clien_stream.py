@@ -0,0 +1,102 @@
+from datetime import date, datetime
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
+
+import requests
+
+from clien_http import http_get
+from clien_parser import LIST_BASE_URL, parse_list_page
+from clien_post import Post
+
+# 목록 페이지는 위치(po)로 요청하고 새 글이 올라오면 게시물이 뒤 페이지로 밀리므로
+# 이전 실행의 응답과 새 응답을 섞지 않도록 캐시하지 않음(0이면 응답 캐시를 거치지 않음)
+LIST_PAGE_CACHE_TTL = 0
+
+
+def fetch_list_page(
+    page_num: int, cache_ttl: Optional[float] = LIST_PAGE_CACHE_TTL
+) -> Optional[List[Tuple[datetime, Post]]]:
+    """
+    Fetch and parse one board list page. Returns None when the request fails.
+    """
+    params = {"od": "T31", "category": "0", "po": page_num}
+
+    try:
+        response = http_get(LIST_BASE_URL, params=params, cache_ttl=cache_ttl)
+        response.raise_for_status()
+    except requests.exceptions.RequestException as e:
+        print(f"Request failed while fetching page {page_num}: {e}")
+        return None
+
+    return parse_list_page(response.text)
+
+
+def unique_posts(posts: Iterable[Post]) -> Iterator[Post]:
+    """
+    Yield posts in order, skipping posts (by post ID, or URL without one) already yielded.
+
+    List pages are addressed by position, so a post pushed down by new posts
+    between two page requests shows up again on the next page.
+    """
+    seen: Set[Union[int, str]] = set()
+    for post in posts:
+        key = post.post_id if post.post_id is not None else post.url
+        if key in seen:
+            continue
+        seen.add(key)
+        yield post
+
+
+def iter_clien_posts(
+    oldest_date: date,
+    start_page: int = 0,
+    cache_ttl: Optional[float] = LIST_PAGE_CACHE_TTL,
+) -> Iterator[Tuple[datetime, Post]]:
+    """
+    Yield (post datetime, post) pairs in board order, page by page, until the
+    first post older than oldest_date.
+    """
+    page_num = start_page
+    # 페이지 사이에 밀려 내려온 게시물은 한 번만 내보냄
+    seen: Set[Union[int, str]] = set()
+
+    while True:
+        rows = fetch_list_page(page_num, cache_ttl)
+        if rows is None:
+            return
+
+        if not rows:
+            print("No posts were returned for the current page. Stopping.")
+            return
+
+        for post_datetime, post in rows:
+            if post_datetime.date() < oldest_date:
+                print(f"Found posts older than {oldest_date.strftime('%Y-%m-%d')} on page {page_num}. Stopping.")
+                return
+            key = post.post_id if post.post_id is not None else post.url
+            if key in seen:
+                continue
+            seen.add(key)
+            yield post_datetime, post
+
+        print(f"Completed scraping page {page_num}.")
+        page_num += 1
+
+
+def route_posts_by_date(
+    posts: Iterable[Tuple[datetime, Post]],
+    sinks: Dict[date, Callable[[Post], None]],
+) -> Dict[date, int]:
+    """
+    Send each post to the sink registered for its date; posts of other dates are dropped.
+
+    Returns the number of posts routed to each date.
+    """
+    counts = {target_date: 0 for target_date in sinks}
+    for post_datetime, post in posts:
+        post_date = post_datetime.date()
+        sink = sinks.get(post_date)
+        if sink is None:
+            continue
+        sink(post)
+        counts[post_date] += 1
+    return counts
@@ -0,0 +1,618 @@
+import argparse
+import os
+import re
+import threading
+import time
+from concurrent.futures import Executor, Future, ThreadPoolExecutor, wait
+from pathlib import Path
+from typing import Callable, List, Optional, Tuple
+
+try:
+    import google.generativeai as genai
+except ImportError:
+    genai = None
+
+from dotenv import load_dotenv
+
+from clien_summary_cache import SummaryCache
+
+GEMINI_MODEL_NAME = "gemini-2.5-flash"
+GEMINI_SUMMARY_PROMPT = (
+    "다음은 커뮤니티의 주요 이슈 게시물들을 모아놓은 텍스트입니다. "
+    "전체 내용을 핵심만 간추려 3~5 문장의 완성된 문단으로 요약해주세요.\n\n"
+    "---[원문]---\n"
+)
+# 게시물이 많아 여러 묶음으로 나눠 요약할 때: 묶음별 요약(map) 후 합쳐서 최종 요약(reduce)
+GEMINI_CHUNK_PROMPT = (
+    "다음은 커뮤니티의 주요 이슈 게시물 중 일부입니다. "
+    "나중에 다른 부분의 요약과 합칠 수 있도록 핵심 사실과 쟁점을 빠짐없이 간추려 요약해주세요.\n\n"
+    "---[원문]---\n"
+)
+# 요약 캐시 사용 시 게시물 하나씩 요약(추천/조회수, 게시물 번호는 넣지 않아 내용이 같으면 재사용)
+GEMINI_POST_PROMPT = (
+    "다음은 커뮤니티의 주요 이슈 게시물 하나입니다. "
+    "나중에 다른 게시물의 요약과 합칠 수 있도록 핵심 사실과 쟁점을 1~3 문장으로 요약해주세요.\n\n"
+    "---[원문]---\n"
+)
+# 부분 요약이 많아 한 번에 합칠 수 없을 때 중간 단계에서 사용
+GEMINI_MERGE_PROMPT = (
+    "다음은 커뮤니티의 주요 이슈 게시물들을 여러 부분으로 나눠 요약한 결과 중 일부입니다. "
+    "나중에 다른 부분의 요약과 합칠 수 있도록 핵심 사실과 쟁점을 빠짐없이 하나로 합쳐 요약해주세요.\n\n"
+)
+GEMINI_REDUCE_PROMPT = (
+    "다음은 커뮤니티의 주요 이슈 게시물들을 여러 부분으로 나눈 것으로, 각 부분은 요약 또는 원문입니다. "
+    "전체 내용을 핵심만 간추려 3~5 문장의 완성된 문단으로 요약해주세요.\n\n"
+)
+# 이슈 파일에서 게시물 사이에 넣는 구분선과 게시물 시작 줄
+ISSUE_ENTRY_SEPARATOR = "\n\n" + ("-" * 80) + "\n\n"
+ISSUE_ENTRY_PATTERN = re.compile(r"^\[Post \d+\]$", re.MULTILINE)
+# 실행마다 달라지는 줄(게시물 번호, 추천/조회수)
+_VOLATILE_ENTRY_LINE = re.compile(r"^(?:\[Post \d+\]|Rec \d+ / Views \d+ / .*)\n?", re.MULTILINE)
+TRUNCATED_MARK = "\n...(이하 생략)"
+
+# single: 본문을 모두 받아 파일로 저장한 뒤 요약
+# pipelined: 본문을 받는 동안 묶음이 찰 때마다 요약을 시작하고 마지막에 합침
+SUMMARY_MODES = ("single", "pipelined")
+_summary_mode = "single"
+# gemini: Gemini API, fake: API 키 없이 동작하는 로컬 StubSummaryModel(테스트용)
+SUMMARY_BACKENDS = ("gemini", "fake")
+_summary_backend = "gemini"
+# 요약 호출 한 번의 프롬프트 상한(추정 토큰, 지시문 포함). 넘으면 [Post N] 단위로 나눠 요약한 뒤 합침
+SUMMARY_CHUNK_TOKENS = 12000
+SUMMARY_WORKERS = 4
+# 설정하면 모든 요약 호출을 캐시하고, 예산을 넘는 이슈는 게시물 단위로 요약해 바뀌지 않은 게시물은 다시 요약하지 않음
+_summary_cache: Optional[SummaryCache] = None
+
+# 프롬프트를 받아 요약문을 돌려주는 모델(Gemini 또는 테스트용 StubSummaryModel)
+SummaryModel = Callable[[str], str]
+
+
+def set_summary_mode(mode: str) -> None:
+    """
+    Select how issue posts are summarized: "single" or "pipelined".
+    """
+    global _summary_mode
+
+    if mode not in SUMMARY_MODES:
+        raise ValueError(f"지원하지 않는 요약 방식입니다: {mode} (사용 가능: {', '.join(SUMMARY_MODES)})")
+    _summary_mode = mode
+
+
+def get_summary_mode() -> str:
+    return _summary_mode
+
+
+def set_summary_backend(backend: str) -> None:
+    """
+    Select the summary model: "gemini" or "fake" (local StubSummaryModel).
+    """
+    global _summary_backend
+
+    if backend not in SUMMARY_BACKENDS:
+        raise ValueError(
+            f"지원하지 않는 요약 모델입니다: {backend} (사용 가능: {', '.join(SUMMARY_BACKENDS)})"
+        )
+    _summary_backend = backend
+
+
+def get_summary_backend() -> str:
+    return _summary_backend
+
+
+def set_summary_cache(cache: Optional[SummaryCache]) -> None:
+    """
+    Enable (or disable with None) the persistent summary cache.
+    """
+    global _summary_cache
+
+    _summary_cache = cache
+
+
+def get_summary_cache() -> Optional[SummaryCache]:
+    return _summary_cache
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Estimate the token count of text without calling the API.
+
+    Hangul and other non-ASCII characters count one token each and ASCII
+    text one token per four characters. This errs high for Korean, so chunks
+    packed against the estimate stay within the real budget.
+    """
+    ascii_chars = len(text.encode("ascii", "ignore"))
+    return len(text) - ascii_chars + (ascii_chars + 3) // 4
+
+
+def _truncate_to_tokens(text: str, max_tokens: int) -> str:
+    budget = max(1, max_tokens - estimate_tokens(TRUNCATED_MARK))
+    tokens = estimate_tokens(text)
+    while tokens > budget:
+        text = text[: max(1, int(len(text) * budget / tokens * 0.95))]
+        tokens = estimate_tokens(text)
+    return text + TRUNCATED_MARK
+
+
+def split_issue_text(text: str) -> Tuple[str, List[str]]:
+    """
+    Split an issue file into its header ("Top keyword: ...") and [Post N] entries.
+    """
+    starts = [match.start() for match in ISSUE_ENTRY_PATTERN.finditer(text)]
+    if not starts:
+        return "", [text.strip()] if text.strip() else []
+
+    separator = ISSUE_ENTRY_SEPARATOR.strip()
+    entries = []
+    for start, end in zip(starts, starts[1:] + [len(text)]):
+        entry = text[start:end].strip()
+        if entry.endswith(separator):
+            entry = entry[: -len(separator)].rstrip()
+        entries.append(entry)
+    return text[: starts[0]].strip(), entries
+
+
+def pack_entries(entries: List[str], max_tokens: int = SUMMARY_CHUNK_TOKENS) -> List[List[str]]:
+    """
+    Group consecutive entries into chunks of at most max_tokens estimated tokens.
+
+    Entries are never split across chunks; an entry over the budget on its
+    own is truncated to fit.
+    """
+    separator_tokens = estimate_tokens(ISSUE_ENTRY_SEPARATOR)
+    chunks: List[List[str]] = []
+    chunk: List[str] = []
+    used = 0
+    for entry in entries:
+        tokens = estimate_tokens(entry)
+        if tokens > max_tokens:
+            entry = _truncate_to_tokens(entry, max_tokens)
+            tokens = estimate_tokens(entry)
+        if chunk and used + separator_tokens + tokens > max_tokens:
+            chunks.append(chunk)
+            chunk, used = [], 0
+        used += tokens + (separator_tokens if chunk else 0)
+        chunk.append(entry)
+    if chunk:
+        chunks.append(chunk)
+    return chunks
+
+
+def _with_header(header: str, text: str) -> str:
+    return f"{header}\n\n{text}" if header else text
+
+
+def _text_budget(max_tokens: int, header: str = "") -> int:
+    # max_tokens는 프롬프트 전체 상한이므로 가장 긴 지시문과 머리말 몫을 빼고 본문에 배정
+    overhead = max(
+        estimate_tokens(prompt)
+        for prompt in (
+            GEMINI_SUMMARY_PROMPT,
+            GEMINI_CHUNK_PROMPT,
+            GEMINI_POST_PROMPT,
+            GEMINI_MERGE_PROMPT,
+            GEMINI_REDUCE_PROMPT,
+        )
+    )
+    if header:
+        overhead += estimate_tokens(header) + 1
+    return max(1, max_tokens - overhead)
+
+
+def _summary_part(index: int, summary: str) -> str:
+    return f"---[Part {index} 요약]---\n{summary}"
+
+
+def _raw_part(index: int, text: str) -> str:
+    return f"---[Part {index} 원문]---\n{text}"
+
+
+def post_summary_prompt(entry: str, max_tokens: int = SUMMARY_CHUNK_TOKENS) -> str:
+    """
+    Build the prompt summarizing one [Post N] entry on its own, at most
+    max_tokens estimated tokens including the instructions.
+
+    The post number and the Rec/Views line are left out, so the same post
+    gives the same prompt (and cache key) in every today/yesterday/daily run.
+    """
+    text = _VOLATILE_ENTRY_LINE.sub("", entry).strip()
+    budget = _text_budget(max_tokens)
+    if estimate_tokens(text) > budget:
+        text = _truncate_to_tokens(text, budget)
+    return f"{GEMINI_POST_PROMPT}{text}"
+
+
+def _post_part(entry: str, summary: str) -> str:
+    label = entry.split("\n", 1)[0]
+    return f"---{label} 요약---\n{summary}" if ISSUE_ENTRY_PATTERN.match(label) else f"---요약---\n{summary}"
+
+
+def reduce_summaries(
+    model: SummaryModel,
+    parts: List[str],
+    header: str = "",
+    max_tokens: int = SUMMARY_CHUNK_TOKENS,
+    executor: Optional[Executor] = None,
+) -> str:
+    """
+    Merge labelled parts (chunk summaries or raw chunks) into one summary.
+
+    While the parts together don't fit in one prompt of max_tokens,
+    consecutive parts are packed into groups within the budget and each
+    group is merged concurrently with GEMINI_MERGE_PROMPT; the last call
+    uses GEMINI_REDUCE_PROMPT. No prompt exceeds max_tokens.
+    """
+    budget = _text_budget(max_tokens, header)
+    parts = [_truncate_to_tokens(part, budget) if estimate_tokens(part) > budget else part for part in parts]
+    while len(parts) > 1 and estimate_tokens("\n\n".join(parts)) > budget:
+        groups = pack_entries(parts, budget)
+        if len(groups) == len(parts):
+            # 부분 하나하나가 예산을 거의 다 쓰면 절반씩 잘라 두 개씩 묶어 단계마다 반드시 줄어들게 함
+            half = max(1, (budget - 1) // 2)
+            parts = [_truncate_to_tokens(part, half) if estimate_tokens(part) > half else part for part in parts]
+            groups = [parts[start:start + 2] for start in range(0, len(parts), 2)]
+        prompts = [GEMINI_MERGE_PROMPT + _with_header(header, "\n\n".join(group)) for group in groups]
+        merged = executor.map(model, prompts) if executor is not None else map(model, prompts)
+        parts = [_summary_part(index, summary) for index, summary in enumerate(merged, 1)]
+    return model(GEMINI_REDUCE_PROMPT + _with_header(header, "\n\n".join(parts)))
+
+
+def map_reduce_summarize(
+    text: str,
+    model: SummaryModel,
+    max_tokens: int = SUMMARY_CHUNK_TOKENS,
+    workers: int = SUMMARY_WORKERS,
+    per_post: bool = False,
+) -> str:
+    """
+    Summarize an issue file with prompts of at most max_tokens estimated tokens.
+
+    A file within the budget is summarized in one call with
+    GEMINI_SUMMARY_PROMPT, as before. Larger files are split on [Post N]
+    boundaries, the chunks are summarized concurrently and the chunk
+    summaries are merged by reduce_summaries, so the number of calls grows
+    linearly with the file size while each call stays the same size.
+
+    With per_post (used with a summary cache), a file over the budget is
+    summarized post by post with post_summary_prompt instead of in chunks
+    and the post summaries are merged, so a cached model only pays for
+    posts it has not seen before. A file within the budget still takes the
+    single call, which the cache stores as a whole.
+    """
+    header, entries = split_issue_text(text)
+    budget = _text_budget(max_tokens, header)
+    if estimate_tokens(text) <= budget:
+        return model(f"{GEMINI_SUMMARY_PROMPT}{text}")
+
+    if per_post and len(entries) > 1:
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+            prompts = [post_summary_prompt(entry, max_tokens) for entry in entries]
+            parts = [_post_part(entry, summary) for entry, summary in zip(entries, executor.map(model, prompts))]
+            return reduce_summaries(model, parts, header, max_tokens, executor)
+
+    chunks = [ISSUE_ENTRY_SEPARATOR.join(chunk) for chunk in pack_entries(entries, budget)]
+    if len(chunks) == 1:
+        # 게시물 하나가 너무 길어 잘라낸 경우
+        return model(f"{GEMINI_SUMMARY_PROMPT}{_with_header(header, chunks[0])}")
+
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+        summaries = executor.map(
+            model, [f"{GEMINI_CHUNK_PROMPT}{_with_header(header, chunk)}" for chunk in chunks]
+        )
+        parts = [_summary_part(index, summary) for index, summary in enumerate(summaries, 1)]
+        return reduce_summaries(model, parts, header, max_tokens, executor)
+
+
+def gemini_summary_model(api_key: str) -> Tuple[Optional[SummaryModel], Optional[str]]:
+    """
+    Build a SummaryModel backed by the Gemini API, or return the reason it can't be used.
+    """
+    if genai is None:
+        return None, "google-generativeai 라이브러리가 설치되지 않았습니다."
+
+    if not api_key or "YOUR_GEMINI_API_KEY" in api_key:
+        return None, "Gemini API 키가 설정되지 않았습니다."
+
+    genai.configure(api_key=api_key)
+    model = genai.GenerativeModel(GEMINI_MODEL_NAME)
+    return lambda prompt: model.generate_content(prompt).text, None
+
+
+def cached_summary_model(model: SummaryModel, model_name: str, cache: SummaryCache) -> SummaryModel:
+    """
+    Wrap a SummaryModel so identical prompts to the same model are answered from cache.
+    """
+
+    def summarize(prompt: str) -> str:
+        key = cache.make_key(model_name, prompt)
+        summary = cache.get(key)
+        if summary is None:
+            summary = model(prompt)
+            # 빈 응답은 저장하지 않아 다음 실행에서 다시 요청
+            if summary and summary.strip():
+                cache.put(key, model_name, summary)
+        return summary
+
+    return summarize
+
+
+def summary_model(api_key: str) -> Tuple[Optional[SummaryModel], Optional[str]]:
+    """
+    Build the SummaryModel for the selected backend (see set_summary_backend),
+    answered from the summary cache when one is set.
+    """
+    if _summary_backend == "fake":
+        model, model_name = StubSummaryModel(), "fake"
+    else:
+        model, error = gemini_summary_model(api_key)
+        if model is None:
+            return None, error
+        model_name = GEMINI_MODEL_NAME
+
+    cache = _summary_cache
+    if cache is not None:
+        return cached_summary_model(model, model_name, cache), None
+    return model, None
+
+
+def _checked_summary(summary: Optional[str]) -> Tuple[Optional[str], Optional[str]]:
+    # 빈 응답은 빈 요약 파일로 저장하지 않고 실패로 처리
+    if not summary or not summary.strip():
+        return None, "요약 모델이 빈 요약을 반환했습니다."
+    return summary, None
+
+
+def summarize_issue_text(text: str, api_key: str) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Summarize an issue file with the selected backend within the token budget.
+    """
+    try:
+        model, error = summary_model(api_key)
+        if model is None:
+            return None, error
+        return _checked_summary(map_reduce_summarize(text, model, per_post=_summary_cache is not None))
+
+    except Exception as e:
+        return None, f"요약 API 호출 중 오류가 발생했습니다: {e}"
+
+
+# 가짜 모델 요약문에 들어가는 게시물 번호 범위 예: [Post 1-14]
+_POST_RANGE_PATTERN = re.compile(r"\[Post (\d+)(?:-(\d+))?\]")
+
+
+def _post_ranges(numbers: List[int]) -> List[str]:
+    # 연속된 번호는 [Post 3-7]처럼 묶어 표시
+    ranges: List[List[int]] = []
+    for number in numbers:
+        if ranges and number == ranges[-1][1] + 1:
+            ranges[-1][1] = number
+        else:
+            ranges.append([number, number])
+    return [f"[Post {first}]" if first == last else f"[Post {first}-{last}]" for first, last in ranges]
+
+
+class StubSummaryModel:
+    """
+    Local stand-in for Gemini that returns a short digest of the prompt.
+
+    Each call waits delay seconds plus delay_per_kchar per 1000 prompt
+    characters (longer inputs take longer, as with the real API). The digest
+    lists the [Post N] numbers the prompt covers, including those named in
+    earlier digests, so a map/reduce result can be checked for coverage
+    without an API key. Calls are recorded in calls as (started, finished, prompt).
+    """
+
+    def __init__(self, delay: float = 0.0, delay_per_kchar: float = 0.0) -> None:
+        self.delay = delay
+        self.delay_per_kchar = delay_per_kchar
+        self.calls: List[Tuple[float, float, str]] = []
+        self._lock = threading.Lock()
+
+    def __call__(self, prompt: str) -> str:
+        started = time.time()
+        wait = self.delay + self.delay_per_kchar * len(prompt) / 1000
+        if wait:
+            time.sleep(wait)
+        numbers = set()
+        for first, last in _POST_RANGE_PATTERN.findall(prompt):
+            numbers.update(range(int(first), int(last or first) + 1))
+        digest = f"{len(numbers)} posts {' '.join(_post_ranges(sorted(numbers)))} ({len(prompt)} chars)"
+        with self._lock:
+            self.calls.append((started, time.time(), prompt))
+        return digest
+
+
+class PipelinedSummarizer:
+    """
+    Summarize issue entries while the remaining post bodies are still being fetched.
+
+    add() collects entries in [Post N] order into chunks that fit in a
+    prompt of max_tokens estimated tokens; once a chunk is followed by
+    another it is summarized on a worker thread. close() makes one final call with every
+    chunk in order: its summary if that has finished, otherwise its raw text
+    (the last chunk always goes in raw), so no model call is waited on twice
+    once fetching ends. If that would exceed max_tokens, every chunk is
+    summarized and the summaries are merged by reduce_summaries instead.
+    When everything fits in one chunk, the single call uses
+    GEMINI_SUMMARY_PROMPT on the same text "single" mode would send.
+
+    With per_post, entries are still collected while they fit in one
+    prompt, so a small issue takes the same single call. Once they no
+    longer fit, every entry is summarized on its own (see
+    post_summary_prompt) instead of in chunks, and close() waits for every
+    post summary, so each one reaches a cached model's cache and an
+    unchanged post is not summarized again next run.
+    close() returns only after calls already running have finished, so a
+    cache can be closed right after it.
+    """
+
+    def __init__(
+        self,
+        model: SummaryModel,
+        header: str = "",
+        max_tokens: int = SUMMARY_CHUNK_TOKENS,
+        workers: int = SUMMARY_WORKERS,
+        per_post: bool = False,
+    ) -> None:
+        self.model = model
+        self.header = header
+        self.max_tokens = max_tokens
+        self.per_post = per_post
+        # 지시문과 머리말을 뺀 본문 예산
+        self._budget = _text_budget(max_tokens, header)
+        self._executor = ThreadPoolExecutor(max_workers=max(1, workers))
+        self._separator_tokens = estimate_tokens(ISSUE_ENTRY_SEPARATOR)
+        self._chunk: List[str] = []
+        self._chunk_tokens = 0
+        # 요약을 시작한 묶음(또는 게시물)의 (원문, 요약 작업)
+        self._chunk_summaries: List[Tuple[str, "Future[str]"]] = []
+
+    def _submit_chunk(self) -> None:
+        text = ISSUE_ENTRY_SEPARATOR.join(self._chunk)
+        prompt = f"{GEMINI_CHUNK_PROMPT}{_with_header(self.header, text)}"
+        self._chunk_summaries.append((text, self._executor.submit(self.model, prompt)))
+        self._chunk, self._chunk_tokens = [], 0
+
+    def _submit_post(self, entry: str) -> None:
+        prompt = post_summary_prompt(entry, self.max_tokens)
+        self._chunk_summaries.append((entry, self._executor.submit(self.model, prompt)))
+
+    def add(self, entry: str) -> None:
+        if self.per_post and self._chunk_summaries:
+            self._submit_post(entry)
+            return
+
+        tokens = estimate_tokens(entry)
+        if tokens > self._budget:
+            entry = _truncate_to_tokens(entry, self._budget)
+            tokens = estimate_tokens(entry)
+        # 현재 묶음에 더 들어가지 않으면 요약을 시작하고 새 묶음으로 넘어감
+        if self._chunk and self._chunk_tokens + self._separator_tokens + tokens > self._budget:
+            if self.per_post:
+                # 한 번에 요약할 수 없게 되면 모아 둔 게시물부터 게시물 단위 요약으로 넘어감
+                for pending in self._chunk:
+                    self._submit_post(pending)
+                self._chunk, self._chunk_tokens = [], 0
+                self._submit_post(entry)
+                return
+            self._submit_chunk()
+        self._chunk_tokens += tokens + (self._separator_tokens if self._chunk else 0)
+        self._chunk.append(entry)
+
+    def _done_part(self, index: int, text: str, summary: str) -> str:
+        return _post_part(text, summary) if self.per_post else _summary_part(index, summary)
+
+    def close(self) -> Tuple[Optional[str], Optional[str]]:
+        """
+        Finish summarizing and return (summary, error) like summarize_issue_text.
+        """
+        last_chunk = ISSUE_ENTRY_SEPARATOR.join(self._chunk)
+        try:
+            if self.per_post:
+                # 게시물 요약은 모두 기다려 캐시에 남김(취소하면 다음 실행에서 다시 요약함)
+                wait([future for _, future in self._chunk_summaries])
+
+            if not self._chunk_summaries:
+                if not self._chunk:
+                    return None, None
+                # 묶음이 하나뿐이면 나누지 않고 기존 방식과 같은 프롬프트로 한 번에 요약
+                return _checked_summary(
+                    self.model(f"{GEMINI_SUMMARY_PROMPT}{_with_header(self.header, last_chunk)}")
+                )
+
+            # 끝난 묶음은 요약을, 아직 요약 중이거나 실패한 묶음과 마지막 묶음은 원문을 그대로 넣음
+            parts = [
+                self._done_part(index, text, future.result())
+                if future.done() and not future.cancelled() and future.exception() is None
+                else (text if self.per_post else _raw_part(index, text))
+                for index, (text, future) in enumerate(self._chunk_summaries, 1)
+            ]
+            if self._chunk:
+                parts.append(_raw_part(len(parts) + 1, last_chunk))
+
+            if estimate_tokens("\n\n".join(parts)) <= self._budget:
+                # 아직 시작하지 않은 묶음 요약은 취소하고, 진행 중인 호출을 기다리지 않고 최종 요약을 시작함
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                prompt = GEMINI_REDUCE_PROMPT + _with_header(self.header, "\n\n".join(parts))
+                return _checked_summary(self.model(prompt))
+
+            # 원문을 넣으면 예산을 넘으므로 마지막 묶음까지 모두 요약해 계층적으로 합침
+            if self._chunk:
+                self._submit_chunk()
+            parts = [
+                self._done_part(index, text, future.result())
+                for index, (text, future) in enumerate(self._chunk_summaries, 1)
+            ]
+            return _checked_summary(
+                reduce_summaries(self.model, parts, self.header, self.max_tokens, self._executor)
+            )
+
+        except Exception as e:
+            return None, f"요약 API 호출 중 오류가 발생했습니다: {e}"
+        finally:
+            # 진행 중인 호출이 끝난 뒤 반환해야 호출한 쪽이 요약 캐시를 닫아도 안전함
+            self._executor.shutdown(wait=True, cancel_futures=True)
+
+
+def pipelined_summarizer(api_key: str, header: str = "") -> Optional[PipelinedSummarizer]:
+    """
+    Return a PipelinedSummarizer for the selected backend in "pipelined" mode, else None.
+
+    None also means the model isn't available; callers then take the
+    single-call path, which reports why.
+    """
+    if _summary_mode != "pipelined":
+        return None
+    try:
+        model, _ = summary_model(api_key)
+    except Exception:
+        return None
+    if model is None:
+        return None
+    return PipelinedSummarizer(model, header, per_post=_summary_cache is not None)
+
+
+if __name__ == "__main__":
+    load_dotenv()
+    parser = argparse.ArgumentParser(
+        description="저장된 이슈 파일을 토큰 예산에 맞춰 나눠 요약합니다(map-reduce)."
+    )
+    parser.add_argument("issue_file", type=Path, help="요약할 이슈 파일 (예: data/YESTERDAY_ISSUE_251026.txt)")
+    parser.add_argument(
+        "--backend",
+        choices=SUMMARY_BACKENDS,
+        help="요약 모델 (fake: API 키 없이 동작하는 로컬 가짜 모델). 기본값: gemini",
+        default="gemini",
+    )
+    parser.add_argument(
+        "--max-tokens",
+        type=int,
+        help=f"요약 호출 한 번의 프롬프트 상한(추정 토큰). 기본값: {SUMMARY_CHUNK_TOKENS}",
+        default=SUMMARY_CHUNK_TOKENS,
+    )
+    parser.add_argument(
+        "--cache",
+        type=Path,
+        help="요약 캐시 파일 (예: data/summary_cache.sqlite3). 지정하면 예산을 넘는 이슈는 게시물 단위로 요약해 캐시를 재사용합니다.",
+    )
+    parser.add_argument("--plan", action="store_true", help="요약하지 않고 나누는 결과만 출력합니다.")
+    args = parser.parse_args()
+
+    text = args.issue_file.read_text(encoding="utf-8")
+    header, entries = split_issue_text(text)
+    chunks = pack_entries(entries, _text_budget(args.max_tokens, header))
+    print(f"{len(entries)} posts, ~{estimate_tokens(text)} tokens -> {len(chunks)} chunks")
+    for index, chunk in enumerate(chunks, 1):
+        print(f"  chunk {index}: {len(chunk)} posts, ~{estimate_tokens(ISSUE_ENTRY_SEPARATOR.join(chunk))} tokens")
+    if not args.plan:
+        set_summary_backend(args.backend)
+        if args.cache:
+            set_summary_cache(SummaryCache(args.cache))
+        model, error = summary_model(os.getenv("GEMINI_API_KEY", ""))
+        if model is None:
+            raise SystemExit(error)
+        started = time.perf_counter()
+        summary = map_reduce_summarize(text, model, args.max_tokens, per_post=_summary_cache is not None)
+        print(f"\n{summary}\n\n({time.perf_counter() - started:.2f} s)")
+        if _summary_cache is not None:
+            print(f"Summary cache: {_summary_cache.hits} hits / {_summary_cache.misses} misses")
+            _summary_cache.close()
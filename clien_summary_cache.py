@@ -0,0 +1,96 @@
+import hashlib
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+# data/ 폴더에 저장되는 요약 캐시 파일명과 전체 크기 상한
+SUMMARY_CACHE_DB_NAME = "summary_cache.sqlite3"
+DEFAULT_SUMMARY_CACHE_MAX_BYTES = 20 * 1024 * 1024
+
+
+class SummaryCache:
+    """
+    Persistent cache of model summaries keyed by a hash of model name and prompt.
+
+    The prompt contains the text being summarized, so an unchanged prompt
+    (a whole issue file, or one post's title and body) is answered from the
+    cache. Least recently used entries are evicted once the stored summaries
+    exceed max_bytes. hits and misses count lookups made through this object.
+    """
+
+    def __init__(self, db_path: Path, max_bytes: int = DEFAULT_SUMMARY_CACHE_MAX_BYTES) -> None:
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.db_path), timeout=30, check_same_thread=False)
+        with self._conn:
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS summaries (
+                    key TEXT PRIMARY KEY,
+                    model TEXT NOT NULL,
+                    summary TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    stored_at REAL NOT NULL,
+                    accessed_at REAL NOT NULL
+                )
+                """
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_summaries_accessed_at ON summaries (accessed_at)"
+            )
+
+    @staticmethod
+    def make_key(model: str, prompt: str) -> str:
+        return hashlib.sha256(f"{model}\0{prompt}".encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            row = self._conn.execute("SELECT summary FROM summaries WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            with self._conn:
+                self._conn.execute(
+                    "UPDATE summaries SET accessed_at = ? WHERE key = ?", (time.time(), key)
+                )
+        return row[0]
+
+    def put(self, key: str, model: str, summary: str) -> None:
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO summaries (key, model, summary, size, stored_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (key, model, summary, len(summary.encode("utf-8")), now, now),
+            )
+            self._evict()
+
+    def _evict(self) -> None:
+        # 전체 크기가 상한을 넘으면 가장 오래 사용되지 않은 항목부터 삭제
+        total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM summaries").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+
+        for key, size in self._conn.execute(
+            "SELECT key, size FROM summaries ORDER BY accessed_at"
+        ).fetchall():
+            self._conn.execute("DELETE FROM summaries WHERE key = ?", (key,))
+            total -= size
+            if total <= self.max_bytes:
+                break
+
+    def count(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM summaries").fetchone()[0]
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
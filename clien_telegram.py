@@ -0,0 +1,563 @@
+import argparse
+import json
+import os
+import random
+import sqlite3
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import ExitStack
+from pathlib import Path
+from typing import List, NamedTuple, Optional, Tuple
+
+import requests
+from dotenv import load_dotenv
+
+from clien_http import http_post
+
+# 텔레그램 Bot API 주소. 로컬 테스트 시 TELEGRAM_API_BASE로 가짜 서버(clien_fake_telegram.py)를 지정
+DEFAULT_TELEGRAM_API_BASE = "https://api.telegram.org"
+# 동시에 진행할 업로드 수
+TELEGRAM_UPLOAD_WORKERS = 3
+# sendMediaGroup 한 번에 보낼 수 있는 최대 파일 수
+MEDIA_GROUP_MAX_SIZE = 10
+
+# 전송에 실패한 파일을 보관했다가 다시 보내는 대기열(data/ 폴더)
+TELEGRAM_OUTBOX_DB_NAME = "telegram_outbox.sqlite3"
+# 재시도 간격: 2초에서 시작해 두 배씩 늘리고 1시간에서 멈춤
+OUTBOX_BASE_DELAY = 2.0
+OUTBOX_MAX_DELAY = 3600.0
+OUTBOX_MAX_ATTEMPTS = 10
+# 보고서 마지막에 대기열 재시도를 위해 최대 이만큼(초) 기다리고, 남은 항목은 다음 실행에서 전송
+OUTBOX_INLINE_WAIT = 60.0
+# 한 프로세스가 꺼낸 항목을 다른 프로세스가 중복 전송하지 않도록 잡아두는 시간(초)
+OUTBOX_CLAIM_SECONDS = 300.0
+
+
+class TelegramResult(NamedTuple):
+    sent: bool
+    error: Optional[str] = None
+    # 429 응답의 parameters.retry_after(초)
+    retry_after: Optional[float] = None
+    # 네트워크 오류/429/5xx처럼 나중에 다시 보내면 성공할 수 있는 실패인지 여부
+    retryable: bool = False
+
+
+def telegram_api_base() -> str:
+    return os.getenv("TELEGRAM_API_BASE", DEFAULT_TELEGRAM_API_BASE).rstrip("/")
+
+
+def _retry_after(response: requests.Response) -> Optional[float]:
+    try:
+        parameters = response.json().get("parameters") or {}
+    except ValueError:
+        parameters = {}
+    retry_after = parameters.get("retry_after") or response.headers.get("Retry-After")
+    try:
+        return float(retry_after) if retry_after is not None else None
+    except ValueError:
+        return None
+
+
+def _post_to_telegram(
+    method: str,
+    token: str,
+    data: dict,
+    files: dict,
+    failure_label: str,
+    error_label: str,
+) -> TelegramResult:
+    url = f"{telegram_api_base()}/bot{token}/{method}"
+    try:
+        response = http_post(url, data=data, files=files)
+    except requests.exceptions.RequestException as exc:
+        return TelegramResult(False, f"{error_label}: {exc}", retryable=True)
+    if response.ok:
+        return TelegramResult(True)
+    return TelegramResult(
+        False,
+        f"{failure_label} ({response.status_code}): {response.text}",
+        retry_after=_retry_after(response),
+        retryable=response.status_code == 429 or response.status_code >= 500,
+    )
+
+
+def _check_telegram_target(token: str, chat_id: str) -> Optional[str]:
+    if not token or "YOUR_TELEGRAM_BOT_TOKEN" in token:
+        return "텔레그램 봇 토큰이 설정되지 않았습니다."
+
+    if not chat_id or "YOUR_TELEGRAM_CHAT_ID" in chat_id:
+        return "텔레그램 chat_id가 설정되지 않았습니다."
+    return None
+
+
+def _send_document(
+    file_path: Path,
+    token: str,
+    chat_id: str,
+    caption: Optional[str] = None,
+) -> TelegramResult:
+    if not file_path.exists():
+        return TelegramResult(False, f"파일이 존재하지 않습니다: {file_path}")
+
+    target_error = _check_telegram_target(token, chat_id)
+    if target_error:
+        return TelegramResult(False, target_error)
+
+    # Telegram sendDocument API 호출
+    with file_path.open("rb") as file_obj:
+        return _post_to_telegram(
+            "sendDocument",
+            token,
+            data={"chat_id": chat_id, "caption": caption or ""},
+            files={"document": file_obj},
+            failure_label="텔레그램 전송 실패",
+            error_label="텔레그램 요청 중 오류가 발생했습니다",
+        )
+
+
+def _send_photo(
+    file_path: Path,
+    token: str,
+    chat_id: str,
+    caption: Optional[str] = None,
+) -> TelegramResult:
+    if not file_path.exists():
+        return TelegramResult(False, f"파일이 존재하지 않습니다: {file_path}")
+
+    target_error = _check_telegram_target(token, chat_id)
+    if target_error:
+        return TelegramResult(False, target_error)
+
+    with file_path.open("rb") as file_obj:
+        return _post_to_telegram(
+            "sendPhoto",
+            token,
+            data={"chat_id": chat_id, "caption": caption or ""},
+            files={"photo": file_obj},
+            failure_label="텔레그램 사진 전송 실패",
+            error_label="텔레그램 사진 전송 중 오류가 발생했습니다",
+        )
+
+
+# 대기열에 저장되는 전송 방식별 함수
+_SENDERS = {"sendDocument": _send_document, "sendPhoto": _send_photo}
+
+
+def send_file_via_telegram(
+    file_path: Path,
+    token: str,
+    chat_id: str,
+    caption: Optional[str] = None,
+) -> Tuple[bool, Optional[str]]:
+    """
+    Send a local file to Telegram using the bot API.
+    """
+    sent, error = _send_document(file_path, token, chat_id, caption)[:2]
+    return sent, error
+
+
+def send_photo_via_telegram(
+    file_path: Path,
+    token: str,
+    chat_id: str,
+    caption: Optional[str] = None,
+) -> Tuple[bool, Optional[str]]:
+    """
+    Send a local image file to Telegram using the bot API's sendPhoto.
+    """
+    sent, error = _send_photo(file_path, token, chat_id, caption)[:2]
+    return sent, error
+
+
+def _send_document_album(
+    documents: List[Tuple[Path, Optional[str]]],
+    token: str,
+    chat_id: str,
+) -> TelegramResult:
+    if not 2 <= len(documents) <= MEDIA_GROUP_MAX_SIZE:
+        return TelegramResult(False, f"sendMediaGroup은 파일 2~{MEDIA_GROUP_MAX_SIZE}개만 보낼 수 있습니다.")
+
+    for file_path, _ in documents:
+        if not file_path.exists():
+            return TelegramResult(False, f"파일이 존재하지 않습니다: {file_path}")
+
+    target_error = _check_telegram_target(token, chat_id)
+    if target_error:
+        return TelegramResult(False, target_error)
+
+    media = [
+        {"type": "document", "media": f"attach://document{position}", "caption": caption or ""}
+        for position, (_, caption) in enumerate(documents)
+    ]
+    with ExitStack() as stack:
+        files = {
+            f"document{position}": stack.enter_context(file_path.open("rb"))
+            for position, (file_path, _) in enumerate(documents)
+        }
+        return _post_to_telegram(
+            "sendMediaGroup",
+            token,
+            data={"chat_id": chat_id, "media": json.dumps(media, ensure_ascii=False)},
+            files=files,
+            failure_label="텔레그램 묶음 전송 실패",
+            error_label="텔레그램 요청 중 오류가 발생했습니다",
+        )
+
+
+def send_documents_via_telegram(
+    documents: List[Tuple[Path, Optional[str]]],
+    token: str,
+    chat_id: str,
+) -> Tuple[bool, Optional[str]]:
+    """
+    Send 2-10 (file, caption) documents as one album with sendMediaGroup.
+    """
+    sent, error = _send_document_album(documents, token, chat_id)[:2]
+    return sent, error
+
+
+class OutboxEntry(NamedTuple):
+    entry_id: int
+    method: str
+    file_path: Path
+    caption: Optional[str]
+    success_message: str
+    attempts: int
+    next_attempt_at: float
+    last_error: Optional[str]
+
+
+def outbox_retry_delay(attempts: int, retry_after: Optional[float] = None) -> float:
+    """
+    Seconds to wait before the next try after the given number of failed attempts.
+
+    Exponential backoff with +-20% jitter capped at OUTBOX_MAX_DELAY, never
+    shorter than Telegram's retry_after.
+    """
+    delay = OUTBOX_BASE_DELAY * 2 ** min(max(0, attempts - 1), 20)
+    delay = min(OUTBOX_MAX_DELAY, delay * random.uniform(0.8, 1.2))
+    return max(delay, retry_after or 0.0)
+
+
+class TelegramOutbox:
+    """
+    SQLite queue of Telegram uploads that failed and should be retried.
+
+    Entries keep the file path, caption and retry schedule (never the bot
+    token), so a later run or `python clien_telegram.py` can resend them.
+    Several processes may share one outbox: drain() claims an entry before
+    sending it so it is not sent twice.
+    """
+
+    def __init__(self, db_path: Path) -> None:
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.db_path), timeout=30, check_same_thread=False)
+        with self._conn:
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS telegram_outbox (
+                    entry_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    method TEXT NOT NULL,
+                    file_path TEXT NOT NULL,
+                    caption TEXT,
+                    success_message TEXT NOT NULL,
+                    attempts INTEGER NOT NULL,
+                    next_attempt_at REAL NOT NULL,
+                    last_error TEXT,
+                    created_at REAL NOT NULL
+                )
+                """
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_telegram_outbox_next ON telegram_outbox (next_attempt_at)"
+            )
+
+    def add(
+        self,
+        method: str,
+        file_path: Path,
+        caption: Optional[str],
+        success_message: str,
+        result: TelegramResult,
+        attempts: int = 1,
+    ) -> float:
+        """
+        Queue a failed upload and return when it will be retried (epoch seconds).
+        """
+        now = time.time()
+        next_attempt_at = now + outbox_retry_delay(attempts, result.retry_after)
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT INTO telegram_outbox (method, file_path, caption, success_message, "
+                "attempts, next_attempt_at, last_error, created_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    method,
+                    str(Path(file_path).resolve()),
+                    caption,
+                    success_message,
+                    attempts,
+                    next_attempt_at,
+                    result.error,
+                    now,
+                ),
+            )
+        return next_attempt_at
+
+    def entries(self) -> List[OutboxEntry]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT entry_id, method, file_path, caption, success_message, attempts, "
+                "next_attempt_at, last_error FROM telegram_outbox ORDER BY next_attempt_at, entry_id"
+            ).fetchall()
+        return [OutboxEntry(row[0], row[1], Path(row[2]), *row[3:]) for row in rows]
+
+    def next_attempt_at(self) -> Optional[float]:
+        with self._lock:
+            return self._conn.execute("SELECT MIN(next_attempt_at) FROM telegram_outbox").fetchone()[0]
+
+    def _claim(self, entry: OutboxEntry, now: float) -> bool:
+        # 다른 프로세스가 먼저 꺼냈으면 next_attempt_at이 이미 미래로 바뀌어 있음
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                "UPDATE telegram_outbox SET next_attempt_at = ? WHERE entry_id = ? AND next_attempt_at <= ?",
+                (now + OUTBOX_CLAIM_SECONDS, entry.entry_id, now),
+            )
+        return cursor.rowcount == 1
+
+    def _finish(self, entry_id: int) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM telegram_outbox WHERE entry_id = ?", (entry_id,))
+
+    def _reschedule(self, entry_id: int, attempts: int, next_attempt_at: float, error: Optional[str]) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(
+                "UPDATE telegram_outbox SET attempts = ?, next_attempt_at = ?, last_error = ? WHERE entry_id = ?",
+                (attempts, next_attempt_at, error, entry_id),
+            )
+
+    def _defer_due(self, until: float) -> None:
+        # 429를 받으면 같은 봇의 나머지 항목도 retry_after가 지날 때까지 미룸
+        with self._lock, self._conn:
+            self._conn.execute(
+                "UPDATE telegram_outbox SET next_attempt_at = ? WHERE next_attempt_at < ?",
+                (until, until),
+            )
+
+    def drain_once(self, token: str, chat_id: str) -> List[Tuple[bool, str]]:
+        """
+        Try every entry that is due now, one at a time (token and chat_id
+        are assumed to be set; see drain).
+
+        Sent entries are removed; retryable failures are rescheduled with
+        backoff (or dropped after OUTBOX_MAX_ATTEMPTS) and other failures are
+        dropped. Returns (sent, message) for each attempted entry.
+        """
+        results: List[Tuple[bool, str]] = []
+        now = time.time()
+        for entry in self.entries():
+            if entry.next_attempt_at > now:
+                break
+            if not self._claim(entry, now):
+                continue
+
+            result = _SENDERS[entry.method](entry.file_path, token, chat_id, entry.caption)
+            attempts = entry.attempts + 1
+            if result.sent:
+                self._finish(entry.entry_id)
+                results.append((True, entry.success_message))
+            elif result.retryable and attempts < OUTBOX_MAX_ATTEMPTS:
+                next_attempt_at = time.time() + outbox_retry_delay(attempts, result.retry_after)
+                self._reschedule(entry.entry_id, attempts, next_attempt_at, result.error)
+                results.append((False, f"{result.error or ''} (재시도 대기열: {attempts}회 실패, {entry.file_path.name})"))
+                if result.retry_after:
+                    self._defer_due(time.time() + result.retry_after)
+                    break
+            else:
+                self._finish(entry.entry_id)
+                results.append(
+                    (False, f"{result.error or ''} (재시도 중단: {attempts}회 실패, {entry.file_path.name})")
+                )
+            now = time.time()
+        return results
+
+    def drain(self, token: str, chat_id: str, wait: float = 0.0) -> List[Tuple[bool, str]]:
+        """
+        Send due entries, sleeping between retries for at most wait seconds.
+        """
+        # 토큰/chat_id가 없으면 항목을 버리지 않고 그대로 둠
+        target_error = _check_telegram_target(token, chat_id)
+        if target_error:
+            return [(False, target_error)] if self.count() else []
+
+        deadline = time.time() + wait
+        results = self.drain_once(token, chat_id)
+        while True:
+            next_attempt_at = self.next_attempt_at()
+            if next_attempt_at is None or next_attempt_at > deadline:
+                return results
+            time.sleep(max(0.0, next_attempt_at - time.time()))
+            results.extend(self.drain_once(token, chat_id))
+
+    def count(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM telegram_outbox").fetchone()[0]
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class TelegramDelivery:
+    """
+    Upload report artifacts to Telegram in the background as they are produced.
+
+    Photos start uploading as soon as they are queued. With batch_documents,
+    documents are held and sent together in sendMediaGroup albums by close()
+    (falling back to one sendDocument each if the album is rejected);
+    otherwise each document also starts uploading right away.
+
+    With an outbox, uploads that fail for a retryable reason (network error,
+    429, 5xx) are queued there instead of being lost, and close() retries the
+    outbox, including entries left over from earlier runs.
+    """
+
+    def __init__(
+        self,
+        token: str,
+        chat_id: str,
+        workers: int = TELEGRAM_UPLOAD_WORKERS,
+        batch_documents: bool = True,
+        outbox: Optional[TelegramOutbox] = None,
+        outbox_wait: float = OUTBOX_INLINE_WAIT,
+    ) -> None:
+        self.token = token
+        self.chat_id = chat_id
+        self.batch_documents = batch_documents
+        self.outbox = outbox
+        self.outbox_wait = outbox_wait
+        self._executor = ThreadPoolExecutor(max_workers=workers)
+        self._lock = threading.Lock()
+        # (성공 메시지, 업로드 작업) 목록과 묶음 전송 대기 문서 목록
+        self._uploads: List[Tuple[str, "Future[Tuple[bool, str]]"]] = []
+        self._pending_documents: List[Tuple[Path, Optional[str], str]] = []
+
+    def _report(
+        self,
+        method: str,
+        file_path: Path,
+        caption: Optional[str],
+        success_message: str,
+        result: TelegramResult,
+    ) -> Tuple[bool, str]:
+        if result.sent:
+            return True, success_message
+        if self.outbox is not None and result.retryable:
+            next_attempt_at = self.outbox.add(method, file_path, caption, success_message, result)
+            retry_time = time.strftime("%H:%M:%S", time.localtime(next_attempt_at))
+            return False, f"{result.error or ''} (재시도 대기열에 추가: {file_path.name}, 다음 시도 {retry_time})"
+        return False, result.error or ""
+
+    def _upload(self, method: str, file_path: Path, caption: Optional[str], success_message: str) -> Tuple[bool, str]:
+        result = _SENDERS[method](file_path, self.token, self.chat_id, caption)
+        return self._report(method, file_path, caption, success_message, result)
+
+    def send_document(self, file_path: Path, caption: Optional[str], success_message: str) -> None:
+        with self._lock:
+            if self.batch_documents:
+                self._pending_documents.append((file_path, caption, success_message))
+                return
+            future = self._executor.submit(self._upload, "sendDocument", file_path, caption, success_message)
+            self._uploads.append((success_message, future))
+
+    def send_photo(self, file_path: Path, caption: Optional[str], success_message: str) -> None:
+        with self._lock:
+            future = self._executor.submit(self._upload, "sendPhoto", file_path, caption, success_message)
+            self._uploads.append((success_message, future))
+
+    def _send_document_group(
+        self, documents: List[Tuple[Path, Optional[str], str]]
+    ) -> List[Tuple[bool, str]]:
+        if len(documents) == 1:
+            return [self._upload("sendDocument", *documents[0])]
+
+        result = _send_document_album(
+            [(file_path, caption) for file_path, caption, _ in documents], self.token, self.chat_id
+        )
+        if result.sent:
+            return [(True, success_message) for _, _, success_message in documents]
+
+        # 전송 제한(429)이면 바로 다시 보내지 않고 파일마다 대기열에 넣어 retry_after 이후 재시도
+        if result.retry_after is not None:
+            return [
+                self._report("sendDocument", file_path, caption, success_message, result)
+                for file_path, caption, success_message in documents
+            ]
+        # 묶음 전송이 거부되면(설정 오류 제외) 파일마다 따로 다시 전송
+        if result.error and _check_telegram_target(self.token, self.chat_id) is None:
+            return [self._upload("sendDocument", *document) for document in documents]
+        return [(False, result.error or "")]
+
+    def close(self) -> List[Tuple[bool, str]]:
+        """
+        Send the held documents, wait for every upload and stop the workers.
+
+        Returns (sent, message) per upload in the order they were queued,
+        where message is the success message or the error, followed by the
+        results of retrying the outbox for up to outbox_wait seconds.
+        """
+        with self._lock:
+            pending, self._pending_documents = self._pending_documents, []
+            groups = [
+                pending[start:start + MEDIA_GROUP_MAX_SIZE]
+                for start in range(0, len(pending), MEDIA_GROUP_MAX_SIZE)
+            ]
+            group_futures = [self._executor.submit(self._send_document_group, group) for group in groups]
+            uploads, self._uploads = self._uploads, []
+
+        results: List[Tuple[bool, str]] = [future.result() for _, future in uploads]
+        for future in group_futures:
+            results.extend(future.result())
+        self._executor.shutdown(wait=True)
+
+        if self.outbox is not None and _check_telegram_target(self.token, self.chat_id) is None:
+            results.extend(self.outbox.drain(self.token, self.chat_id, wait=self.outbox_wait))
+        return results
+
+
+if __name__ == "__main__":
+    load_dotenv()
+    parser = argparse.ArgumentParser(
+        description="전송에 실패해 대기열에 남은 텔레그램 파일을 다시 보냅니다."
+    )
+    parser.add_argument(
+        "--outbox",
+        type=Path,
+        help=f"대기열 파일. 기본값: data/{TELEGRAM_OUTBOX_DB_NAME}",
+        default=Path(__file__).parent / "data" / TELEGRAM_OUTBOX_DB_NAME,
+    )
+    parser.add_argument(
+        "--wait",
+        type=float,
+        help="재시도 시각이 아직 안 된 항목을 기다릴 최대 시간(초). 기본값: 0(지금 보낼 항목만 전송)",
+        default=0.0,
+    )
+    parser.add_argument("--list", action="store_true", help="전송하지 않고 대기열 항목만 출력합니다.")
+    args = parser.parse_args()
+
+    outbox = TelegramOutbox(args.outbox)
+    if args.list:
+        for entry in outbox.entries():
+            retry_time = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(entry.next_attempt_at))
+            print(f"{entry.entry_id}\t{entry.method}\t{entry.file_path}\t{entry.attempts}회 실패\t다음 시도 {retry_time}")
+            print(f"\t{entry.last_error}")
+    else:
+        for sent, message in outbox.drain(
+            os.getenv("TELEGRAM_BOT_TOKEN", ""), os.getenv("TELEGRAM_CHAT_ID", ""), wait=args.wait
+        ):
+            print(message)
+        print(f"{outbox.count()} uploads left in the outbox.")
+    outbox.close()
@@ -0,0 +1,210 @@
+import re
+from collections import Counter
+from functools import lru_cache
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from clien_post import Post
+
+# 키워드 빈도 분석에서 제외할 불용어 목록(조사/어미를 떼어낸 뒤 적용)
+STOP_WORDS = {"속보", "단독", "합니다", "더", "첫", "수","제","오늘","있다","너무","정말","속보","하는","왜"}
+TITLE_TOKEN_PATTERN = re.compile(r"[\uAC00-\uD7A3A-Za-z0-9]+")
+
+# simple: 한글/영문/숫자 단위 그대로, korean: 한글 토큰 끝의 조사/어미를 떼어 같은 단어로 집계
+TITLE_ANALYZERS = ("simple", "korean")
+_analyzer = "korean"
+
+# 정규화 결과 캐시 크기(제목 단어 종류 수보다 넉넉하게)
+TOKEN_CACHE_SIZE = 65536
+# 조사/어미를 떼어낸 뒤 남아야 하는 최소 음절 수("나이", "사과" 같은 두 음절 단어 보호)
+MIN_STEM_LENGTH = 2
+
+# 앞 음절 받침 유무와 관계없이 붙는 조사/어미(긴 것부터 비교)
+_SUFFIXES_ANY = (
+    "했습니다", "됐습니다", "에서는", "에게서", "이라는", "이라고",
+    "에서", "에게", "한테", "까지", "부터", "처럼", "보다", "마저", "조차", "에는",
+    "했다", "한다", "했던", "하는", "하고", "해서", "하자", "된다", "됐다", "되는", "되고",
+    "의", "에", "도",
+)
+# 조사처럼 끝나지만 그 자체로 단어인 경우
+_KEEP_WORDS = {
+    "민주주의", "자본주의", "사회주의", "공산주의", "한반도", "경기도", "강원도", "충청도",
+    "전라도", "경상도", "제주도", "울릉도", "고양이", "어린이", "원숭이", "고속도로",
+}
+# 조사처럼 끝나지만 명사의 끝인 흔한 말("국무회의", "선거제도", "떡볶이", "조사결과"를 그대로 둠)
+_NOUN_ENDINGS = (
+    "회의", "합의", "논의", "협의", "동의", "정의", "강의", "항의", "결의", "건의", "심의", "의의",
+    "제도", "정도", "태도", "속도", "의도", "시도", "보도", "지도", "한도", "용도", "온도", "반도",
+    "열도", "궤도", "빈도", "강도", "놀이", "볶이", "먹이", "높이", "길이", "깊이", "넓이", "결과",
+    "성과", "통과", "경과", "학과", "주가", "유가", "휴가", "도로", "미로",
+)
+# 받침 있는 음절 뒤에만 붙는 조사
+_SUFFIXES_AFTER_CONSONANT = ("으로", "이", "은", "을", "과")
+# 받침 없는 음절 뒤에만 붙는 조사
+_SUFFIXES_AFTER_VOWEL = ("라는", "라고", "가", "는", "를", "와", "로")
+# 받침 ㄹ(종성 번호 8) 뒤에는 "으로" 대신 "로"가 붙음("서울로")
+_RIEUL_FINAL = 8
+
+
+def _final_consonant(syllable: str) -> int:
+    # 한글 음절 코드 = 0xAC00 + (초성 * 21 + 중성) * 28 + 종성
+    return (ord(syllable) - 0xAC00) % 28
+
+
+def _has_final_consonant(syllable: str) -> bool:
+    return _final_consonant(syllable) != 0
+
+
+def _is_hangul(syllable: str) -> bool:
+    return "\uAC00" <= syllable <= "\uD7A3"
+
+
+def _is_known_word(token: str) -> bool:
+    return token in _KEEP_WORDS or token.endswith(_NOUN_ENDINGS)
+
+
+def _particle_stem(token: str) -> str:
+    # 조사/어미를 하나 떼어낸 결과(뗄 것이 없으면 token 그대로)
+    for suffix in _SUFFIXES_ANY:
+        if token.endswith(suffix) and len(token) - len(suffix) >= MIN_STEM_LENGTH:
+            return token[: -len(suffix)]
+
+    for suffixes, needs_consonant in ((_SUFFIXES_AFTER_CONSONANT, True), (_SUFFIXES_AFTER_VOWEL, False)):
+        for suffix in suffixes:
+            if not token.endswith(suffix) or len(token) - len(suffix) < MIN_STEM_LENGTH:
+                continue
+            stem = token[: -len(suffix)]
+            # 영문/숫자 뒤에서는 받침을 알 수 없으므로 그대로 떼어냄("ai는" -> "ai")
+            if not _is_hangul(stem[-1]) or _has_final_consonant(stem[-1]) == needs_consonant:
+                return stem
+            if suffix == "로" and _final_consonant(stem[-1]) == _RIEUL_FINAL:
+                return stem
+    return token
+
+
+def _strip_particle(token: str) -> str:
+    if not token or not _is_hangul(token[-1]) or token in _KEEP_WORDS:
+        return token
+    stem = _particle_stem(token)
+    # 명사 끝말로 끝나는 말은 떼어낸 나머지도 단어일 때만 떼어냄("국무회의의" -> "국무회의", "국무회의"는 그대로)
+    if stem != token and token.endswith(_NOUN_ENDINGS) and not _is_known_word(stem):
+        return token
+    return stem
+
+
+@lru_cache(maxsize=TOKEN_CACHE_SIZE)
+def normalize_token(token: str) -> str:
+    """
+    Strip trailing Korean particles/endings from a Hangul token.
+
+    Rule based: "이재명이", "이재명은" and "이재명" all become "이재명". At
+    least MIN_STEM_LENGTH syllables must remain, and particles that depend on
+    a final consonant (이/가, 은/는, 을/를, 과/와, 으로/로) are only stripped
+    when the stem agrees ("로" also follows a ㄹ final, as in "서울로"), which
+    protects words like "전문가". Words that merely look inflected are kept,
+    either as a whole ("민주주의", "한반도") or by a common noun ending
+    ("국무회의", "선거제도", "떡볶이"). Stripping repeats until nothing is
+    left to strip, so a word and any inflected form of it ("선거제도가",
+    "서울에서도") always normalize alike. Results are cached, so repeated
+    words cost one dict lookup.
+    """
+    stem = _strip_particle(token)
+    while stem != token:
+        token, stem = stem, _strip_particle(stem)
+    return token
+
+
+def set_title_analyzer(name: str) -> None:
+    """
+    Select the title analyzer ("simple" or "korean").
+    """
+    global _analyzer
+
+    if name not in TITLE_ANALYZERS:
+        raise ValueError(f"Unknown title analyzer: {name}")
+    _analyzer = name
+
+
+def get_title_analyzer() -> str:
+    return _analyzer
+
+
+def tokenize_title(title: str) -> List[str]:
+    """
+    Extract alphanumeric and Hangul tokens from a title and normalize them.
+    """
+    # 한글/영문/숫자 토큰만 추출해 소문자로 정규화
+    tokens = TITLE_TOKEN_PATTERN.findall(title)
+    return [token.lower() for token in tokens if token]
+
+
+def analyze_token(token: str) -> str:
+    """
+    Normalize one token with the selected analyzer (e.g. a search keyword).
+    """
+    token = token.lower()
+    return normalize_token(token) if _analyzer == "korean" else token
+
+
+def title_tokens(title: str) -> Tuple[str, ...]:
+    """
+    Tokenize a title, normalize tokens with the selected analyzer and drop
+    stop words, keeping title order.
+    """
+    tokens = tokenize_title(title)
+    if _analyzer == "korean":
+        tokens = [normalize_token(token) for token in tokens]
+    return tuple([token for token in tokens if token not in STOP_WORDS])
+
+
+def post_tokens(post: Post) -> Tuple[str, ...]:
+    # 토큰이 이미 기록된 게시물은 다시 토큰화하지 않음
+    if post.tokens is not None:
+        return post.tokens
+    return title_tokens(post.title)
+
+
+def tokenize_posts(posts: Iterable[Post]) -> Iterator[Post]:
+    """
+    Tokenize each post's title once and yield the post with its tokens cached.
+
+    Frequency counting, keyword matching and the word cloud all read
+    post.tokens afterwards instead of tokenizing the title again.
+    """
+    for post in posts:
+        if post.tokens is None:
+            post = post.with_tokens(title_tokens(post.title))
+        yield post
+
+
+def calculate_title_frequencies(
+    posts, top_n: int = 20, title_index: Optional[Dict[str, Set[int]]] = None
+) -> Tuple[List[Tuple[str, int]], List[Tuple[str, int]]]:
+    """
+    Calculate most common words and bigrams within post titles.
+
+    When title_index is given, it is filled in the same pass with
+    token -> post IDs (stop words excluded) for keyword lookups.
+    """
+    # 단어/바이그램 빈도 수집
+    word_counter: Counter = Counter()
+    bigram_counter: Counter = Counter()
+
+    for post in posts:
+        # 불용어를 제외한 최종 토큰 목록
+        filtered_tokens = post_tokens(post)
+
+        if not filtered_tokens:
+            continue
+
+        word_counter.update(filtered_tokens)
+        if title_index is not None and post.post_id is not None:
+            for token in set(filtered_tokens):
+                post_ids = title_index.get(token)
+                if post_ids is None:
+                    title_index[token] = {post.post_id}
+                else:
+                    post_ids.add(post.post_id)
+        if len(filtered_tokens) > 1:
+            bigram_counter.update(map(" ".join, zip(filtered_tokens, filtered_tokens[1:])))
+
+    return word_counter.most_common(top_n), bigram_counter.most_common(top_n)
@@ -0,0 +1,316 @@
+import argparse
+from datetime import date, datetime, timedelta
+from itertools import repeat
+from operator import itemgetter
+from pathlib import Path
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from clien_archive import POST_ARCHIVE_DB_NAME, POSTS_CSV_PATTERN, PostArchive, read_posts_csv
+from clien_tokens import tokenize_posts
+
+# 이슈 키워드 판단 기본값: 최근 며칠과 비교할지, 당일 최소 게시물 수, 최소 z-score
+TREND_HISTORY_DAYS = 14
+RISING_MIN_COUNT = 3
+RISING_MIN_ZSCORE = 2.0
+
+
+class TermDayMatrix(NamedTuple):
+    """
+    Posts per (title token, day), with the number of indexed posts per day.
+    """
+
+    terms: List[str]
+    days: List[date]
+    counts: "np.ndarray"  # (len(terms), len(days)) 제목에 토큰이 들어간 게시물 수
+    day_totals: "np.ndarray"  # (len(days),) 날짜별 게시물 수
+
+
+def trends_available() -> bool:
+    return np is not None
+
+
+def build_term_day_matrix(
+    rows: List[Tuple[str, date, int]],
+    day_totals: Dict[date, int],
+    start_date: date,
+    end_date: date,
+) -> TermDayMatrix:
+    """
+    Build a term x day count matrix from (token, day, count) rows.
+
+    day may be a date or its YYYY-MM-DD string. Every day from start_date
+    through end_date gets a column, including days without posts.
+    """
+    if np is None:
+        raise RuntimeError("numpy 라이브러리가 설치되어 있지 않습니다.")
+
+    days = [start_date + timedelta(days=offset) for offset in range((end_date - start_date).days + 1)]
+    day_positions: Dict[object, int] = {day: position for position, day in enumerate(days)}
+    # 아카이브 행은 날짜를 문자열로 주므로 행마다 변환하지 않도록 문자열 키도 등록
+    day_positions.update({day.isoformat(): position for position, day in enumerate(days)})
+
+    # 행 목록을 열 단위로 나누고, 토큰/날짜 번호는 파이썬 반복문 대신 map으로 변환
+    tokens = list(map(itemgetter(0), rows))
+    terms = list(dict.fromkeys(tokens))
+    term_positions = {term: position for position, term in enumerate(terms)}
+    term_rows = np.fromiter(map(term_positions.__getitem__, tokens), dtype=np.intp, count=len(rows))
+    day_columns = np.fromiter(
+        map(day_positions.get, map(itemgetter(1), rows), repeat(-1)), dtype=np.intp, count=len(rows)
+    )
+    values = np.fromiter(map(itemgetter(2), rows), dtype=np.int32, count=len(rows))
+
+    counts = np.zeros((len(terms), len(days)), dtype=np.int32)
+    in_range = day_columns >= 0
+    # 같은 (토큰, 날짜)가 여러 번 들어와도 합산
+    np.add.at(counts, (term_rows[in_range], day_columns[in_range]), values[in_range])
+    totals = np.array([day_totals.get(day, 0) for day in days], dtype=np.int32)
+    return TermDayMatrix(terms, days, counts, totals)
+
+
+def term_day_matrix_from_archive(
+    archive: PostArchive,
+    start_date: date,
+    end_date: date,
+    active_on: Optional[date] = None,
+    min_count: int = 1,
+) -> TermDayMatrix:
+    """
+    Build the matrix from the archive's per-day title token counts.
+
+    With active_on, only terms found in at least min_count posts that day
+    are loaded, which is all rising_keywords needs for that day.
+    """
+    rows = archive.token_day_counts(start_date, end_date, active_on, min_count)
+    day_totals = {
+        date.fromisoformat(day): count for day, count in archive.day_post_counts(start_date, end_date).items()
+    }
+    return build_term_day_matrix(rows, day_totals, start_date, end_date)
+
+
+def term_day_matrix_from_csv(csv_paths: Iterable[Path]) -> TermDayMatrix:
+    """
+    Build the matrix from saved data/clien_*_posts_{YYMMDD}.csv files.
+
+    A day saved by more than one script (today and yesterday runs) is
+    counted once, from the last file read.
+    """
+    day_counts: Dict[date, Dict[str, int]] = {}
+    day_totals: Dict[date, int] = {}
+    for csv_path in sorted(Path(path) for path in csv_paths):
+        match = POSTS_CSV_PATTERN.search(csv_path.name)
+        if not match:
+            continue
+        post_date = datetime.strptime(match.group(1), "%y%m%d").date()
+        counts: Dict[str, int] = {}
+        total = 0
+        for post in tokenize_posts(read_posts_csv(csv_path, post_date)):
+            total += 1
+            for token in set(post.tokens):
+                counts[token] = counts.get(token, 0) + 1
+        day_counts[post_date] = counts
+        day_totals[post_date] = total
+
+    if not day_counts:
+        raise ValueError("게시물 CSV 파일이 없습니다.")
+
+    rows = [
+        (token, day, count) for day, counts in day_counts.items() for token, count in counts.items()
+    ]
+    return build_term_day_matrix(rows, day_totals, min(day_counts), max(day_counts))
+
+
+def day_over_day_deltas(matrix: TermDayMatrix) -> "np.ndarray":
+    """
+    Change in each term's count from the previous day (the first day is 0).
+    """
+    deltas = np.zeros_like(matrix.counts)
+    deltas[:, 1:] = np.diff(matrix.counts, axis=1)
+    return deltas
+
+
+def keyword_zscores(matrix: TermDayMatrix, history_days: int = TREND_HISTORY_DAYS) -> "np.ndarray":
+    """
+    Z-score of each term's daily share of posts against its previous history_days.
+
+    Shares (count / posts that day) make a partial day comparable with full
+    ones. The day's share is compared with the history's pooled share; the
+    variance is a two-proportion test's sampling variance plus the term's
+    day-to-day variance in the history, so both rare terms and normally
+    bursty terms need a real jump to stand out. Days without history get 0.
+    """
+    counts = matrix.counts.astype(np.float64)
+    totals = matrix.day_totals.astype(np.float64)
+    shares = np.divide(counts, totals, out=np.zeros_like(counts), where=totals > 0)
+
+    # 누적합으로 각 날짜 직전 history_days일의 합계를 한 번에 계산
+    def trailing_sum(values: "np.ndarray") -> "np.ndarray":
+        cumulative = np.zeros(values.shape[:-1] + (values.shape[-1] + 1,))
+        cumulative[..., 1:] = np.cumsum(values, axis=-1)
+        ends = np.arange(values.shape[-1])
+        starts = np.maximum(ends - history_days, 0)
+        return cumulative[..., ends] - cumulative[..., starts]
+
+    window = np.maximum(np.minimum(np.arange(matrix.counts.shape[1]), history_days), 1).astype(np.float64)
+    mean_share = trailing_sum(shares) / window
+    daily_variance = np.maximum(trailing_sum(shares * shares) / window - mean_share * mean_share, 0.0)
+
+    history_counts = trailing_sum(counts)
+    history_totals = trailing_sum(totals)
+    history_share = np.divide(
+        history_counts, history_totals, out=np.zeros_like(history_counts), where=history_totals > 0
+    )
+    pooled = (history_counts + counts) / np.maximum(history_totals + totals, 1.0)
+    sampling_variance = pooled * (1.0 - pooled) * (
+        np.divide(1.0, totals, out=np.zeros_like(totals), where=totals > 0)
+        + np.divide(1.0, history_totals, out=np.zeros_like(history_totals), where=history_totals > 0)
+    )
+
+    deviation = np.sqrt(sampling_variance + daily_variance)
+    zscores = np.divide(
+        shares - history_share, deviation, out=np.zeros_like(shares), where=deviation > 0
+    )
+    # 비교할 이전 기간이나 당일 게시물이 없으면 0
+    zscores[:, (history_totals == 0) | (totals == 0)] = 0.0
+    return zscores
+
+
+def rising_keywords(
+    matrix: TermDayMatrix,
+    target_date: Optional[date] = None,
+    top_n: int = 20,
+    min_count: int = RISING_MIN_COUNT,
+    history_days: int = TREND_HISTORY_DAYS,
+) -> List[Tuple[str, int, int, float]]:
+    """
+    Rank terms by z-score on target_date (default: the last day).
+
+    Returns (term, count, change from the previous day, z-score) for terms
+    with at least min_count posts that day, most anomalous first.
+    """
+    if not matrix.terms:
+        return []
+    column = matrix.days.index(target_date) if target_date is not None else len(matrix.days) - 1
+    candidates = np.flatnonzero(matrix.counts[:, column] >= min_count)
+
+    # 후보 토큰과 기준 날짜 직전 history_days일만 잘라 계산
+    first = max(column - history_days, 0)
+    window = TermDayMatrix(
+        [matrix.terms[row] for row in candidates],
+        matrix.days[first:column + 1],
+        matrix.counts[candidates, first:column + 1],
+        matrix.day_totals[first:column + 1],
+    )
+    zscores = keyword_zscores(window, history_days)[:, -1]
+    deltas = day_over_day_deltas(window)[:, -1]
+    day_counts = window.counts[:, -1]
+
+    # z-score 내림차순, 같으면 당일 게시물 수 내림차순
+    order = np.lexsort((-day_counts, -zscores))[:top_n]
+    return [
+        (window.terms[row], int(day_counts[row]), int(deltas[row]), float(zscores[row]))
+        for row in order
+    ]
+
+
+def rising_issue_keyword(
+    archive: PostArchive,
+    target_date: date,
+    history_days: int = TREND_HISTORY_DAYS,
+    min_zscore: float = RISING_MIN_ZSCORE,
+) -> Optional[str]:
+    """
+    Pick the most anomalous title keyword of target_date from the archive.
+
+    Returns None when numpy is missing, the archive has no history before
+    target_date, or no keyword reaches min_zscore; callers then fall back
+    to the most frequent keyword.
+    """
+    if np is None:
+        return None
+    matrix = term_day_matrix_from_archive(
+        archive, target_date - timedelta(days=history_days), target_date, target_date, RISING_MIN_COUNT
+    )
+    if not matrix.day_totals[:-1].any():
+        return None
+    ranked = rising_keywords(matrix, top_n=1, history_days=history_days)
+    if ranked and ranked[0][3] >= min_zscore:
+        return ranked[0][0]
+    return None
+
+
+def pick_issue_keyword(
+    word_freq: List[Tuple[str, int]],
+    archive: Optional[PostArchive],
+    target_date: date,
+) -> str:
+    """
+    Choose the keyword whose posts go into the issue file.
+
+    The most anomalous keyword of target_date is preferred; without an
+    archive, numpy or a clear outlier it is the most frequent keyword.
+    """
+    rising = rising_issue_keyword(archive, target_date) if archive is not None else None
+    if rising is None:
+        return word_freq[0][0]
+    if rising != word_freq[0][0]:
+        print(f"\nIssue keyword: '{rising}' (rising vs. the previous {TREND_HISTORY_DAYS} days) instead of '{word_freq[0][0]}'.")
+    return rising
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="날짜별 제목 키워드 빈도를 비교해 평소보다 급증한 키워드를 보여줍니다."
+    )
+    parser.add_argument(
+        "csv_files",
+        nargs="*",
+        type=Path,
+        help="사용할 게시물 CSV 파일. 생략하면 아카이브(data/posts.sqlite3)의 제목 색인 사용",
+    )
+    parser.add_argument(
+        "--db",
+        type=Path,
+        help=f"아카이브 파일 경로. 기본값: data/{POST_ARCHIVE_DB_NAME}",
+        default=Path(__file__).parent / "data" / POST_ARCHIVE_DB_NAME,
+    )
+    parser.add_argument("--date", type=str, help="기준 날짜 (YYYY-MM-DD). 기본값: 데이터의 마지막 날짜")
+    parser.add_argument(
+        "--days",
+        type=int,
+        help=f"아카이브에서 읽을 기간(일). 기본값: {TREND_HISTORY_DAYS * 2}",
+        default=TREND_HISTORY_DAYS * 2,
+    )
+    parser.add_argument("--top", type=int, help="출력할 키워드 수. 기본값: 20", default=20)
+    args = parser.parse_args()
+
+    if np is None:
+        print("오류: numpy 라이브러리가 설치되어 있지 않습니다.")
+        raise SystemExit(1)
+
+    try:
+        target_date = datetime.strptime(args.date, "%Y-%m-%d").date() if args.date else None
+    except ValueError:
+        print("오류: 날짜 형식이 잘못되었습니다. YYYY-MM-DD 형식으로 입력해주세요.")
+        raise SystemExit(1)
+
+    if args.csv_files:
+        matrix = term_day_matrix_from_csv(args.csv_files)
+    else:
+        end_date = target_date or date.today()
+        archive = PostArchive(args.db)
+        matrix = term_day_matrix_from_archive(archive, end_date - timedelta(days=args.days - 1), end_date)
+        archive.close()
+
+    if target_date is not None and target_date not in matrix.days:
+        print(f"오류: {target_date} 데이터가 없습니다.")
+        raise SystemExit(1)
+
+    shown_date = target_date or matrix.days[-1]
+    print(f"{len(matrix.terms)} terms x {len(matrix.days)} days; rising keywords on {shown_date}:")
+    for term, count, delta, zscore in rising_keywords(matrix, shown_date, top_n=args.top):
+        print(f"{term}: {count} posts ({delta:+d} vs previous day), z={zscore:.2f}")
@@ -0,0 +1,119 @@
+import threading
+from datetime import date, datetime, timedelta
+from html import escape
+from typing import List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+import requests
+
+from clien_post import TIMESTAMP_FORMAT, Post
+
+PAGE_SIZE = 5
+
+
+def make_post(post_id: int, posted_at: datetime, title: Optional[str] = None) -> Post:
+    return Post(
+        post_id,
+        posted_at,
+        0,
+        0,
+        "author",
+        title or f"title {post_id}",
+        f"https://www.clien.net/service/board/park/{post_id}",
+    )
+
+
+def render_list_page(posts: List[Post]) -> str:
+    """
+    Render posts as a list page in the markup parse_list_page reads.
+    """
+    rows = "".join(
+        f"""
+        <div class="symph_row">
+          <div class="list_symph"><span>{post.recommendations}</span></div>
+          <div class="list_title">
+            <a class="list_subject" href="/service/board/park/{post.post_id}">
+              <span class="subject_fixed">{escape(post.title)}</span>
+            </a>
+          </div>
+          <div class="list_author"><span class="nickname"><span>{escape(post.author)}</span></span></div>
+          <div class="list_hit"><span class="hit">{post.views}</span></div>
+          <div class="list_time">
+            <span class="time">{post.display_time}<span class="timestamp">{post.posted_at.strftime(TIMESTAMP_FORMAT)}</span></span>
+          </div>
+        </div>"""
+        for post in posts
+    )
+    return f'<html><body><div class="list_content">{rows}</div></body></html>'
+
+
+class ShiftingBoard:
+    """
+    Fake list pages addressed by position (po), newest post first.
+
+    Posts are spread over `today`, the day before and the day before that.
+    With shift, a new post for `today` goes on top after every request, so
+    later pages repeat posts pushed down from earlier ones.
+    """
+
+    def __init__(
+        self,
+        today: date,
+        today_posts: int,
+        target_posts: int,
+        older_posts: int,
+        shift: bool = True,
+    ) -> None:
+        self.today = today
+        self.shift = shift
+        self.posts: List[Post] = []
+        post_id = 1000
+        for offset, count in enumerate((today_posts, target_posts, older_posts)):
+            newest = datetime.combine(today - timedelta(days=offset), datetime.min.time()) + timedelta(hours=23)
+            for minute in range(count):
+                self.posts.append(make_post(post_id, newest - timedelta(minutes=minute)))
+                post_id -= 1
+        self.requests: List[int] = []
+        self._next_id = 1001
+        self._lock = threading.Lock()
+
+    def ids_on(self, day: date) -> List[int]:
+        return [post.post_id for post in self.posts if post.posted_at.date() == day]
+
+    def fetch(self, page_num: int, *args, **kwargs) -> List[Tuple[datetime, Post]]:
+        with self._lock:
+            self.requests.append(page_num)
+            page = self.posts[page_num * PAGE_SIZE:(page_num + 1) * PAGE_SIZE]
+            if self.shift:
+                self._insert_new_post()
+            return [(post.posted_at, post) for post in page]
+
+    def _insert_new_post(self) -> Post:
+        newest = datetime.combine(self.today, datetime.min.time()) + timedelta(hours=23, minutes=30)
+        post = make_post(self._next_id, newest)
+        self.posts.insert(0, post)
+        self._next_id += 1
+        return post
+
+    def post_new(self) -> Post:
+        """
+        Put a new post for `today` on top of the board, pushing the rest down.
+        """
+        with self._lock:
+            return self._insert_new_post()
+
+    def http_request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """
+        Answer clien_http.http_request with the rendered list page for the po parameter.
+        """
+        params = kwargs.get("params") or {}
+        page_num = int(params.get("po", parse_qs(urlsplit(url).query).get("po", ["0"])[0]))
+        with self._lock:
+            self.requests.append(page_num)
+            page = self.posts[page_num * PAGE_SIZE:(page_num + 1) * PAGE_SIZE]
+        response = requests.Response()
+        response.status_code = 200
+        response.url = url
+        response.encoding = "utf-8"
+        response._content = render_list_page(page).encode("utf-8")
+        return response
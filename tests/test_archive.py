@@ -0,0 +1,64 @@
+import csv
+from datetime import datetime
+
+from clien_archive import PostArchive, import_posts_csv_files
+from fake_board import make_post
+
+URL = "https://www.clien.net/service/board/park/{}"
+
+
+def write_csv(path, rows):
+    with path.open("w", encoding="utf-8-sig", newline="") as csv_file:
+        writer = csv.DictWriter(csv_file, fieldnames=["Rec", "Views", "Author", "Time", "Title", "URL"])
+        writer.writeheader()
+        for post_id, posted_time in rows:
+            writer.writerow(
+                {
+                    "Rec": 1,
+                    "Views": 10,
+                    "Author": "author",
+                    "Time": posted_time,
+                    "Title": f"title {post_id}",
+                    "URL": URL.format(post_id),
+                }
+            )
+    return path
+
+
+def posted_at(archive, post_id):
+    posts = archive.posts_between(datetime(2025, 1, 1), datetime(2026, 1, 1))
+    return {post.post_id: post.posted_at for post in posts}[post_id]
+
+
+def test_later_csv_fills_in_a_missing_time(tmp_path):
+    # 예전 CSV는 Time 열에 HH:MM이 아닌 값이 들어 있어 자정으로 기록됨
+    old_dir, new_dir = tmp_path / "old", tmp_path / "new"
+    old_dir.mkdir()
+    new_dir.mkdir()
+    old_csv = write_csv(old_dir / "clien_yesterday_posts_251027.csv", [(1000, "25-10-27"), (999, "08:15")])
+    new_csv = write_csv(new_dir / "clien_yesterday_posts_251027.csv", [(1000, "09:41"), (999, "08:15")])
+    archive = PostArchive(tmp_path / "posts.sqlite3")
+
+    import_posts_csv_files(archive, [old_csv])
+    assert posted_at(archive, 1000) == datetime(2025, 10, 27, 0, 0)
+    import_posts_csv_files(archive, [new_csv])
+    # 예전 CSV를 다시 가져와도 실제 시각을 잃지 않음
+    import_posts_csv_files(archive, [old_csv])
+
+    assert posted_at(archive, 1000) == datetime(2025, 10, 27, 9, 41)
+    assert posted_at(archive, 999) == datetime(2025, 10, 27, 8, 15)
+    archive.close()
+
+
+def test_csv_import_keeps_scraped_seconds_and_scrape_replaces_csv_time(tmp_path):
+    csv_path = write_csv(tmp_path / "clien_today_posts_251027.csv", [(1000, "09:41"), (999, "broken")])
+    archive = PostArchive(tmp_path / "posts.sqlite3")
+
+    archive.upsert([make_post(1000, datetime(2025, 10, 27, 9, 41, 37))])
+    import_posts_csv_files(archive, [csv_path])
+    archive.upsert([make_post(999, datetime(2025, 10, 27, 8, 15, 2))])
+
+    assert posted_at(archive, 1000) == datetime(2025, 10, 27, 9, 41, 37)
+    assert posted_at(archive, 999) == datetime(2025, 10, 27, 8, 15, 2)
+    archive.close()
+
@@ -0,0 +1,67 @@
+import threading
+import time
+from datetime import datetime
+
+import clien_issue
+from clien_content_store import PostContentStore
+from clien_issue import save_issue_posts
+from fake_board import make_post
+
+
+def test_issue_entries_keep_post_order_with_concurrent_fetches(tmp_path, monkeypatch):
+    posts = [make_post(100 + index, datetime(2025, 10, 22, 12, index)) for index in range(6)]
+    posts[2] = posts[2]._replace(url="")
+    active = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def fake_fetch(url):
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        # 앞쪽 게시물이 더 늦게 끝나도록 지연
+        time.sleep(0.02 * (200 - int(url.rsplit("/", 1)[1])) / 100)
+        with lock:
+            active -= 1
+        return None if url.endswith("/104") else f"body of {url}"
+
+    monkeypatch.setattr(clien_issue, "fetch_post_content", fake_fetch)
+    output_path = tmp_path / "issue.txt"
+
+    assert save_issue_posts("keyword", posts, output_path, workers=3)
+
+    text = output_path.read_text(encoding="utf-8")
+    assert text.startswith("Top keyword: keyword\n\n")
+    markers = [line for line in text.splitlines() if line.startswith("[Post ")]
+    assert markers == ["[Post 1]", "[Post 2]", "[Post 4]", "[Post 6]"]
+    assert 1 < peak <= 3
+
+
+def test_issue_file_is_not_written_without_contents(tmp_path, monkeypatch):
+    monkeypatch.setattr(clien_issue, "fetch_post_content", lambda url: None)
+    output_path = tmp_path / "issue.txt"
+
+    assert not save_issue_posts("keyword", [make_post(1, datetime(2025, 10, 22))], output_path)
+    assert not output_path.exists()
+
+
+def test_stored_bodies_are_reused_and_misses_are_stored(tmp_path, monkeypatch):
+    posts = [make_post(100 + index, datetime(2025, 10, 22, 12, index)) for index in range(3)]
+    store = PostContentStore(tmp_path / "contents.sqlite3")
+    store.put(101, posts[1].url, "stored body")
+    fetched = []
+
+    def fake_fetch(url):
+        fetched.append(url)
+        return f"body of {url}"
+
+    monkeypatch.setattr(clien_issue, "fetch_post_content", fake_fetch)
+    try:
+        assert save_issue_posts("keyword", posts, tmp_path / "issue.txt", content_store=store)
+        assert sorted(fetched) == sorted([posts[0].url, posts[2].url])
+        assert store.get(102) == f"body of {posts[2].url}"
+    finally:
+        store.close()
+
+    assert "stored body" in (tmp_path / "issue.txt").read_text(encoding="utf-8")
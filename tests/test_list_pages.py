@@ -0,0 +1,239 @@
+import itertools
+import math
+import threading
+import time
+from datetime import date, timedelta
+
+import pytest
+
+import clien_async
+import clien_daily_scraper
+import clien_http
+import clien_stream
+from clien_archive import read_posts_csv
+from clien_cache import ResponseCache
+from clien_http import set_response_cache
+from fake_board import PAGE_SIZE, ShiftingBoard
+
+TODAY = date(2025, 10, 27)
+TARGET = TODAY - timedelta(days=1)
+
+
+@pytest.fixture
+def board(monkeypatch):
+    board = ShiftingBoard(TODAY, today_posts=12, target_posts=23, older_posts=10, shift=False)
+    monkeypatch.setattr(clien_daily_scraper, "fetch_list_page", board.fetch)
+    return board
+
+
+def _ids(posts):
+    return [post.post_id for post in posts]
+
+
+@pytest.mark.parametrize("locate", [False, True])
+def test_serial_scan_collects_the_whole_day(board, locate):
+    ids = _ids(clien_daily_scraper.scrape_clien_posts_for_date(TARGET, workers=1, locate=locate))
+    assert ids == board.ids_on(TARGET)
+
+
+@pytest.mark.parametrize("locate", [False, True])
+@pytest.mark.parametrize("window", [1, 4, 20])
+def test_concurrent_scan_keeps_board_order(board, window, locate):
+    ids = _ids(clien_daily_scraper.scrape_clien_posts_for_date(TARGET, workers=4, window=window, locate=locate))
+    assert ids == board.ids_on(TARGET)
+
+
+def test_shifting_board_repeats_posts_across_pages(monkeypatch):
+    board = ShiftingBoard(TODAY, today_posts=12, target_posts=23, older_posts=10)
+    monkeypatch.setattr(clien_daily_scraper, "fetch_list_page", board.fetch)
+
+    # 중복 제거 전 페이지 순회에서는 밀려 내려온 게시물이 다시 나옴
+    ids = _ids(clien_daily_scraper._iter_pages_serially(TARGET))
+    assert len(ids) > len(set(ids))
+
+
+def test_serial_scan_on_shifting_board_collects_each_post_once(monkeypatch):
+    board = ShiftingBoard(TODAY, today_posts=12, target_posts=23, older_posts=10)
+    monkeypatch.setattr(clien_daily_scraper, "fetch_list_page", board.fetch)
+
+    ids = _ids(clien_daily_scraper.scrape_clien_posts_for_date(TARGET, workers=1, locate=False))
+    assert ids == board.ids_on(TARGET)
+
+
+@pytest.mark.parametrize("locate", [False, True])
+def test_concurrent_scan_on_shifting_board_has_no_duplicates(monkeypatch, locate):
+    board = ShiftingBoard(TODAY, today_posts=12, target_posts=23, older_posts=10)
+    monkeypatch.setattr(clien_daily_scraper, "fetch_list_page", board.fetch)
+
+    posts = clien_daily_scraper.scrape_clien_posts_for_date(TARGET, workers=4, locate=locate)
+    ids = _ids(posts)
+    assert len(ids) == len(set(ids))
+    assert set(ids) == set(board.ids_on(TARGET))
+    assert all(post.posted_at.date() == TARGET for post in posts)
+
+
+
+def test_range_scan_has_no_duplicates(monkeypatch):
+    board = ShiftingBoard(TODAY, today_posts=12, target_posts=23, older_posts=10)
+    monkeypatch.setattr(clien_daily_scraper, "fetch_list_page", board.fetch)
+
+    buckets = clien_daily_scraper.scrape_clien_posts_for_range(TARGET, TODAY, workers=4, locate=False)
+    ids = _ids(post for posts in buckets.values() for post in posts)
+    assert len(ids) == len(set(ids))
+    assert _ids(buckets[TARGET]) == board.ids_on(TARGET)
+
+def test_list_page_refetch_sees_new_posts_with_response_cache(tmp_path, monkeypatch):
+    board = ShiftingBoard(TODAY, today_posts=3, target_posts=3, older_posts=3, shift=False)
+    monkeypatch.setattr(clien_http, "http_request", board.http_request)
+    cache = ResponseCache(tmp_path)
+    set_response_cache(cache)
+    try:
+        first = clien_stream.fetch_list_page(0)
+        new_post = board.post_new()
+        # 위치로 요청하는 목록 페이지는 응답 캐시가 켜져 있어도 캐시된 이전 응답을 돌려주지 않음
+        second = clien_stream.fetch_list_page(0)
+    finally:
+        set_response_cache(None)
+        cache.close()
+
+    first_ids = _ids(post for _, post in first)
+    assert first_ids == [1000, 999, 998, 997, 996]
+    assert _ids(post for _, post in second) == [new_post.post_id] + first_ids[:-1]
+    assert board.requests == [0, 0]
+
+
+
+def test_async_engine_scans_located_pages(monkeypatch):
+    board = ShiftingBoard(TODAY, today_posts=12, target_posts=23, older_posts=10)
+    monkeypatch.setattr(clien_daily_scraper, "fetch_list_page", board.fetch)
+    monkeypatch.setattr(clien_async, "fetch_list_page", board.fetch)
+
+    ids = _ids(clien_daily_scraper.scrape_clien_posts_for_date(TARGET, workers=4, engine="async"))
+    assert len(ids) == len(set(ids))
+    assert set(ids) == set(board.ids_on(TARGET))
+
+
+def test_async_iterator_yields_posts_before_the_scan_finishes(monkeypatch):
+    board = ShiftingBoard(TODAY, 0, 40, 10, shift=False)
+    first_post_seen = threading.Event()
+
+    def fetch(page_num, *args, **kwargs):
+        # 첫 페이지 뒤의 페이지는 첫 게시물을 받아 간 뒤에야 응답
+        if page_num > 0:
+            assert first_post_seen.wait(5)
+        return board.fetch(page_num)
+
+    monkeypatch.setattr(clien_async, "fetch_list_page", fetch)
+    posts = clien_async.iter_posts_for_date(TARGET, concurrency=2, window=2)
+    first = next(posts)
+    first_post_seen.set()
+
+    assert [first.post_id] + _ids(posts) == board.ids_on(TARGET)
+
+
+def test_closing_async_iterator_early_stops_the_scan(monkeypatch):
+    board = ShiftingBoard(TODAY, 0, 200, 10, shift=False)
+
+    def fetch(page_num, *args, **kwargs):
+        time.sleep(0.01)
+        return board.fetch(page_num)
+
+    monkeypatch.setattr(clien_async, "fetch_list_page", fetch)
+    posts = clien_async.iter_posts_for_date(TARGET, concurrency=2, window=2)
+    assert _ids(itertools.islice(posts, 3)) == board.ids_on(TARGET)[:3]
+    posts.close()
+
+    # 그만 읽으면 남은 페이지 작업이 취소되어 새 페이지를 요청하지 않음
+    requested = len(board.requests)
+    time.sleep(0.05)
+    assert len(board.requests) == requested < 40
+
+
+def test_async_iterator_raises_page_errors(monkeypatch):
+    board = ShiftingBoard(TODAY, 0, 40, 10, shift=False)
+
+    def fetch(page_num, *args, **kwargs):
+        if page_num == 2:
+            raise RuntimeError("page 2 failed")
+        return board.fetch(page_num)
+
+    monkeypatch.setattr(clien_async, "fetch_list_page", fetch)
+    with pytest.raises(RuntimeError, match="page 2 failed"):
+        list(clien_async.iter_posts_for_date(TARGET, concurrency=2, window=2))
+
+
+def test_daily_scan_yields_posts_before_later_pages_are_requested(board):
+    posts = clien_daily_scraper.iter_clien_posts_for_date(TARGET, workers=1, locate=False)
+    next(posts)
+    # 첫 대상일 게시물은 그 게시물이 있는 페이지까지만 받은 상태에서 넘어옴
+    assert board.requests == list(range(12 // PAGE_SIZE + 1))
+    posts.close()
+
+
+def test_csv_rows_reach_disk_while_posts_stream(board, tmp_path):
+    csv_path = tmp_path / "posts.csv"
+    posts = clien_daily_scraper.write_posts_to_csv(
+        clien_daily_scraper.iter_clien_posts_for_date(TARGET, workers=1, locate=False), csv_path
+    )
+    first = next(posts)
+
+    lines = csv_path.read_text(encoding="utf-8-sig").splitlines()
+    assert lines[0] == ",".join(clien_daily_scraper.CSV_FIELDNAMES)
+    assert lines[1].endswith(first.url)
+    assert len(lines) == 2
+    posts.close()
+    assert [post.url for post in read_posts_csv(csv_path, TARGET)] == [first.url]
+
+def test_concurrent_scan_stops_requesting_past_older_posts(board):
+    clien_daily_scraper.scrape_clien_posts_for_date(TARGET, workers=4, window=4, locate=False)
+
+    # 오래된 게시물이 처음 나온 페이지 뒤로는 미리 요청한 window 만큼만 받음
+    stop_page = (12 + 23) // PAGE_SIZE
+    assert max(board.requests) <= stop_page + 4
+    assert sorted(board.requests) == list(range(max(board.requests) + 1))
+
+
+@pytest.mark.parametrize(
+    "today_posts, target_posts, older_posts",
+    [(0, 5, 5), (5, 5, 5), (12, 23, 10), (200, 60, 100), (995, 100, 500)],
+)
+def test_locate_target_date_pages(monkeypatch, today_posts, target_posts, older_posts):
+    board = ShiftingBoard(TODAY, today_posts, target_posts, older_posts, shift=False)
+    monkeypatch.setattr(clien_daily_scraper, "fetch_list_page", board.fetch)
+
+    located = clien_daily_scraper.locate_target_date_pages(TARGET)
+
+    # 대상일 첫 게시물이 있는 페이지와 그보다 오래된 첫 게시물이 있는 페이지
+    first_page, last_page = today_posts // PAGE_SIZE, (today_posts + target_posts) // PAGE_SIZE
+    assert located == (first_page, last_page)
+    # 갤로핑/이진 탐색이므로 요청 수는 페이지 수의 로그에 비례
+    assert len(board.requests) <= 2 * (2 * math.ceil(math.log2(last_page + 1)) + 1)
+    assert len(set(board.requests)) == len(board.requests)
+
+
+@pytest.mark.parametrize("workers", [1, 4])
+@pytest.mark.parametrize(
+    "today_posts, target_posts, older_posts",
+    [(12, 23, 10), (200, 60, 100), (40, 100, 50)],
+)
+def test_located_scan_on_shifting_board_collects_the_whole_day(
+    monkeypatch, workers, today_posts, target_posts, older_posts
+):
+    # 탐색 뒤에도 새 글이 올라와 게시물이 밀리지만 대상일 게시물은 빠짐없이 한 번씩 나와야 함
+    board = ShiftingBoard(TODAY, today_posts, target_posts, older_posts)
+    monkeypatch.setattr(clien_daily_scraper, "fetch_list_page", board.fetch)
+
+    ids = _ids(clien_daily_scraper.scrape_clien_posts_for_date(TARGET, workers=workers))
+
+    assert sorted(ids) == sorted(board.ids_on(TARGET))
+
+
+def test_located_scan_collects_the_whole_day(monkeypatch):
+    board = ShiftingBoard(TODAY, today_posts=200, target_posts=60, older_posts=100, shift=False)
+    monkeypatch.setattr(clien_daily_scraper, "fetch_list_page", board.fetch)
+
+    ids = _ids(clien_daily_scraper.scrape_clien_posts_for_date(TARGET, workers=4))
+
+    assert ids == board.ids_on(TARGET)
+    # 앞쪽 오늘 페이지(0~39)는 탐색 요청 외에는 받지 않음
+    assert len(board.requests) < (200 + 60) // PAGE_SIZE
@@ -0,0 +1,93 @@
+from datetime import date, datetime
+
+import pytest
+
+import clien_daily_scraper
+import clien_issue
+import clien_today_scraper
+import clien_yesterday_scraper
+from clien_content_store import PostContentStore
+from clien_daily_scraper import daily_posts_csv_path, publish_daily_report_from_csv, save_posts_to_csv
+from clien_fake_telegram import FakeTelegramServer
+from clien_http import configure_http_client
+from clien_issue import POST_CONTENT_DB_NAME
+from clien_summary import get_summary_cache, set_summary_backend
+from fake_board import make_post
+
+DAY = date(2025, 10, 27)
+TITLES = ["이재명 대통령 발언", "이재명이 말한 것", "날씨가 좋네요", "이재명은 오늘", "점심 메뉴"]
+
+
+@pytest.fixture
+def publish_env(tmp_path, monkeypatch):
+    server = FakeTelegramServer().start()
+    monkeypatch.setenv("TELEGRAM_API_BASE", server.base_url)
+    monkeypatch.setattr(clien_daily_scraper, "TELEGRAM_BOT_TOKEN", "123:TEST")
+    monkeypatch.setattr(clien_daily_scraper, "TELEGRAM_CHAT_ID", "42")
+
+    def no_network(url, *args, **kwargs):
+        raise AssertionError(f"unexpected fetch: {url}")
+
+    monkeypatch.setattr(clien_issue, "fetch_post_content", no_network)
+    # 로컬 가짜 서버이므로 요청 간격 제한 없이 보냄
+    configure_http_client(max_requests_per_second=None)
+    set_summary_backend("fake")
+
+    posts = [
+        make_post(1000 - index, datetime(2025, 10, 27, 9, 50 - index), title)
+        for index, title in enumerate(TITLES)
+    ]
+    # 이슈 게시물 본문은 저장소에서 읽도록 미리 넣어 둠
+    store = PostContentStore(tmp_path / POST_CONTENT_DB_NAME)
+    for post in posts:
+        store.put(post.post_id, post.url, f"본문 {post.post_id}")
+    store.close()
+
+    yield server, posts
+    set_summary_backend("gemini")
+    configure_http_client()
+    server.stop()
+
+
+def _sent_files(server):
+    return sum(request.files for request in server.requests)
+
+
+@pytest.mark.parametrize(
+    "publish, name, prefix",
+    [
+        (clien_today_scraper.publish_today_report, "today", "TODAY"),
+        (clien_yesterday_scraper.publish_yesterday_report, "yesterday", "YESTERDAY"),
+    ],
+)
+def test_today_and_yesterday_reports_use_the_shared_outputs(publish_env, tmp_path, capsys, publish, name, prefix):
+    server, posts = publish_env
+
+    publish(posts, tmp_path, "251027")
+
+    issue_text = (tmp_path / f"{prefix}_ISSUE_251027.txt").read_text(encoding="utf-8")
+    assert issue_text.startswith("Top keyword: 이재명")
+    assert [line for line in issue_text.splitlines() if line.startswith("Title: ")] == [
+        f"Title: {title}" for title in TITLES if title.startswith("이재명")
+    ]
+    assert (tmp_path / f"{prefix}_SUMMARY_251027.txt").read_text(encoding="utf-8").startswith("3 posts")
+    assert (tmp_path / f"clien_{name}_posts_251027.csv").exists()
+    assert (tmp_path / f"clien_{name}_title_frequencies_251027.csv").exists()
+    assert f"Sent {prefix} summary text file to Telegram successfully." in capsys.readouterr().out
+    # 이슈/요약/빈도 CSV를 한 번에 보냄(워드 클라우드는 wordcloud가 설치된 경우에만 추가)
+    assert _sent_files(server) >= 3
+    assert get_summary_cache() is None
+
+
+def test_daily_report_from_csv_uses_the_shared_outputs(publish_env, tmp_path, capsys):
+    server, posts = publish_env
+    save_posts_to_csv(posts, daily_posts_csv_path(DAY, tmp_path))
+
+    assert publish_daily_report_from_csv(DAY, tmp_path) == len(posts)
+
+    issue_text = (tmp_path / "CLIEAN_ISSUE_251027.txt").read_text(encoding="utf-8")
+    assert issue_text.count("[Post ") == 3
+    assert (tmp_path / "CLIEAN_SUMMARY_251027.txt").exists()
+    assert (tmp_path / "clien_title_frequencies_251027.csv").exists()
+    assert "Sent 251027 summary text file to Telegram successfully." in capsys.readouterr().out
+    assert _sent_files(server) >= 3
@@ -0,0 +1,66 @@
+from datetime import date, datetime, timedelta
+
+import pytest
+
+import clien_stream
+import clien_today_scraper
+import clien_yesterday_scraper
+from fake_board import ShiftingBoard
+
+
+@pytest.fixture
+def board(monkeypatch):
+    board = ShiftingBoard(date.today(), today_posts=12, target_posts=13, older_posts=10)
+    monkeypatch.setattr(clien_stream, "fetch_list_page", board.fetch)
+    return board
+
+
+def test_iter_clien_posts_stops_at_older_posts(board):
+    oldest = date.today() - timedelta(days=1)
+    pairs = list(clien_stream.iter_clien_posts(oldest_date=oldest))
+    ids = [post.post_id for _, post in pairs]
+    assert len(ids) == len(set(ids))
+    assert all(posted_at.date() >= oldest for posted_at, _ in pairs)
+    assert set(board.ids_on(oldest)) <= set(ids)
+
+
+def test_today_scraper_collects_today_posts(board):
+    today_ids = board.ids_on(date.today())
+    ids = [post.post_id for post in clien_today_scraper.scrape_clien_today_posts()]
+    assert len(ids) == len(set(ids))
+    assert set(today_ids) <= set(ids)
+    assert all(post_id in today_ids or post_id > 1000 for post_id in ids)
+
+
+def test_today_scraper_stops_at_seen_posts(board):
+    # 증분 수집: 이미 받은 게시물(ID 995 이하)에 닿으면 중단
+    ids = [
+        post.post_id
+        for post in clien_today_scraper.scrape_clien_today_posts(
+            seen_post_id=995, refresh_since=datetime.now() + timedelta(days=1)
+        )
+    ]
+    assert ids and min(ids) == 996
+    assert board.requests == [0, 1]
+
+
+def test_yesterday_scraper_collects_only_yesterday(board):
+    yesterday = date.today() - timedelta(days=1)
+    posts = clien_yesterday_scraper.scrape_clien_yesterday_posts()
+    assert [post.post_id for post in posts] == board.ids_on(yesterday)
+
+
+def test_one_traversal_routes_today_and_yesterday(board):
+    today = date.today()
+    yesterday = today - timedelta(days=1)
+    today_ids = board.ids_on(today)
+    today_posts, yesterday_posts = [], []
+
+    counts = clien_stream.route_posts_by_date(
+        clien_stream.iter_clien_posts(oldest_date=yesterday),
+        {today: today_posts.append, yesterday: yesterday_posts.append},
+    )
+
+    assert counts == {today: len(today_posts), yesterday: len(yesterday_posts)}
+    assert [post.post_id for post in yesterday_posts] == board.ids_on(yesterday)
+    assert set(today_ids) <= {post.post_id for post in today_posts}
@@ -0,0 +1,143 @@
+from datetime import datetime
+
+import pytest
+
+from clien_issue import format_issue_entry
+from clien_summary import (
+    GEMINI_SUMMARY_PROMPT,
+    ISSUE_ENTRY_SEPARATOR,
+    PipelinedSummarizer,
+    StubSummaryModel,
+    estimate_tokens,
+    map_reduce_summarize,
+    pack_entries,
+    split_issue_text,
+)
+from fake_board import make_post
+
+HEADER = "Top keyword: 테스트"
+
+
+def make_entries(count: int, content_chars: int):
+    posted_at = datetime(2025, 10, 27, 9, 0)
+    return [
+        format_issue_entry(index, make_post(1000 + index, posted_at), "가" * content_chars)
+        for index in range(1, count + 1)
+    ]
+
+
+def make_issue_text(count: int, content_chars: int) -> str:
+    return f"{HEADER}\n\n{ISSUE_ENTRY_SEPARATOR.join(make_entries(count, content_chars))}"
+
+
+def assert_within_budget(model: StubSummaryModel, max_tokens: int) -> None:
+    assert model.calls
+    for _, _, prompt in model.calls:
+        assert estimate_tokens(prompt) <= max_tokens
+
+
+def test_split_issue_text_round_trips_entries():
+    entries = make_entries(3, 20)
+    header, split = split_issue_text(f"{HEADER}\n\n{ISSUE_ENTRY_SEPARATOR.join(entries)}")
+    assert header == HEADER
+    assert split == entries
+
+
+def test_pack_entries_keeps_order_within_budget():
+    entries = make_entries(30, 300)
+    chunks = pack_entries(entries, 1000)
+
+    assert len(chunks) > 1
+    assert [entry for chunk in chunks for entry in chunk] == entries
+    for chunk in chunks:
+        assert estimate_tokens(ISSUE_ENTRY_SEPARATOR.join(chunk)) <= 1000
+
+
+def test_pack_entries_truncates_oversized_entry():
+    entries = make_entries(3, 2000)
+    chunks = pack_entries(entries, 500)
+
+    assert len(chunks) == 3
+    for chunk, entry in zip(chunks, entries):
+        assert len(chunk) == 1
+        assert estimate_tokens(chunk[0]) <= 500
+        assert chunk[0].startswith(entry.split("\n", 1)[0])
+
+
+def test_small_issue_is_summarized_in_one_call():
+    model = StubSummaryModel()
+    text = make_issue_text(3, 50)
+
+    summary = map_reduce_summarize(text, model)
+
+    assert len(model.calls) == 1
+    assert model.calls[0][2] == f"{GEMINI_SUMMARY_PROMPT}{text}"
+    assert summary.startswith("3 posts [Post 1-3] ")
+
+
+@pytest.mark.parametrize("per_post", [False, True])
+@pytest.mark.parametrize(
+    "count, content_chars, max_tokens",
+    [
+        (40, 800, 3000),
+        # 게시물 본문만으로는 예산 안이지만 지시문을 더하면 넘는 경우
+        (2, 1950, 2000),
+        # 게시물 하나가 예산을 넘어 잘라내는 경우
+        (12, 5000, 2000),
+        # 부분 요약도 여러 단계에 걸쳐 합쳐야 하는 경우
+        (150, 300, 600),
+    ],
+)
+def test_map_reduce_prompts_fit_budget_and_cover_all_posts(per_post, count, content_chars, max_tokens):
+    model = StubSummaryModel()
+
+    summary = map_reduce_summarize(make_issue_text(count, content_chars), model, max_tokens, per_post=per_post)
+
+    assert len(model.calls) > 1
+    assert_within_budget(model, max_tokens)
+    assert summary.startswith(f"{count} posts [Post 1-{count}] ")
+
+
+@pytest.mark.parametrize("per_post", [False, True])
+@pytest.mark.parametrize(
+    "count, content_chars, max_tokens",
+    [
+        (3, 50, 12000),
+        (40, 800, 3000),
+        (2, 1950, 2000),
+        (150, 300, 600),
+    ],
+)
+def test_pipelined_prompts_fit_budget_and_cover_all_posts(per_post, count, content_chars, max_tokens):
+    model = StubSummaryModel(delay=0.005)
+    summarizer = PipelinedSummarizer(model, HEADER, max_tokens=max_tokens, per_post=per_post)
+    for entry in make_entries(count, content_chars):
+        summarizer.add(entry)
+
+    summary, error = summarizer.close()
+
+    assert error is None
+    assert_within_budget(model, max_tokens)
+    assert summary.startswith(f"{count} posts [Post 1-{count}] ")
+
+
+def test_pipelined_single_chunk_matches_single_mode_prompt():
+    entries = make_entries(3, 50)
+    model = StubSummaryModel()
+    summarizer = PipelinedSummarizer(model, HEADER)
+    for entry in entries:
+        summarizer.add(entry)
+
+    summary, error = summarizer.close()
+
+    assert error is None
+    assert [prompt for _, _, prompt in model.calls] == [
+        f"{GEMINI_SUMMARY_PROMPT}{HEADER}\n\n{ISSUE_ENTRY_SEPARATOR.join(entries)}"
+    ]
+    assert summary.startswith("3 posts [Post 1-3] ")
+
+
+def test_pipelined_without_entries_returns_nothing():
+    model = StubSummaryModel()
+    assert PipelinedSummarizer(model, HEADER).close() == (None, None)
+    assert model.calls == []
@@ -0,0 +1,173 @@
+from datetime import datetime
+
+from clien_issue import format_issue_entry
+import clien_summary
+from clien_summary import (
+    GEMINI_POST_PROMPT,
+    GEMINI_SUMMARY_PROMPT,
+    ISSUE_ENTRY_SEPARATOR,
+    PipelinedSummarizer,
+    StubSummaryModel,
+    cached_summary_model,
+    map_reduce_summarize,
+    set_summary_backend,
+    set_summary_cache,
+    summarize_issue_text,
+)
+from clien_summary_cache import SummaryCache
+from fake_board import make_post
+
+HEADER = "Top keyword: 테스트"
+
+
+def test_counts_hits_and_misses(tmp_path):
+    cache = SummaryCache(tmp_path / "cache.sqlite3")
+    key = cache.make_key("fake", "prompt")
+
+    assert cache.get(key) is None
+    cache.put(key, "fake", "summary")
+    assert cache.get(key) == "summary"
+    assert cache.get(cache.make_key("other", "prompt")) is None
+
+    assert (cache.hits, cache.misses) == (1, 2)
+    cache.close()
+
+
+def test_keeps_entries_across_instances(tmp_path):
+    cache = SummaryCache(tmp_path / "cache.sqlite3")
+    cache.put(cache.make_key("fake", "prompt"), "fake", "summary")
+    cache.close()
+
+    reopened = SummaryCache(tmp_path / "cache.sqlite3")
+    assert reopened.get(reopened.make_key("fake", "prompt")) == "summary"
+    assert (reopened.hits, reopened.misses) == (1, 0)
+    reopened.close()
+
+
+def test_evicts_least_recently_used_over_max_bytes(tmp_path):
+    cache = SummaryCache(tmp_path / "cache.sqlite3", max_bytes=250)
+    keys = [cache.make_key("fake", f"prompt {index}") for index in range(3)]
+    cache.put(keys[0], "fake", "a" * 100)
+    cache.put(keys[1], "fake", "b" * 100)
+    # 먼저 저장한 항목을 다시 읽으면 가장 오래 사용되지 않은 항목은 두 번째가 됨
+    assert cache.get(keys[0]) == "a" * 100
+    cache.put(keys[2], "fake", "c" * 100)
+
+    assert cache.count() == 2
+    assert cache.get(keys[1]) is None
+    assert cache.get(keys[0]) == "a" * 100
+    assert cache.get(keys[2]) == "c" * 100
+    cache.close()
+
+
+def test_cached_model_does_not_store_empty_summary(tmp_path):
+    cache = SummaryCache(tmp_path / "cache.sqlite3")
+    calls = []
+
+    def empty_model(prompt: str) -> str:
+        calls.append(prompt)
+        return " "
+
+    model = cached_summary_model(empty_model, "fake", cache)
+    model("prompt")
+    model("prompt")
+
+    assert len(calls) == 2
+    assert cache.count() == 0
+    cache.close()
+
+
+def make_entries(count: int, content_chars: int):
+    posted_at = datetime(2025, 10, 27, 9, 0)
+    return [
+        format_issue_entry(index, make_post(1000 + index, posted_at), "가" * content_chars)
+        for index in range(1, count + 1)
+    ]
+
+
+def test_cold_cache_summarizes_issue_within_budget_in_one_call(tmp_path, monkeypatch):
+    text = f"{HEADER}\n\n{ISSUE_ENTRY_SEPARATOR.join(make_entries(6, 50))}"
+    calls = []
+
+    def model(prompt: str) -> str:
+        calls.append(prompt)
+        return "summary"
+
+    cache = SummaryCache(tmp_path / "cache.sqlite3")
+    monkeypatch.setattr(clien_summary, "StubSummaryModel", lambda: model)
+    set_summary_backend("fake")
+    set_summary_cache(cache)
+    try:
+        assert summarize_issue_text(text, "") == ("summary", None)
+        assert summarize_issue_text(text, "") == ("summary", None)
+    finally:
+        set_summary_backend("gemini")
+        set_summary_cache(None)
+        cache.close()
+
+    # 예산 안의 이슈는 게시물 단위로 나누지 않고 한 번에 요약한 결과를 캐시함
+    assert calls == [f"{GEMINI_SUMMARY_PROMPT}{text}"]
+
+
+def test_pipelined_cold_cache_within_budget_makes_one_call(tmp_path):
+    cache = SummaryCache(tmp_path / "cache.sqlite3")
+    stub = StubSummaryModel()
+    summarizer = PipelinedSummarizer(cached_summary_model(stub, "fake", cache), HEADER, per_post=True)
+    for entry in make_entries(6, 50):
+        summarizer.add(entry)
+
+    summary, error = summarizer.close()
+    cache.close()
+
+    assert error is None
+    assert [prompt for _, _, prompt in stub.calls] == [
+        f"{GEMINI_SUMMARY_PROMPT}{HEADER}\n\n{ISSUE_ENTRY_SEPARATOR.join(make_entries(6, 50))}"
+    ]
+    assert summary.startswith("6 posts [Post 1-6] ")
+
+
+def test_per_post_summaries_over_budget_are_reused(tmp_path):
+    text = f"{HEADER}\n\n{ISSUE_ENTRY_SEPARATOR.join(make_entries(8, 800))}"
+    cache = SummaryCache(tmp_path / "cache.sqlite3")
+
+    first = StubSummaryModel()
+    map_reduce_summarize(text, cached_summary_model(first, "fake", cache), 2000, per_post=True)
+    post_calls = [prompt for _, _, prompt in first.calls if prompt.startswith(GEMINI_POST_PROMPT)]
+    assert len(post_calls) == 8
+
+    # 게시물 하나를 더해도 이미 요약한 게시물은 다시 요약하지 않음
+    text = f"{HEADER}\n\n{ISSUE_ENTRY_SEPARATOR.join(make_entries(9, 800))}"
+    second = StubSummaryModel()
+    map_reduce_summarize(text, cached_summary_model(second, "fake", cache), 2000, per_post=True)
+    post_calls = [prompt for _, _, prompt in second.calls if prompt.startswith(GEMINI_POST_PROMPT)]
+    assert len(post_calls) == 1
+    cache.close()
+
+
+def _pipelined_run(db_path, entries):
+    cache = SummaryCache(db_path)
+    stub = StubSummaryModel(delay=0.05)
+    summarizer = PipelinedSummarizer(
+        cached_summary_model(stub, "fake", cache), HEADER, max_tokens=2000, workers=2, per_post=True
+    )
+    for entry in entries:
+        summarizer.add(entry)
+    summary, error = summarizer.close()
+    # 스크래퍼와 같이 요약이 끝나자마자 캐시를 닫음
+    cache.close()
+    return stub, summary, error
+
+
+def test_pipelined_per_post_summaries_are_all_cached(tmp_path):
+    entries = make_entries(6, 800)
+
+    first, first_summary, error = _pipelined_run(tmp_path / "cache.sqlite3", entries)
+    assert error is None
+    post_calls = [prompt for _, _, prompt in first.calls if prompt.startswith(GEMINI_POST_PROMPT)]
+    assert len(post_calls) == len(entries)
+
+    # 바뀐 게시물이 없으면 다음 실행에서는 모델을 다시 부르지 않음
+    second, second_summary, error = _pipelined_run(tmp_path / "cache.sqlite3", entries)
+    assert error is None
+    assert second.calls == []
+    assert second_summary == first_summary
@@ -0,0 +1,166 @@
+import time
+
+import pytest
+
+from clien_fake_telegram import FakeTelegramServer
+from clien_http import configure_http_client
+from clien_telegram import TelegramDelivery, TelegramOutbox, TelegramResult
+
+TOKEN = "123:TEST"
+CHAT_ID = "42"
+
+
+@pytest.fixture
+def fake_telegram(monkeypatch):
+    servers = []
+
+    def start(**kwargs) -> FakeTelegramServer:
+        server = FakeTelegramServer(**kwargs).start()
+        servers.append(server)
+        monkeypatch.setenv("TELEGRAM_API_BASE", server.base_url)
+        return server
+
+    # 로컬 가짜 서버이므로 요청 간격 제한 없이 보냄
+    configure_http_client(max_requests_per_second=None)
+    yield start
+    for server in servers:
+        server.stop()
+    configure_http_client()
+
+
+@pytest.fixture
+def files(tmp_path):
+    paths = []
+    for name in ("issue.txt", "summary.txt", "frequencies.csv"):
+        path = tmp_path / name
+        path.write_text(name, encoding="utf-8")
+        paths.append(path)
+    photo = tmp_path / "wordcloud.png"
+    photo.write_bytes(b"\x89PNG")
+    return paths, photo
+
+
+def _methods(server):
+    return sorted(request.method for request in server.requests)
+
+
+def test_documents_are_sent_as_one_album(fake_telegram, files):
+    server = fake_telegram()
+    documents, photo = files
+    delivery = TelegramDelivery(TOKEN, CHAT_ID)
+    for path in documents:
+        delivery.send_document(path, caption=path.name, success_message=f"sent {path.name}")
+    delivery.send_photo(photo, caption="cloud", success_message="sent photo")
+
+    results = delivery.close()
+
+    assert results == [(True, "sent photo")] + [(True, f"sent {path.name}") for path in documents]
+    assert _methods(server) == ["sendMediaGroup", "sendPhoto"]
+    album = next(request for request in server.requests if request.method == "sendMediaGroup")
+    assert album.files == len(documents)
+
+
+def test_single_document_uses_send_document(fake_telegram, files):
+    server = fake_telegram()
+    documents, _ = files
+    delivery = TelegramDelivery(TOKEN, CHAT_ID)
+    delivery.send_document(documents[0], caption=None, success_message="sent")
+
+    assert delivery.close() == [(True, "sent")]
+    assert _methods(server) == ["sendDocument"]
+
+
+def test_rejected_album_falls_back_to_single_documents(fake_telegram, files):
+    server = fake_telegram(fail_methods=["sendMediaGroup"])
+    documents, _ = files
+    delivery = TelegramDelivery(TOKEN, CHAT_ID)
+    for path in documents:
+        delivery.send_document(path, caption=None, success_message=f"sent {path.name}")
+
+    assert delivery.close() == [(True, f"sent {path.name}") for path in documents]
+    assert _methods(server) == ["sendDocument"] * len(documents) + ["sendMediaGroup"]
+
+
+def test_throttled_album_is_retried_after_retry_after(fake_telegram, files, tmp_path):
+    server = fake_telegram(throttle=1, retry_after=1)
+    documents, _ = files
+    outbox = TelegramOutbox(tmp_path / "outbox.sqlite3")
+    delivery = TelegramDelivery(TOKEN, CHAT_ID, outbox=outbox, outbox_wait=10)
+    for path in documents[:2]:
+        delivery.send_document(path, caption=None, success_message=f"sent {path.name}")
+
+    results = delivery.close()
+
+    # 429를 받은 묶음은 파일마다 대기열에 들어갔다가 retry_after 이후 한 번씩 전송됨
+    assert [sent for sent, _ in results] == [False, False, True, True]
+    assert outbox.count() == 0
+    album, *retries = server.requests
+    assert album.method == "sendMediaGroup"
+    assert [request.method for request in retries] == ["sendDocument", "sendDocument"]
+    assert min(request.received_at for request in retries) - album.received_at >= 1
+    outbox.close()
+
+
+def test_non_retryable_failure_is_not_queued(fake_telegram, files, tmp_path):
+    fake_telegram(fail_methods=["sendPhoto"])
+    _, photo = files
+    outbox = TelegramOutbox(tmp_path / "outbox.sqlite3")
+    delivery = TelegramDelivery(TOKEN, CHAT_ID, outbox=outbox, outbox_wait=0)
+    delivery.send_photo(photo, caption=None, success_message="sent photo")
+
+    [(sent, message)] = delivery.close()
+
+    assert not sent and "400" in message
+    assert outbox.count() == 0
+    outbox.close()
+
+
+def _queue(outbox: TelegramOutbox, path) -> None:
+    outbox.add("sendDocument", path, None, f"sent {path.name}", TelegramResult(False, "timeout", retryable=True))
+    # 재시도 시각을 지금으로 당김
+    for entry in outbox.entries():
+        outbox._reschedule(entry.entry_id, entry.attempts, time.time() - 1, entry.last_error)
+
+
+def test_outbox_drain_sends_due_entries(fake_telegram, files, tmp_path):
+    server = fake_telegram()
+    documents, _ = files
+    outbox = TelegramOutbox(tmp_path / "outbox.sqlite3")
+    _queue(outbox, documents[0])
+
+    assert outbox.drain(TOKEN, CHAT_ID) == [(True, f"sent {documents[0].name}")]
+    assert outbox.count() == 0
+    assert _methods(server) == ["sendDocument"]
+    outbox.close()
+
+
+def test_outbox_claim_prevents_double_send(fake_telegram, files, tmp_path):
+    server = fake_telegram()
+    documents, _ = files
+    first = TelegramOutbox(tmp_path / "outbox.sqlite3")
+    second = TelegramOutbox(tmp_path / "outbox.sqlite3")
+    _queue(first, documents[0])
+
+    # 다른 프로세스가 먼저 꺼낸 항목은 건너뜀
+    [entry] = first.entries()
+    assert first._claim(entry, time.time())
+    assert second.drain_once(TOKEN, CHAT_ID) == []
+    assert not second._claim(entry, time.time())
+    assert server.requests == []
+    assert first.count() == 1
+    first.close()
+    second.close()
+
+
+def test_outbox_keeps_entries_without_a_bot_token(fake_telegram, files, tmp_path):
+    server = fake_telegram()
+    documents, _ = files
+    outbox = TelegramOutbox(tmp_path / "outbox.sqlite3")
+    _queue(outbox, documents[0])
+
+    [(sent, _)] = outbox.drain("YOUR_TELEGRAM_BOT_TOKEN_HERE", CHAT_ID)
+
+    assert not sent
+    assert outbox.count() == 1
+    assert server.requests == []
+    outbox.close()
@@ -0,0 +1,81 @@
+import pytest
+
+from clien_tokens import normalize_token
+
+
+@pytest.mark.parametrize(
+    "token, expected",
+    [
+        # 받침에 맞는 조사만 떼어 같은 단어로 집계
+        ("이재명이", "이재명"),
+        ("이재명은", "이재명"),
+        ("이재명을", "이재명"),
+        ("이재명", "이재명"),
+        ("대통령과", "대통령"),
+        ("부산으로", "부산"),
+        ("학교로", "학교"),
+        ("정부가", "정부"),
+        ("정부는", "정부"),
+        # 받침 ㄹ 뒤의 "로"
+        ("서울로", "서울"),
+        ("서울에서", "서울"),
+        # 조사가 겹쳐 붙은 경우
+        ("서울에서도", "서울"),
+        ("서울이", "서울"),
+        ("서울", "서울"),
+        # 받침과 조사가 맞지 않으면 그대로 둠
+        ("전문가", "전문가"),
+        # 남는 음절이 두 개보다 적으면 그대로 둠
+        ("사과", "사과"),
+        ("나이", "나이"),
+        # 조사처럼 끝나지만 그 자체로 단어인 경우
+        ("민주주의", "민주주의"),
+        ("한반도", "한반도"),
+        ("고양이", "고양이"),
+        # 조사처럼 끝나는 흔한 명사 끝말
+        ("국무회의", "국무회의"),
+        ("선거제도", "선거제도"),
+        ("떡볶이", "떡볶이"),
+        ("조사결과", "조사결과"),
+        ("물놀이", "물놀이"),
+        # 영문/숫자 뒤에서는 받침을 알 수 없으므로 그대로 떼어냄
+        ("ai는", "ai"),
+        ("gpt", "gpt"),
+        ("", ""),
+    ],
+)
+def test_normalize_token(token, expected):
+    assert normalize_token(token) == expected
+
+
+@pytest.mark.parametrize(
+    "word, inflected",
+    [
+        ("선거제도", "선거제도가"),
+        ("국무회의", "국무회의에서"),
+        ("떡볶이", "떡볶이가"),
+        ("조사결과", "조사결과를"),
+        ("물놀이", "물놀이도"),
+        ("이재명", "이재명에게서는"),
+    ],
+)
+def test_word_and_inflected_form_agree(word, inflected):
+    assert normalize_token(inflected) == normalize_token(word) == word
+
+
+WORDS = ["이재명", "정부", "서울", "학교", "대통령", "선거제도", "국무회의", "떡볶이", "민주주의", "고양이", "고속도로"]
+
+
+def _attach(word: str, after_consonant: str, after_vowel: str) -> str:
+    final = (ord(word[-1]) - 0xAC00) % 28
+    return word + (after_consonant if final else after_vowel)
+
+
+@pytest.mark.parametrize("word", WORDS)
+def test_every_particle_form_agrees_with_the_word(word):
+    forms = [word + suffix for suffix in ("의", "도", "에서", "에게", "까지", "부터", "에서도")]
+    forms += [_attach(word, *pair) for pair in (("이", "가"), ("은", "는"), ("을", "를"), ("과", "와"))]
+    # 받침 ㄹ 뒤에는 "으로" 대신 "로"
+    forms.append(word + "로" if (ord(word[-1]) - 0xAC00) % 28 in (0, 8) else word + "으로")
+    for form in forms:
+        assert normalize_token(form) == normalize_token(word), form